@@ -0,0 +1,216 @@
+""" Benchmarks for datastructures.array.Array.
+    Run from the repository root with `python -m benchmarks.bench_array [count]`.
+"""
+
+import array
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.bench_hashmap import ops_per_second
+from datastructures.array import Array
+from datastructures.arraybackends import MemmapBackend
+from datastructures.sortedarray import SortedArray
+
+
+def bench_construction(count: int) -> None:
+    print(f'Constructing a {count}-item Array (items/sec, best of 3)')
+    ints = list(range(count))
+    sources = {
+        'list[int], int': lambda: Array(ints, int),
+        'list[int], int, off': lambda: Array(ints, int, validation='off'),
+        'ndarray, int': lambda: Array(np.arange(count), int),
+        'ndarray, int, none': lambda: Array(np.arange(count), int, copy='none'),
+        'array.array, float': lambda: Array(array.array('d', ints), float),
+        'list, object, deep': lambda: Array(ints),
+        'list, object, none': lambda: Array(ints, copy='none'),
+    }
+    for name, build in sources.items():
+        print(f'{name:<24}{ops_per_second(build, count):>16,.0f}')
+
+
+def bench_sliding_window(count: int, width: int = 64) -> None:
+    print(f'Sliding a {width}-item window over a {count}-item int Array (windows/sec, best of 3)')
+    numbers = Array(np.arange(count), int)
+    windows = count - width
+
+    def slide() -> None:
+        for start in range(windows):
+            numbers[start:start + width]
+
+    def slide_copies() -> None:
+        for start in range(windows):
+            numbers[start:start + width].copy()
+
+    for name, run in (('view', slide), ('view + copy()', slide_copies)):
+        print(f'{name:<24}{ops_per_second(run, windows):>16,.0f}')
+
+
+def bench_front_operations(count: int) -> None:
+    print(f'Front operations on an int Array ({count} ops, ops/sec, best of 3)')
+
+    def push_front() -> None:
+        numbers = Array(data_type=int)
+        for item in range(count):
+            numbers.append_front(item)
+
+    def queue() -> None:
+        numbers = Array(np.arange(1024), int)
+        for item in range(count):
+            numbers.append(item)
+            numbers.pop_front()
+
+    for name, run in (('append_front', push_front), ('append + pop_front', queue)):
+        print(f'{name:<24}{ops_per_second(run, count):>16,.0f}')
+
+
+def bench_backends(count: int) -> None:
+    print(f'Backends ({count} items, ops/sec, best of 3)')
+    operations = ('get', 'set', 'append', 'iterate')
+    print(f'{"backend":<24}' + ''.join(f'{name:>14}' for name in operations))
+    with tempfile.TemporaryDirectory() as directory:
+        configurations = {
+            'list, object': (object, 'list'),
+            'numpy, object': (object, 'numpy'),
+            'list, int': (int, 'list'),
+            'numpy, int': (int, 'numpy'),
+            'memmap, int': (int, MemmapBackend(os.path.join(directory, 'bench.bin'))),
+        }
+        for name, (data_type, backend) in configurations.items():
+            numbers = Array(list(range(count)), data_type, copy='none', backend=backend)
+
+            def get() -> None:
+                for index in range(count):
+                    numbers[index]
+
+            def set_() -> None:
+                for index in range(count):
+                    numbers[index] = index
+
+            def append() -> None:
+                grown = Array(0, data_type, backend=backend)
+                for index in range(count):
+                    grown.append(index)
+
+            def iterate() -> None:
+                for _ in numbers:
+                    pass
+
+            rates = [ops_per_second(run, count) for run in (get, set_, append, iterate)]
+            print(f'{name:<24}' + ''.join(f'{rate:>14,.0f}' for rate in rates))
+
+
+def bench_open(count: int, reads: int = 1000) -> None:
+    print(f'Attaching to a {count}-item int Array file (seconds)')
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'bench.bin')
+        Array(np.arange(count), int, backend=MemmapBackend(path)).flush()
+        start = time.perf_counter()
+        attached = Array.open(path, int, 'r')
+        opened = time.perf_counter() - start
+        start = time.perf_counter()
+        for index in np.random.default_rng(0).integers(0, count, reads):
+            attached[int(index)]
+        print(f'{"Array.open":<24}{opened:>16.6f}')
+        print(f'{f"{reads} random reads":<24}{time.perf_counter() - start:>16.6f}')
+        start = time.perf_counter()
+        Array(np.fromfile(path, dtype=np.int64, offset=64), int)
+        print(f'{"loading into memory":<24}{time.perf_counter() - start:>16.6f}')
+
+
+def bench_interop(count: int) -> None:
+    print(f'Handing a {count}-item int Array to NumPy (seconds)')
+    numbers = Array(np.arange(count), int)
+    for name, convert in (
+        ('np.asarray', lambda: np.asarray(numbers)),
+        ('memoryview', lambda: memoryview(numbers)),
+        ('np.fromiter (before)', lambda: np.fromiter(numbers, dtype=np.int64, count=count)),
+    ):
+        start = time.perf_counter()
+        convert()
+        print(f'{name:<24}{time.perf_counter() - start:>16.6f}')
+
+
+def bench_numeric_operations(count: int) -> None:
+    print(f'Numeric operations on a {count}-item float Array (seconds)')
+    numbers = Array(np.random.default_rng(0).random(count), float)
+    for name, run in (
+        ('sum() over __iter__', lambda: sum(numbers)),
+        ('Array.sum()', numbers.sum),
+        ('* 2 over __iter__', lambda: Array([item * 2 for item in numbers], float)),
+        ('Array * 2', lambda: numbers * 2),
+        ('filter over __iter__', lambda: Array([item for item in numbers if item > 0.5], float)),
+        ('Array.filter', lambda: numbers.filter(lambda items: items > 0.5)),
+    ):
+        start = time.perf_counter()
+        run()
+        print(f'{name:<24}{time.perf_counter() - start:>16.6f}')
+
+
+def best_of(run, setup, repeats: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeats):
+        argument = setup()
+        start = time.perf_counter()
+        run(argument)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_sorting(count: int) -> None:
+    print(f'Sorting {count} random items (seconds, best of 3)')
+    rng = np.random.default_rng(0)
+    workloads = {
+        'small ints': rng.integers(0, 1 << 16, count),
+        'wide ints': rng.integers(-1 << 62, 1 << 62, count),
+    }
+    for name, values in workloads.items():
+        items = values.tolist()
+        print(name)
+        runs = {
+            'sorted()': (sorted, lambda: items),
+            'np.sort(stable)': (lambda source: np.sort(source, kind='stable'), lambda: values),
+            'Array.sort radix': (lambda numbers: numbers.sort(algorithm='radix'), lambda: Array(values, int)),
+            'Array.sort numpy': (lambda numbers: numbers.sort(algorithm='numpy'), lambda: Array(values, int)),
+            'Array.sort timsort': (lambda numbers: numbers.sort(algorithm='timsort'), lambda: Array(values, int)),
+        }
+        for label, (run, setup) in runs.items():
+            print(f'  {label:<22}{best_of(run, setup):>16.4f}')
+    words = [str(value) for value in workloads['small ints'][:count // 10].tolist()]
+    print(f'{count // 10} str items')
+    for label, (run, setup) in {
+        'sorted()': (sorted, lambda: words),
+        'Array.sort timsort': (lambda array: array.sort(), lambda: Array(list(words), str, copy='none')),
+    }.items():
+        print(f'  {label:<22}{best_of(run, setup):>16.4f}')
+
+
+def bench_searching(count: int, lookups: int = 10_000) -> None:
+    print(f'{lookups} membership tests in {count} sorted ints (lookups/sec, best of 3)')
+    values = np.arange(0, 2 * count, 2)
+    probes = np.random.default_rng(0).integers(0, 2 * count, lookups).tolist()
+    for name, container in (('Array', Array(values, int)), ('SortedArray', SortedArray(values, int))):
+        def lookup() -> None:
+            for probe in probes:
+                probe in container
+        print(f'{name:<24}{ops_per_second(lookup, lookups):>16,.0f}')
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    bench_construction(count)
+    bench_sliding_window(count)
+    bench_front_operations(count)
+    bench_backends(count)
+    bench_open(count)
+    bench_interop(count)
+    bench_numeric_operations(count)
+    bench_sorting(count)
+    bench_searching(count)
+
+
+if __name__ == '__main__':
+    main()
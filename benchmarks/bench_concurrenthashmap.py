@@ -0,0 +1,78 @@
+""" Multi-threaded throughput of datastructures.concurrenthashmap.ConcurrentHashMap against a
+    HashMap shared behind one global lock.
+    Run from the repository root with `python -m benchmarks.bench_concurrenthashmap [ops_per_thread]`.
+    On a free-threaded CPython build (3.13t and later) the segments can run truly in parallel.
+"""
+
+import random
+import sys
+import threading
+import time
+from typing import Callable
+
+from datastructures.concurrenthashmap import ConcurrentHashMap
+from datastructures.hashmap import HashMap
+
+
+class GlobalLockHashMap:
+    """ The baseline: one HashMap, one lock around every operation. """
+
+    def __init__(self) -> None:
+        self._map = HashMap()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key):
+        with self._lock:
+            return self._map[key]
+
+    def __setitem__(self, key, value) -> None:
+        with self._lock:
+            self._map[key] = value
+
+
+def run_workload(shared: object, threads: int, ops_per_thread: int, key_space: int) -> float:
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        for _ in range(ops_per_thread):
+            key = rng.randrange(key_space)
+            if rng.random() < 0.2:
+                shared[key] = key
+            else:
+                try:
+                    shared[key]
+                except KeyError:
+                    pass
+
+    workers = [threading.Thread(target=worker, args=(seed,)) for seed in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return threads * ops_per_thread / (time.perf_counter() - start)
+
+
+def main() -> None:
+    ops_per_thread = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    key_space = 10_000
+    gil = sys._is_gil_enabled() if hasattr(sys, '_is_gil_enabled') else True
+    print(f'Python {sys.version.split()[0]}, GIL {"enabled" if gil else "disabled (free-threaded)"}')
+    print(f'80% get / 20% set over {key_space} keys, {ops_per_thread} ops per thread, ops/sec')
+    contenders: dict[str, Callable[[], object]] = {
+        'HashMap + global lock': GlobalLockHashMap,
+        'ConcurrentHashMap(16)': lambda: ConcurrentHashMap(segments=16),
+        'ConcurrentHashMap(64)': lambda: ConcurrentHashMap(segments=64),
+    }
+    print(f'{"threads":<9}' + ''.join(f'{name:>26}' for name in contenders))
+    for threads in (1, 2, 4, 8):
+        rates = []
+        for factory in contenders.values():
+            shared = factory()
+            for key in range(key_space):
+                shared[key] = key
+            rates.append(run_workload(shared, threads, ops_per_thread, key_space))
+        print(f'{threads:<9}' + ''.join(f'{rate:>26,.0f}' for rate in rates))
+
+
+if __name__ == '__main__':
+    main()
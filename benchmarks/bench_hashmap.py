@@ -0,0 +1,145 @@
+""" Benchmarks for datastructures.hashmap.HashMap.
+    Run from the repository root with `python -m benchmarks.bench_hashmap`.
+"""
+
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from datastructures.hashmap import HashMap
+from tests.car import Car, Color, Make, Model
+
+
+def make_keys(count: int) -> Dict[str, List[object]]:
+    return {
+        'int': list(range(count)),
+        'str': [f'key-{i}' for i in range(count)],
+        'tuple': [(i, f'key-{i}') for i in range(count)],
+        'Car': [Car(vin=str(i), color=Color.RED, make=Make.TOYOTA, model=Model.CAMRY) for i in range(count)],
+    }
+
+
+def ops_per_second(operation: Callable[[], None], ops: int, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        best = min(best, time.perf_counter() - start)
+    return ops / best
+
+
+def bench_hash_strategies(count: int = 20_000) -> None:
+    print(f'Hash strategies ({count} keys, ops/sec, best of 3)')
+    print(f'{"keys":<8}{"strategy":<10}{"set":>14}{"get":>14}{"contains":>14}')
+    for name, keys in make_keys(count).items():
+        results = {}
+        for strategy in ('stable', 'fast'):
+            hashmap = HashMap(hash_strategy=strategy)
+
+            def fill() -> None:
+                for key in keys:
+                    hashmap[key] = key
+
+            def lookup() -> None:
+                for key in keys:
+                    hashmap[key]
+
+            def contains() -> None:
+                for key in keys:
+                    key in hashmap
+
+            results[strategy] = (ops_per_second(fill, count), ops_per_second(lookup, count), ops_per_second(contains, count))
+            print(f'{name:<8}{strategy:<10}' + ''.join(f'{rate:>14,.0f}' for rate in results[strategy]))
+        speedup = results['fast'][1] / results['stable'][1]
+        print(f'{name:<8}{"speedup":<10}{"":>14}{speedup:>13.1f}x')
+
+
+def bench_storage_engines(count: int = 100_000) -> None:
+    print(f'Storage engines ({count} int keys)')
+    print(f'{"engine":<28}{"bytes/entry":>14}{"set ops/s":>14}{"get ops/s":>14}')
+    keys = list(range(count))
+    engines = {
+        'chaining': {},
+        'open_addressing/linear': {'storage': 'open_addressing', 'probing': 'linear'},
+        'open_addressing/robin_hood': {'storage': 'open_addressing', 'probing': 'robin_hood'},
+    }
+    for name, options in engines.items():
+        tracemalloc.start()
+        hashmap = HashMap(**options)
+        for key in keys:
+            hashmap[key] = key
+        used, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        hashmap = HashMap(**options)
+        start = time.perf_counter()
+        for key in keys:
+            hashmap[key] = key
+        set_rate = count / (time.perf_counter() - start)
+
+        def lookup() -> None:
+            for key in keys:
+                hashmap[key]
+
+        print(f'{name:<28}{used / count:>14,.1f}{set_rate:>14,.0f}{ops_per_second(lookup, count):>14,.0f}')
+
+
+def bench_resize_latency(count: int = 200_000) -> None:
+    print(f'Resize latency ({count} inserts, microseconds)')
+    print(f'{"mode":<14}{"total ms":>12}{"p99":>10}{"p99.9":>10}{"max":>12}')
+    for name, incremental in (('blocking', False), ('incremental', True)):
+        hashmap = HashMap(incremental_resize=incremental)
+        latencies = []
+        start = time.perf_counter()
+        for key in range(count):
+            op_start = time.perf_counter()
+            hashmap[key] = key
+            latencies.append(time.perf_counter() - op_start)
+        total = time.perf_counter() - start
+        latencies.sort()
+        p99 = latencies[int(count * 0.99)] * 1e6
+        p999 = latencies[int(count * 0.999)] * 1e6
+        print(f'{name:<14}{total * 1e3:>12,.0f}{p99:>10,.1f}{p999:>10,.1f}{latencies[-1] * 1e6:>12,.0f}')
+
+
+def bench_equality_counters(count: int = 20_000) -> None:
+    print(f'Equality calls during {count} Car lookups')
+    print(f'{"engine":<18}{"== calls":>12}{"== avoided":>14}')
+    keys = make_keys(count)['Car']
+    for name, options in (('chaining', {}), ('open_addressing', {'storage': 'open_addressing'})):
+        hashmap = HashMap(**options)
+        for key in keys:
+            hashmap[key] = key
+        before_checks, before_avoided = hashmap.equality_checks, hashmap.equality_checks_avoided
+        for key in keys:
+            hashmap[Car(vin=key.vin, color=key.color, make=key.make, model=key.model)]
+        print(f'{name:<18}{hashmap.equality_checks - before_checks:>12,}{hashmap.equality_checks_avoided - before_avoided:>14,}')
+
+
+def bench_bulk_load(count: int = 200_000) -> None:
+    print(f'Bulk load ({count} pairs, ms)')
+    pairs = [(f'row-{i}', i) for i in range(count)]
+    for name, options in (('chaining', {}), ('open_addressing', {'storage': 'open_addressing'})):
+        start = time.perf_counter()
+        hashmap = HashMap(**options)
+        for key, value in pairs:
+            hashmap[key] = value
+        one_by_one = time.perf_counter() - start
+        start = time.perf_counter()
+        HashMap.from_items(pairs, **options)
+        bulk = time.perf_counter() - start
+        print(f'{name:<18}{"__setitem__":<14}{one_by_one * 1e3:>10,.0f}   {"from_items":<12}{bulk * 1e3:>10,.0f}')
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    bench_hash_strategies(count)
+    bench_storage_engines(count * 5)
+    bench_resize_latency(count * 10)
+    bench_equality_counters(count)
+    bench_bulk_load(count * 10)
+
+
+if __name__ == '__main__':
+    main()
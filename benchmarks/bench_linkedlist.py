@@ -0,0 +1,132 @@
+""" Benchmarks for datastructures.linkedlist.LinkedList.
+    Run from the repository root with `python -m benchmarks.bench_linkedlist [count]`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import random
+import sys
+import time
+import tracemalloc
+from typing import Optional
+
+from benchmarks.bench_hashmap import ops_per_second
+from datastructures.linkedlist import LinkedList
+from datastructures.sortedlinkedlist import SortedLinkedList
+
+
+@dataclass
+class DictNode:
+    """ The node layout LinkedList used before it switched to slots, kept as a baseline. """
+    data: object
+    next: Optional[DictNode] = None
+    previous: Optional[DictNode] = None
+
+
+class DictNodeLinkedList(LinkedList):
+    Node = DictNode
+
+
+class CountingLinkedList(LinkedList):
+    """ Counts nodes that had to be allocated because the free-list was empty. """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.allocations = 0
+
+    def _new_node(self, item):
+        if not self._free_nodes:
+            self.allocations += 1
+        return super()._new_node(item)
+
+
+def bytes_per_element(list_type: type, count: int) -> float:
+    items = list(range(count))
+    tracemalloc.start()
+    linked_list = list_type()
+    for item in items:
+        linked_list.append(item)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return used / count
+
+
+def bench_node_memory(count: int) -> None:
+    print(f'Node memory ({count} int items, item objects not counted)')
+    print(f'{"node":<12}{"bytes/element":>16}')
+    for name, list_type in (('dataclass', DictNodeLinkedList), ('slots', LinkedList)):
+        print(f'{name:<12}{bytes_per_element(list_type, count):>16.1f}')
+
+
+def churn(linked_list: LinkedList, count: int, rounds: int) -> float:
+    """ Fills the list to `count` items, then runs `rounds` passes that pop and re-push every item. Returns push+pop ops/sec. """
+    for i in range(count):
+        linked_list.append(i)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for _ in range(count):
+            linked_list.append(linked_list.pop_front())
+    return 2 * count * rounds / (time.perf_counter() - start)
+
+
+def bench_churn(count: int, rounds: int = 3) -> None:
+    print(f'Push/pop churn ({count} items, {rounds} rounds)')
+    print(f'{"recycle_nodes":<16}{"ops/sec":>14}{"node allocations/sec":>24}')
+    for recycle_nodes in (0, 1024):
+        rate = churn(LinkedList(recycle_nodes=recycle_nodes), count, rounds)
+        counting = CountingLinkedList(recycle_nodes=recycle_nodes)
+        churn(counting, count, rounds)
+        # Allocations made while churning, excluding the initial fill.
+        allocations_per_op = (counting.allocations - count) / (2 * count * rounds)
+        print(f'{recycle_nodes:<16}{rate:>14,.0f}{rate * allocations_per_op:>24,.0f}')
+
+
+def bench_bulk_build(count: int) -> None:
+    print(f'Building a {count}-item int list (items/sec, best of 3)')
+    items = list(range(count))
+
+    def append_loop() -> None:
+        linked_list = LinkedList(int)
+        for item in items:
+            linked_list.append(item)
+
+    for name, build in (('append loop', append_loop), ('from_sequence', lambda: LinkedList.from_sequence(items, int))):
+        print(f'{name:<16}{ops_per_second(build, count):>14,.0f}')
+    first, second = LinkedList.from_sequence(items), LinkedList.from_sequence(items)
+    start = time.perf_counter()
+    first.splice(second)
+    print(f'splice of two {count}-item lists: {(time.perf_counter() - start) * 1e6:.1f} us')
+
+
+def bench_sort(count: int) -> None:
+    print(f'Sorting a {count}-item list of random ints (seconds, best of 3)')
+    rng = random.Random(0)
+    items = [rng.randrange(count) for _ in range(count)]
+    for name, sort in (
+        ('LinkedList.sort', lambda linked_list: linked_list.sort()),
+        ('sorted() + rebuild', lambda linked_list: LinkedList.from_sequence(sorted(linked_list))),
+    ):
+        best = float('inf')
+        for _ in range(3):
+            linked_list = LinkedList.from_sequence(items)
+            start = time.perf_counter()
+            sort(linked_list)
+            best = min(best, time.perf_counter() - start)
+        print(f'{name:<20}{best:>10.3f}')
+    runs = [SortedLinkedList.from_sequence(sorted(items[i::8])) for i in range(8)]
+    start = time.perf_counter()
+    runs[0].merge(*runs[1:])
+    print(f'{"8-way merge":<20}{time.perf_counter() - start:>10.3f}')
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    bench_node_memory(count)
+    bench_churn(count)
+    bench_bulk_build(count)
+    bench_sort(count)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+""" Benchmarks for datastructures.unrolledlinkedlist.UnrolledLinkedList against LinkedList and Array.
+    Run from the repository root with `python -m benchmarks.bench_unrolledlinkedlist [count]`.
+"""
+
+import sys
+import tracemalloc
+from typing import Callable
+
+from benchmarks.bench_hashmap import ops_per_second
+from datastructures.array import Array
+from datastructures.linkedlist import LinkedList
+from datastructures.unrolledlinkedlist import UnrolledLinkedList
+
+
+def build(factory: Callable[[], object], count: int) -> object:
+    sequence = factory()
+    for i in range(count):
+        sequence.append(i)
+    return sequence
+
+
+def bytes_per_element(factory: Callable[[], object], count: int) -> float:
+    tracemalloc.start()
+    sequence = build(factory, count)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del sequence
+    # The int objects themselves are included, equally for every structure.
+    return used / count
+
+
+def bench_sequences(count: int) -> None:
+    factories = {
+        'LinkedList': lambda: LinkedList(),
+        'UnrolledLinkedList(64)': lambda: UnrolledLinkedList(chunk_capacity=64),
+        'UnrolledLinkedList(256)': lambda: UnrolledLinkedList(chunk_capacity=256),
+        'Array': lambda: Array(0),
+    }
+    print(f'Sequences ({count} int items, ops/sec, best of 3)')
+    print(f'{"structure":<26}{"append":>14}{"iterate":>14}{"reversed":>14}{"contains":>14}{"bytes/elem":>12}')
+    for name, factory in factories.items():
+        sequence = build(factory, count)
+
+        def iterate() -> None:
+            for _ in sequence:
+                pass
+
+        def iterate_reversed() -> None:
+            for _ in reversed(sequence):
+                pass
+
+        def contains() -> None:
+            # Miss, so every element is compared.
+            -1 in sequence
+
+        rates = (
+            ops_per_second(lambda: build(factory, count), count),
+            ops_per_second(iterate, count),
+            ops_per_second(iterate_reversed, count),
+            ops_per_second(contains, count),
+        )
+        print(f'{name:<26}' + ''.join(f'{rate:>14,.0f}' for rate in rates) + f'{bytes_per_element(factory, count):>12.1f}')
+
+
+def bench_middle_inserts(count: int, inserts: int = 1_000) -> None:
+    print(f'Inserts after a middle item ({count} items, {inserts} inserts, ops/sec)')
+    target = count // 2
+    for name, factory in (('LinkedList', LinkedList), ('UnrolledLinkedList(64)', UnrolledLinkedList)):
+        sequence = build(factory, count)
+
+        def insert() -> None:
+            for i in range(inserts):
+                sequence.insert_after(target, -i)
+
+        print(f'{name:<26}{ops_per_second(insert, inserts, repeat=1):>14,.0f}')
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    bench_sequences(count)
+    bench_middle_inserts(count // 10)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+""" Cost of each datastructures.validation mode on LinkedList, Deque and ListStack.
+    Run from the repository root with `python -m benchmarks.bench_validation [count]`.
+"""
+
+import sys
+
+from benchmarks.bench_hashmap import ops_per_second
+from datastructures.deque import Deque
+from datastructures.linkedlist import LinkedList
+from datastructures.liststack import ListStack
+from datastructures.validation import ValidationMode
+
+
+def bench_modes(count: int) -> None:
+    items = list(range(count))
+    workloads = {
+        'LinkedList.append': (lambda mode: LinkedList(int, validation=mode), 'append'),
+        'Deque.enqueue': (lambda mode: Deque(int, validation=mode), 'enqueue'),
+        'ListStack.push': (lambda mode: ListStack(int, validation=mode), 'push'),
+    }
+    modes = list(ValidationMode)
+    print(f'Validation modes ({count} int items, ops/sec, best of 3)')
+    print(f'{"workload":<20}' + ''.join(f'{mode.value:>12}' for mode in modes) + f'{"off vs strict":>16}')
+    for name, (factory, method) in workloads.items():
+        rates = []
+        for mode in modes:
+            def fill() -> None:
+                add = getattr(factory(mode), method)
+                for item in items:
+                    add(item)
+            rates.append(ops_per_second(fill, count))
+        speedup = rates[modes.index(ValidationMode.OFF)] / rates[modes.index(ValidationMode.STRICT)]
+        print(f'{name:<20}' + ''.join(f'{rate:>12,.0f}' for rate in rates) + f'{speedup:>15.2f}x')
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    bench_modes(count)
+
+
+if __name__ == '__main__':
+    main()
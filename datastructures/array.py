@@ -2,39 +2,399 @@
 
 """ This module defines an Array class that represents a one-dimensional array. 
     See the stipulations in iarray.py for more information on the methods and their expected behavior.
-    Methods that are not implemented raise a NotImplementedError until they are implemented.
+    Arrays also work with NumPy: np.asarray() and memoryview() see the items of a numeric Array without
+    a copy, and ufuncs and arithmetic operators apply elementwise and return a new Array.
 """
 
 from __future__ import annotations
+import bisect
 from collections.abc import Sequence
 import copy
 import os
-from typing import Any, Iterator, overload
+from typing import Any, Callable, Iterator, overload
 import numpy as np
 
 
 
+from datastructures.arraybackends import BACKENDS, ArrayBackend, MemmapBackend
 from datastructures.iarray import IArray, T
+from datastructures.validation import ValidationMode, make_validator
 
 
 class Array(IArray[T]):  
 
-    def __init__(self, starting_sequence: Sequence[T] | int = [], data_type: type = object) -> None:
+    def __init__(self, starting_sequence: Sequence[T] | int = [], data_type: type = object, validation: ValidationMode | str | None = None, copy: str = 'deep', backend: ArrayBackend | str | None = None) -> None:
+        """ `copy` controls how items of `starting_sequence` are stored: 'deep' (the default) deep-copies each
+            one, 'shallow' copies each one with copy.copy, and 'none' stores the caller's objects as they are.
+            Numeric data types skip per-item copying, since their items are immutable scalars. NumPy arrays,
+            array.array, bytes and other buffer-protocol sources are loaded in one vectorized copy; with
+            copy='none' a contiguous source that already has the right dtype is used without copying, so
+            the Array shares the caller's buffer (and is read-only if that buffer is). A list backend
+            likewise adopts a list passed with copy='none'.
+
+            `backend` picks the storage: 'numpy', 'list' or an ArrayBackend instance such as
+            MemmapBackend(path). By default numeric data types use 'numpy' and everything else 'list'.
+        """
+        if copy not in _COPIERS:
+            raise ValueError(f"copy must be one of {', '.join(_COPIERS)}")
+        self.__validate = make_validator(_accepted_types(data_type), validation)
+        numeric_dtype = _numeric_dtype(data_type)
+        self.__backend = _select_backend(backend, numeric_dtype)
+        self.__data_type = data_type
+        # Items live in __elements[__start:__start + __logical_size]; the free slots on either side let
+        # both ends grow without shifting the others.
+        self.__start = 0
+        if isinstance(starting_sequence, np.ndarray) and numeric_dtype is None:
+            starting_sequence = starting_sequence.tolist()
         if isinstance(starting_sequence, int):
+            self.__elements = self.__backend.allocate(starting_sequence, data_type)
             self.__logical_size = 0
-            self.__physical_size = starting_sequence
-            self.__data_type = data_type
-            self.__elements = np.empty(self.__physical_size, dtype=self.__data_type)
+        elif numeric_dtype is not None and _is_buffer(starting_sequence):
+            source = np.asarray(starting_sequence if isinstance(starting_sequence, np.ndarray) else memoryview(starting_sequence))
+            if source.ndim != 1:
+                source = source.reshape(-1)
+            if copy != 'none' or source.dtype != numeric_dtype or not source.flags.c_contiguous:
+                typed = np.empty(len(source), dtype=numeric_dtype)
+                # The buffer's dtype stands in for per-item checks: only casts within the same kind are allowed.
+                np.copyto(typed, source, casting='unsafe' if self.__validate is None else 'same_kind')
+                source = typed
+            self.__elements = self.__backend.from_items(source, data_type, share=True)
+            self.__logical_size = len(source)
         elif isinstance(starting_sequence, Sequence):
+            if self.__validate is not None:
+                for item in starting_sequence:
+                    self.__validate(item)
+            copier = _COPIERS[copy]
+            if numeric_dtype is not None or copier is None:
+                self.__elements = self.__backend.from_items(starting_sequence, data_type, share=copy == 'none')
+            else:
+                self.__elements = self.__backend.from_items([copier(item) for item in starting_sequence], data_type, share=True)
             self.__logical_size = len(starting_sequence)
-            self.__physical_size = self.__logical_size
-            self.__data_type = data_type
-            self.__elements = np.empty(self.__logical_size, dtype=self.__data_type)
-            for i in range(self.__logical_size):
-                self.__elements[i] = copy.deepcopy(starting_sequence[i])
         else:
             raise ValueError("starting_sequence must be a valid sequence or integer")
+        self.__physical_size = len(self.__elements)
+
+
+    @classmethod
+    def open(cls, path: str | os.PathLike, data_type: type | None = None, mode: str = 'r+', validation: ValidationMode | str | None = None) -> Array:
+        """ Creates (mode 'w+') or attaches to (mode 'r+', or 'r' for read-only) an Array stored in the file
+            at `path` through a MemmapBackend. Attaching reads only the header; items are paged in as they
+            are touched, so the file can be larger than memory and several processes can map it at once.
+            Changes reach the file's header, and so other processes opening it, on flush().
+
+        Examples:
+            >>> readings = Array.open('readings.bin', float, 'w+')
+            >>> readings.append(21.5)
+            >>> readings.flush()
+            >>> Array.open('readings.bin', mode='r')[0]
+            21.5
+
+        Raises:
+            ValueError: if mode is 'w+' and no data_type is given, or the file is not an Array file.
+            TypeError: if data_type is given and differs from the file's dtype.
+        """
+        backend = MemmapBackend(path, mode)
+        if mode == 'w+':
+            if data_type is None:
+                raise ValueError("creating an Array file needs a data_type")
+            array = cls(0, data_type, validation, backend=backend)
+            array.flush()
+            return array
+        buffer, dtype, start, count = backend.attach()
+        if data_type is not None and np.dtype(data_type) != dtype:
+            raise TypeError(f"{path} holds {dtype} items, not {np.dtype(data_type)}")
+        array = cls(buffer, dtype if data_type is None else data_type, validation, copy='none', backend=backend)
+        array.__start = start
+        array.__logical_size = count
+        return array
+
+    @classmethod
+    def from_buffer(cls, buffer: Any, data_type: type | None = None, validation: ValidationMode | str | None = None) -> Array:
+        """ An Array over `buffer` (anything supporting the buffer protocol, or an ndarray) that shares its
+            memory when `data_type` matches the buffer's format, which is the default; writes go through to
+            the buffer until the Array reallocates. Otherwise the items are cast into a new buffer, as by
+            the constructor.
+
+        Examples:
+            >>> raw = bytearray(b'\\x01\\x02\\x03')
+            >>> Array.from_buffer(raw)[2]
+            3
+        """
+        source = buffer if isinstance(buffer, np.ndarray) else np.asarray(memoryview(buffer))
+        return cls(source, source.dtype if data_type is None else data_type, validation, copy='none')
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        """ The items as an ndarray. For NumPy-backed Arrays this is a view of the live items, made in O(1);
+            list-backed Arrays have to be copied, which copy=False refuses with a ValueError.
+        """
+        items = self.__live()
+        if isinstance(items, np.ndarray):
+            if dtype is not None and np.dtype(dtype) != items.dtype:
+                if copy is False:
+                    raise ValueError("converting the Array to another dtype needs a copy")
+                return items.astype(dtype)
+            return items.copy() if copy else items
+        if copy is False:
+            raise ValueError("a list-backed Array cannot be converted without a copy")
+        numeric_dtype = _numeric_dtype(self.__data_type)
+        if numeric_dtype is not None or dtype is not None:
+            return np.array(items, dtype=numeric_dtype if dtype is None else dtype)
+        return np.fromiter(items, dtype=object, count=len(items))
+
+    def __array_ufunc__(self, ufunc: np.ufunc, method: str, *inputs: Any, **kwargs: Any) -> Any:
+        """ Lets ufuncs take Arrays, so np.sqrt(array) and ndarray + array return an Array rather than an
+            ndarray. Reductions and other ufunc methods return what they would for the ndarray.
+        """
+        outputs = kwargs.get('out', ())
+        if any(isinstance(each, (Array, Array.View)) for each in outputs):
+            return NotImplemented
+        for each in inputs:
+            if each is not self:
+                self.__check_length(np.asarray(each) if isinstance(each, (Array, Array.View)) else each)
+        inputs = tuple(np.asarray(each) if isinstance(each, (Array, Array.View)) else each for each in inputs)
+        result = getattr(ufunc, method)(*inputs, **kwargs)
+        if method != '__call__' or outputs:
+            return result
+        if ufunc.nout > 1:
+            return tuple(self._from_result(each) for each in result)
+        return self._from_result(result)
+
+    @property
+    def __array_interface__(self) -> dict[str, Any]:
+        """ NumPy's array interface for the live items of a numeric, NumPy-backed Array. The pointer in it
+            stays valid only until the Array next reallocates; np.asarray() and memoryview() are safe.
+        """
+        items = self.__live()
+        if not isinstance(items, np.ndarray) or items.dtype == object:
+            raise AttributeError("only numeric, NumPy-backed Arrays have an __array_interface__")
+        return items.__array_interface__
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """ Exposes the live items of a numeric, NumPy-backed Array through the buffer protocol, without a copy. """
+        items = self.__live()
+        if not isinstance(items, np.ndarray) or items.dtype == object:
+            raise TypeError("only numeric, NumPy-backed Arrays support the buffer protocol")
+        return memoryview(items)
+
+    def sum(self) -> T:
+        return self.__array__().sum()
+
+    def min(self) -> T:
+        """ Raises ValueError for an empty Array, as max() and mean() do. """
+        return self.__array__().min()
+
+    def max(self) -> T:
+        return self.__array__().max()
+
+    def mean(self) -> float:
+        if not self.__logical_size:
+            raise ValueError("mean of an empty Array")
+        return self.__array__().mean()
+
+    def map(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Array:
+        """ A new Array of function(items, *args, **kwargs), where `function` is a NumPy ufunc or any other
+            callable that works on a whole ndarray at once and returns one result per item.
+
+        Examples:
+            >>> Array([1, 4, 9], int).map(np.sqrt)
+            Array [1.0, 2.0, 3.0], Logical: 3, Physical: 3, type: float64
+        """
+        items = self.__array__()
+        result = np.asarray(function(items, *args, **kwargs))
+        if result.shape != items.shape:
+            raise ValueError("map needs a function that returns one result per item")
+        return self._from_result(result)
+
+    def filter(self, mask: Sequence[bool] | np.ndarray | Callable[[np.ndarray], np.ndarray]) -> Array:
+        """ A new Array of the items where `mask` is True. `mask` is a sequence of bools, one per item, or a
+            function that computes one from the items as an ndarray, such as `lambda items: items > 0`.
+        """
+        items = self.__array__()
+        if callable(mask):
+            mask = mask(items)
+        mask = np.asarray(mask)
+        if mask.dtype != np.bool_:
+            raise TypeError("filter needs a boolean mask")
+        return self._from_result(items[mask])
+
+    def argsort(self) -> Array:
+        """ The indices that would sort the Array, as a new Array; ties keep their order. """
+        return self._from_result(np.argsort(self.__array__(), kind='stable'))
+
+    def sort(self, key: Callable[[T], Any] | None = None, reverse: bool = False, algorithm: str = 'auto') -> None:
+        """ Sorts the items in place, stably: equal items keep their order, also when `reverse` is True.
+
+            `algorithm` is 'radix' (integer data types only), 'timsort' (Python's list sort, the only one
+            that takes a `key`) or 'numpy' (np.sort's stable sort). 'auto' uses radix sort for integers
+            spanning at most 2 ** 16 values, NumPy for other NumPy-backed numbers and timsort for the rest.
+
+        Raises:
+            ValueError: if `algorithm` is unknown, or does not fit the data type or `key`.
+        """
+        if algorithm not in ('auto', 'radix', 'timsort', 'numpy'):
+            raise ValueError("algorithm must be 'auto', 'radix', 'timsort' or 'numpy'")
+        start, stop = self.__start, self.__start + self.__logical_size
+        items = self.__backend.view(self.__elements, start, stop)
+        numeric = isinstance(items, np.ndarray) and items.dtype.kind in 'biufc'
+        integers = numeric and items.dtype.kind in 'iu'
+        if key is not None and algorithm in ('radix', 'numpy'):
+            raise ValueError("only timsort takes a key")
+        if algorithm == 'radix' and not integers:
+            raise ValueError("radix sort needs an integer data type")
+        if algorithm == 'numpy' and not isinstance(items, np.ndarray):
+            raise ValueError("numpy sort needs a NumPy-backed Array")
+        if algorithm == 'auto':
+            if key is not None or not numeric:
+                algorithm = 'timsort'
+            elif integers and len(items) and int(items.max()) - int(items.min()) < 1 << 16:
+                algorithm = 'radix'
+            else:
+                algorithm = 'numpy'
+        if algorithm == 'timsort':
+            ordered = list(self.__live())
+            ordered.sort(key=key, reverse=reverse)
+            self.__elements[start:stop] = ordered
+            return
+        # Sorting a reversed view ascending leaves the items descending, with ties still in their order.
+        target = items[::-1] if reverse else items
+        if algorithm == 'radix':
+            target[:] = target[_radix_order(target)]
+        else:
+            target.sort(kind='stable')
+
+    def bisect_left(self, item: Any, lo: int = 0, hi: int | None = None, key: Callable[[T], Any] | None = None) -> int:
+        """ The first position in sorted items[lo:hi] where `item` could be inserted and keep them sorted, as
+            bisect.bisect_left does; with `key`, items are compared by key(item) to `item`, which is
+            then a key value. O(log n), in C for NumPy-backed Arrays without a key.
+        """
+        return self.__bisect(item, lo, hi, key, 'left')
+
+    def bisect_right(self, item: Any, lo: int = 0, hi: int | None = None, key: Callable[[T], Any] | None = None) -> int:
+        """ Like bisect_left, but the position after any items equal to `item`. """
+        return self.__bisect(item, lo, hi, key, 'right')
 
+    def __bisect(self, item: Any, lo: int, hi: int | None, key: Callable[[T], Any] | None, side: str) -> int:
+        if lo < 0:
+            raise ValueError("lo must be non-negative")
+        hi = self.__logical_size if hi is None else min(hi, self.__logical_size)
+        if lo >= hi:
+            return lo
+        start = self.__start
+        if key is None and isinstance(self.__elements, np.ndarray):
+            return lo + int(np.searchsorted(self.__elements[start + lo:start + hi], item, side=side))
+        search = bisect.bisect_left if side == 'left' else bisect.bisect_right
+        return search(self.__elements, item, start + lo, start + hi, key=key) - start
+
+    def insert_sorted(self, item: T, key: Callable[[T], Any] | None = None) -> int:
+        """ Inserts `item` after the items that do not sort after it, keeping sorted items sorted, and
+            returns its position. Finding the spot is O(log n); making room moves the shorter side.
+        """
+        if self.__validate is not None:
+            self.__validate(item)
+        index = self.bisect_right(item if key is None else key(item), key=key)
+        self.__insert_at(index, item)
+        return index
+
+    def __insert_at(self, index: int, item: T) -> None:
+        if index < self.__logical_size // 2:
+            if self.__start == 0:
+                self.__make_room(at_front=True)
+            position = self.__start + index
+            self.__elements[self.__start - 1:position - 1] = self.__elements[self.__start:position]
+            self.__start -= 1
+            self.__elements[position - 1] = item
+        else:
+            if self.__start + self.__logical_size == self.__physical_size:
+                self.__make_room(at_front=False)
+            position = self.__start + index
+            stop = self.__start + self.__logical_size
+            self.__elements[position + 1:stop + 1] = self.__elements[position:stop]
+            self.__elements[position] = item
+        self.__logical_size += 1
+
+    # Arithmetic is elementwise, with a scalar or with an equally long Array or array-like, and returns a
+    # new Array. Comparison operators keep their Array meaning; use filter() for elementwise conditions.
+    def __add__(self, other: Any) -> Array:
+        return self._elementwise(np.add, other)
+
+    def __radd__(self, other: Any) -> Array:
+        return self._elementwise(np.add, other, reflected=True)
+
+    def __sub__(self, other: Any) -> Array:
+        return self._elementwise(np.subtract, other)
+
+    def __rsub__(self, other: Any) -> Array:
+        return self._elementwise(np.subtract, other, reflected=True)
+
+    def __mul__(self, other: Any) -> Array:
+        return self._elementwise(np.multiply, other)
+
+    def __rmul__(self, other: Any) -> Array:
+        return self._elementwise(np.multiply, other, reflected=True)
+
+    def __truediv__(self, other: Any) -> Array:
+        return self._elementwise(np.true_divide, other)
+
+    def __rtruediv__(self, other: Any) -> Array:
+        return self._elementwise(np.true_divide, other, reflected=True)
+
+    def __floordiv__(self, other: Any) -> Array:
+        return self._elementwise(np.floor_divide, other)
+
+    def __rfloordiv__(self, other: Any) -> Array:
+        return self._elementwise(np.floor_divide, other, reflected=True)
+
+    def __mod__(self, other: Any) -> Array:
+        return self._elementwise(np.remainder, other)
+
+    def __rmod__(self, other: Any) -> Array:
+        return self._elementwise(np.remainder, other, reflected=True)
+
+    def __pow__(self, other: Any) -> Array:
+        return self._elementwise(np.power, other)
+
+    def __rpow__(self, other: Any) -> Array:
+        return self._elementwise(np.power, other, reflected=True)
+
+    def __neg__(self) -> Array:
+        return self._from_result(np.negative(self.__array__()))
+
+    def __abs__(self) -> Array:
+        return self._from_result(np.absolute(self.__array__()))
+
+    def _elementwise(self, ufunc: np.ufunc, other: Any, reflected: bool=False) -> Array:
+        if isinstance(other, (Array, Array.View)):
+            other = np.asarray(other)
+        self.__check_length(other)
+        items = self.__array__()
+        return self._from_result(ufunc(other, items) if reflected else ufunc(items, other))
+
+    def __check_length(self, other: Any) -> None:
+        sized = isinstance(other, np.ndarray) and other.ndim > 0 or isinstance(other, Sequence) and not isinstance(other, (str, bytes))
+        if sized and len(other) != self.__logical_size:
+            # NumPy would broadcast a single item across the Array; only equal lengths are elementwise.
+            raise ValueError(f"operands have different lengths: {self.__logical_size} and {len(other)}")
+
+    def _from_result(self, items: np.ndarray) -> Array:
+        """ Wraps a freshly computed ndarray without copying it, keeping this Array's data_type when the
+            result's dtype is the one it maps to.
+        """
+        numeric_dtype = _numeric_dtype(self.__data_type)
+        if numeric_dtype is not None and numeric_dtype == items.dtype:
+            data_type = self.__data_type
+        else:
+            data_type = object if items.dtype == object else items.dtype
+        return Array(items, data_type, copy='none')
+
+    def flush(self) -> None:
+        """ Writes a file-backed Array's items and size to its file; does nothing for in-memory backends. """
+        self.__backend.flush(self.__elements, self.__start, self.__logical_size)
+
+    def __enter__(self) -> Array[T]:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
 
     @overload
     def __getitem__(self, index: int) -> T: ...
@@ -42,110 +402,316 @@ class Array(IArray[T]):
     def __getitem__(self, index: slice) -> Sequence[T]: ...
     def __getitem__(self, index: int | slice) -> T | Sequence[T]:
         if isinstance(index, slice):
-            return Array(starting_sequence=self.__elements[index].tolist())
+            return Array.View(self, self.__backend.view(self.__elements, self.__start, self.__start + self.__logical_size)[index])
         elif isinstance(index, int):
             if index < 0 or index >= self.__logical_size:
                 raise IndexError("Index out of bounds")
-            return self.__elements[index]
+            return self.__elements[self.__start + index]
         raise TypeError("Invalid argument type")
 
     
     def __setitem__(self, index: int, item: T) -> None:
-        self.__elements[index] = item
+        if self.__validate is not None:
+            self.__validate(item)
+        if index < 0 or index >= self.__logical_size:
+            raise IndexError("Index out of bounds")
+        self.__elements[self.__start + index] = item
 
-    def append(self, data: T) -> None:
-        if self.__logical_size == self.__physical_size:
-            self.__physical_size = max(1, self.__physical_size * 2)
-            new_elements = np.empty(self.__physical_size, dtype = self.__data_type)
-            new_elements[:self.__logical_size] = self.__elements
-            self.__elements = new_elements
+    def __live(self) -> Sequence[T]:
+        return self.__elements[self.__start:self.__start + self.__logical_size]
+
+    def __reallocate(self, physical_size: int, at_front: bool=False) -> None:
+        """ Moves the items into a new buffer of `physical_size` slots; see ArrayBackend.resize. """
+        self.__elements, self.__start = self.__backend.resize(self.__elements, physical_size, self.__data_type, self.__start, self.__logical_size, at_front)
+        self.__physical_size = len(self.__elements)
+
+    def __make_room(self, at_front: bool) -> None:
+        """ Frees a slot at the front or back end of the buffer. The buffer doubles when it is full, or
+            nearly full, since then sliding would buy too few pushes to pay for itself. Otherwise the items
+            slide to the opposite end, so every free slot is on the side being pushed to. Either way, at
+            least a quarter of the buffer's pushes are paid for by each O(n) move.
+        """
+        free = self.__physical_size - self.__logical_size
+        if free == 0 or free < self.__physical_size // 4:
+            self.__reallocate(max(1, self.__physical_size * 2), at_front)
+            return
+        start = free if at_front else 0
+        self.__elements[start:start + self.__logical_size] = self.__live()
+        self.__start = start
 
-        self.__elements[self.__logical_size] = data
+    def __shrink_if_sparse(self) -> None:
+        if self.__logical_size > 0 and self.__logical_size <= self.__physical_size // 4:
+            self.__reallocate(self.__physical_size // 2)
+
+    def append(self, data: T) -> None:
+        if self.__validate is not None:
+            self.__validate(data)
+        if self.__start + self.__logical_size == self.__physical_size:
+            self.__make_room(at_front=False)
+        self.__elements[self.__start + self.__logical_size] = data
         self.__logical_size += 1
 
     def append_front(self, data: T) -> None:
-        if self.__logical_size == self.__physical_size:
-            self.__physical_size = max(1, self.__physical_size * 2)
-            new_elements = np.empty(self.__physical_size, dtype=self.__data_type)
-            new_elements[1:self.__logical_size + 1] = self.__elements[:self.__logical_size]
-            self.__elements = new_elements
-        else:
-            self.__elements[1:self.__logical_size + 1] = self.__elements[:self.__logical_size]
-        
-        self.__elements[0] = data
+        if self.__validate is not None:
+            self.__validate(data)
+        if self.__start == 0:
+            self.__make_room(at_front=True)
+        self.__start -= 1
+        self.__elements[self.__start] = data
         self.__logical_size += 1
 
     def pop(self) -> None:
         if self.__logical_size == 0:
             raise IndexError
-
         self.__logical_size -= 1
-
-        if self.__logical_size > 0 and self.__logical_size <= self.__physical_size // 4:
-            self.__physical_size = self.__physical_size // 2
-            new_elements = np.empty(self.__physical_size, dtype=self.__data_type)
-            new_elements[:self.__logical_size] = self.__elements[:self.__logical_size]
-            self.__elements = new_elements
+        self.__shrink_if_sparse()
     
     def pop_front(self) -> None:
         if self.__logical_size == 0:
             raise IndexError
-        
-        self.__elements[:self.__logical_size - 1] = self.__elements[1:self.__logical_size]
+        self.__start += 1
         self.__logical_size -= 1
-        
-        if self.__logical_size > 0 and self.__logical_size <= self.__physical_size // 4:
-            self.__physical_size = self.__physical_size // 2
-            new_elements = np.empty(self.__physical_size, dtype = self.__data_type)
-            new_elements[:self.__logical_size] = self.__elements[:self.__logical_size]
-            self.__elements = new_elements
+        self.__shrink_if_sparse()
 
     def __len__(self) -> int: 
         return self.__logical_size
 
     def __eq__(self, other: object) -> bool:
+        if isinstance(other, Array.View):
+            return other == self
         if not isinstance(other, Array):
             return False
         
         if self.__logical_size != other.__logical_size:
             return False
         
-        return np.array_equal(self.__elements[:self.__logical_size], other.__elements[:other.__logical_size])
+        mine, theirs = self.__live(), other.__live()
+        if isinstance(mine, np.ndarray) and isinstance(theirs, np.ndarray):
+            return np.array_equal(mine, theirs)
+        return all(item == other_item for item, other_item in zip(mine, theirs))
 
     def __iter__(self) -> Iterator[T]:
-        return iter(self.__elements[:self.__logical_size])
+        return iter(self.__live())
 
     def __reversed__(self) -> Iterator[T]:
-        reversed_elements = np.flip(self.__elements)
-        return iter(reversed_elements)
+        return iter(self.__live()[::-1])
 
     def __delitem__(self, index: int) -> None:
        if not 0 <= index < self.__logical_size:
            raise IndexError
        
-       self.__elements[index:self.__logical_size - 1] = self.__elements[index + 1:self.__logical_size]
+       # Close the gap from whichever side has fewer items to move.
+       position = self.__start + index
+       if index < self.__logical_size // 2:
+           self.__elements[self.__start + 1:position + 1] = self.__elements[self.__start:position]
+           self.__start += 1
+       else:
+           self.__elements[position:self.__start + self.__logical_size - 1] = self.__elements[position + 1:self.__start + self.__logical_size]
        self.__logical_size -= 1
-
-       if self.__logical_size > 0 and self.__logical_size <= self.__physical_size // 4:
-           self.__physical_size //=2
-           new_elements = np.empty(self.__physical_size, dtype=self.__data_type)
-           new_elements[:self.__logical_size] = self.__elements[:self.__logical_size]
-           self.__elements = new_elements
+       self.__shrink_if_sparse()
 
     def __contains__(self, item: Any) -> bool:
-        return np.any(self.__elements[:self.__logical_size] == item)
+        return item in self.__live()
 
     def clear(self) -> None:
         self.__logical_size = 0
-        self.__elements = np.empty(self.__physical_size, dtype = self.__data_type)
+        self.__start = self.__physical_size // 2
+        self.__elements = self.__backend.allocate(self.__physical_size, self.__data_type)
 
     def __str__(self) -> str:
-        return f'[{", ".join(str(item) for item in self.__elements[:self.__logical_size])}]'
+        return f'[{", ".join(str(item) for item in self.__live())}]'
     
     def __repr__(self) -> str:
-        return f'Array {self.__str__()}, Logical: {self.__logical_size}, Physical: {len(self.__items)}, type: {self.__data_type}'
+        return f'Array {self.__str__()}, Logical: {self.__logical_size}, Physical: {self.__physical_size}, type: {self.__data_type}'
+
+    @property
+    def data_type(self) -> type:
+        return self.__data_type
+
+    @property
+    def backend(self) -> ArrayBackend:
+        return self.__backend
+
+    def _validate_item(self, item: T) -> None:
+        if self.__validate is not None:
+            self.__validate(item)
+
+    class View:
+        """ Window over an Array's backing buffer, as returned by slicing. Nothing is copied: reads see the
+            Array's current items, and assignments write through to it. Slicing a View gives another View.
+            A View keeps the buffer it was made from, so it stops tracking the Array once the Array
+            reallocates (when append grows it, or pops and deletions shrink it). Use copy() for an
+            independent Array.
+
+        Examples:
+            >>> array = Array([0, 1, 2, 3, 4, 5], int)
+            >>> evens = array[::2]
+            >>> evens[1] = 20
+            >>> array[2]
+            20
+        """
+        __slots__ = ('_array', '_elements')
+
+        def __init__(self, array: Array, elements: Sequence[T]) -> None:
+            self._array = array
+            self._elements = elements
+
+        @overload
+        def __getitem__(self, index: int) -> T: ...
+        @overload
+        def __getitem__(self, index: slice) -> Array.View: ...
+        def __getitem__(self, index: int | slice) -> T | Array.View:
+            if isinstance(index, slice):
+                return Array.View(self._array, self._elements[index])
+            elif isinstance(index, int):
+                if index < 0 or index >= len(self._elements):
+                    raise IndexError("Index out of bounds")
+                return self._elements[index]
+            raise TypeError("Invalid argument type")
+
+        def __setitem__(self, index: int | slice, item: T | Sequence[T]) -> None:
+            if isinstance(index, slice):
+                items = list(item)
+                for each in items:
+                    self._array._validate_item(each)
+                self._elements[index] = items
+            elif isinstance(index, int):
+                if index < 0 or index >= len(self._elements):
+                    raise IndexError("Index out of bounds")
+                self._array._validate_item(item)
+                self._elements[index] = item
+            else:
+                raise TypeError("Invalid argument type")
+
+        def __len__(self) -> int:
+            return len(self._elements)
+
+        def __iter__(self) -> Iterator[T]:
+            return iter(self._elements)
+
+        def __reversed__(self) -> Iterator[T]:
+            return iter(self._elements[::-1])
+
+        def __contains__(self, item: Any) -> bool:
+            return item in self._elements
+
+        def __eq__(self, other: object) -> bool:
+            if not isinstance(other, (Array, Array.View, list, tuple)):
+                return False
+            return len(self) == len(other) and all(mine == theirs for mine, theirs in zip(self, other))
+
+        def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+            items = self._elements
+            if isinstance(items, np.ndarray):
+                return np.array(items, dtype=dtype, copy=copy)
+            if copy is False:
+                raise ValueError("a view of a list-backed Array cannot be converted without a copy")
+            return Array(list(items), self._array.data_type, copy='none').__array__(dtype)
+
+        def copy(self) -> Array[T]:
+            """ The items of the view as a new Array, with the default backend, that shares nothing with this one. """
+            return Array(self._elements, self._array.data_type)
+
+        def __str__(self) -> str:
+            return f'[{", ".join(str(item) for item in self._elements)}]'
+
+        def __repr__(self) -> str:
+            return f'Array.View {self.__str__()}, Length: {len(self._elements)}'
     
 
+def _accepted_types(data_type: type) -> type | tuple[type, ...]:
+    """ The types an element of an Array of `data_type` may be given as. numpy scalar types, dtypes and dtype
+        strings map to the matching Python types as well, and Python numeric types accept numpy scalars,
+        since the backing ndarray converts between them.
+    """
+    if data_type is object:
+        return object
+    if data_type in _PYTHON_TYPES:
+        return _PYTHON_TYPES[data_type]
+    if isinstance(data_type, type) and not issubclass(data_type, np.generic):
+        return data_type
+    try:
+        kind = np.dtype(data_type).kind
+    except TypeError:
+        return data_type
+    return _DTYPE_KIND_TYPES.get(kind, object)
+
+
+def _numeric_dtype(data_type: type) -> np.dtype | None:
+    """ The NumPy dtype for `data_type` if it is a bool, integer, float or complex type, else None. """
+    if data_type is object:
+        return None
+    if isinstance(data_type, type) and not issubclass(data_type, np.generic) and data_type not in _PYTHON_TYPES:
+        return None
+    try:
+        dtype = np.dtype(data_type)
+    except TypeError:
+        return None
+    return dtype if dtype.kind in 'biufc' else None
+
+
+def _radix_order(items: np.ndarray) -> np.ndarray:
+    """ The stable sorting permutation of integer `items`, by LSD radix sort: one byte per pass, and only
+        as many passes as the span from the smallest to the largest item needs. Each pass is a stable
+        argsort of uint8 digits, which NumPy runs as a counting sort.
+    """
+    if items.dtype.kind == 'i':
+        # Flipping the sign bit maps signed order onto unsigned order.
+        keys = items.astype(np.int64).view(np.uint64) ^ np.uint64(1 << 63)
+    else:
+        keys = items.astype(np.uint64)
+    keys -= keys.min() if len(keys) else np.uint64(0)
+    passes = (int(keys.max()).bit_length() + 7) // 8 if len(keys) else 0
+    order = np.arange(len(keys))
+    for shift in range(0, 8 * passes, 8):
+        digits = (keys[order] >> np.uint64(shift)).astype(np.uint8)
+        order = order[np.argsort(digits, kind='stable')]
+    return order
+
+
+def _select_backend(backend: ArrayBackend | str | None, numeric_dtype: np.dtype | None) -> ArrayBackend:
+    if backend is None:
+        backend = 'list' if numeric_dtype is None else 'numpy'
+    if isinstance(backend, ArrayBackend):
+        return backend
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be an ArrayBackend or one of {', '.join(BACKENDS)}")
+    return BACKENDS[backend]()
+
+
+def _is_buffer(source: object) -> bool:
+    if isinstance(source, (np.ndarray, bytes, bytearray, memoryview)):
+        return True
+    try:
+        memoryview(source)
+    except TypeError:
+        return False
+    return True
+
+
+_COPIERS: dict[str, Callable[[object], object] | None] = {
+    'deep': copy.deepcopy,
+    'shallow': copy.copy,
+    'none': None,
+}
+
+_PYTHON_TYPES: dict[type, tuple[type, ...]] = {
+    bool: (bool, np.bool_),
+    int: (int, np.integer),
+    float: (float, int, np.floating, np.integer),
+    complex: (complex, float, int, np.number),
+    str: (str, np.str_),
+}
+_DTYPE_KIND_TYPES: dict[str, tuple[type, ...]] = {
+    'b': _PYTHON_TYPES[bool],
+    'i': _PYTHON_TYPES[int],
+    'u': _PYTHON_TYPES[int],
+    'f': _PYTHON_TYPES[float],
+    'c': _PYTHON_TYPES[complex],
+    'U': _PYTHON_TYPES[str],
+}
+
+
 if __name__ == '__main__':
     filename = os.path.basename(__file__)
     print(f'This is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
\ No newline at end of file
@@ -51,17 +51,45 @@ class Array2D(IArray2D[T]):
     def __init__(self, starting_sequence: Sequence[Sequence[T]]=[[]], data_type=object) -> None:
         self.data_type = data_type
         
-        if not isinstance(starting_sequence) or not all(isinstance(row, Sequence) for row in starting_sequence):
+        if isinstance(starting_sequence, str) or not isinstance(starting_sequence, Sequence) \
+                or not all(isinstance(row, Sequence) and not isinstance(row, str) for row in starting_sequence):
             raise ValueError
         
         self.rows_len = len(starting_sequence)
-        self.cols_len = len(starting_sequence[0] if self.rows_len > 0 else 0)
+        self.cols_len = len(starting_sequence[0]) if self.rows_len > 0 else 0
 
         if any(len(row) != self.cols_len for row in starting_sequence):
             raise ValueError
         
         py_list = [elem for row in starting_sequence for elem in row]
-        self.elements2d = Array(starting_sequence=py_list, data_type = data_type)
+        try:
+            self.elements2d = Array(starting_sequence=py_list, data_type = data_type)
+        except TypeError as error:
+            raise ValueError(f"Array2D items must all be of type {data_type.__name__}") from error
+
+    @staticmethod
+    def from_buffer(buffer, rows: int, cols: int, data_type: type | None = None) -> Array2D:
+        """ A rows x cols Array2D over `buffer` in row-major order, sharing its memory as Array.from_buffer does. """
+        elements = Array.from_buffer(buffer, data_type)
+        if len(elements) != rows * cols:
+            raise ValueError(f"buffer holds {len(elements)} items, not {rows} x {cols}")
+        array2d = Array2D.__new__(Array2D)
+        array2d.data_type = elements.data_type
+        array2d.rows_len = rows
+        array2d.cols_len = cols
+        array2d.elements2d = elements
+        return array2d
+
+    def __array__(self, dtype=None, copy: bool | None = None) -> np.ndarray:
+        """ The items as a rows x cols ndarray; a view for NumPy-backed data, as for Array.__array__. """
+        return self.elements2d.__array__(dtype, copy).reshape(self.rows_len, self.cols_len)
+
+    @property
+    def __array_interface__(self) -> dict:
+        return {**self.elements2d.__array_interface__, 'shape': (self.rows_len, self.cols_len)}
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return memoryview(np.asarray(memoryview(self.elements2d)).reshape(self.rows_len, self.cols_len))
 
     @staticmethod
     def empty(rows: int=0, cols: int=0, data_type: type=object) -> Array2D:
@@ -88,7 +116,7 @@ class Array2D(IArray2D[T]):
         return f'[{", ".join(f"{str(row)}" for row in self)}]'
     
     def __repr__(self) -> str: 
-        return f'[{Array2D(rows={self.rows_len}, cols ={self.cols_len})}]'
+        return f'Array2D {self.rows_len} Rows x {self.cols_len} Columns, items: {self.__str__()}'
 
 if __name__ == '__main__':
     filename = os.path.basename(__file__)
@@ -0,0 +1,254 @@
+""" Storage backends for datastructures.array.Array.
+
+    A backend decides what the Array's physical buffer is: a Python list (ListBackend, the default for
+    object and other non-numeric data types), a typed NumPy array (NumpyBackend, the default for bool,
+    integer, float and complex data types) or a NumPy memmap over a file (MemmapBackend). Array does its
+    own bookkeeping; all a buffer has to support is int and slice indexing, equal-length slice assignment
+    and len(), which lists and ndarrays share.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from itertools import islice
+import os
+import struct
+import tempfile
+from typing import Any, Iterator, MutableSequence
+
+import numpy as np
+
+
+class ArrayBackend(ABC):
+    """ Allocates and fills an Array's physical buffer. """
+
+    name: str = ''
+
+    @abstractmethod
+    def allocate(self, size: int, data_type: type) -> MutableSequence:
+        """ A buffer of `size` unset slots for items of `data_type`. """
+        pass
+
+    @abstractmethod
+    def from_items(self, items: Sequence | np.ndarray, data_type: type, share: bool) -> MutableSequence:
+        """ A buffer holding exactly `items`, which have already been validated and copied as needed.
+            With `share`, `items` itself may be used as the buffer when it already is one of the right kind.
+        """
+        pass
+
+    @abstractmethod
+    def view(self, buffer: MutableSequence, start: int, stop: int) -> Sequence:
+        """ A window over buffer[start:stop] that reads and writes through to the buffer. """
+        pass
+
+    def resize(self, buffer: MutableSequence, size: int, data_type: type, start: int, count: int, at_front: bool=False) -> tuple[MutableSequence, int]:
+        """ Moves the `count` items at `start` into a buffer of `size` slots and returns it with the items'
+            new start. The items are centred; an odd free slot goes to the front when `at_front` is True.
+        """
+        resized = self.allocate(size, data_type)
+        new_start = (size - count + at_front) // 2
+        resized[new_start:new_start + count] = buffer[start:start + count]
+        return resized, new_start
+
+    def flush(self, buffer: MutableSequence, start: int, count: int) -> None:
+        """ Writes the buffer, and where its `count` items start, to backing storage, if there is any. """
+        pass
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}()'
+
+
+class NumpyBackend(ArrayBackend):
+    name = 'numpy'
+
+    def allocate(self, size: int, data_type: type) -> np.ndarray:
+        return np.empty(size, dtype=data_type)
+
+    def from_items(self, items: Sequence | np.ndarray, data_type: type, share: bool) -> np.ndarray:
+        dtype = np.dtype(data_type)
+        if dtype == object:
+            # fromiter stores each item as is; np.array would unpack items that are sequences themselves.
+            return np.fromiter(items, dtype=object, count=len(items))
+        return np.asarray(items, dtype=dtype) if share else np.array(items, dtype=dtype)
+
+    def view(self, buffer: np.ndarray, start: int, stop: int) -> np.ndarray:
+        return buffer[start:stop]
+
+
+class ListBackend(ArrayBackend):
+    """ Stores items in a Python list, so reads and writes of objects skip NumPy's boxing and dtype checks. """
+    name = 'list'
+
+    def allocate(self, size: int, data_type: type) -> list:
+        return [None] * size
+
+    def from_items(self, items: Sequence | np.ndarray, data_type: type, share: bool) -> list:
+        if isinstance(items, np.ndarray):
+            return items.tolist()
+        return items if share and type(items) is list else list(items)
+
+    def view(self, buffer: list, start: int, stop: int) -> _ListWindow:
+        return _ListWindow(buffer, range(start, stop))
+
+
+class MemmapBackend(NumpyBackend):
+    """ Keeps a numeric buffer in the file at `path` through np.memmap, so it is paged in from disk on
+        demand instead of being held in memory. The file starts with a 64-byte header recording the dtype
+        and where the items are; flush() brings that header up to date, and Array.open() reads it back.
+
+        Growing extends the file in place and maps it again, so items at the back never move. The file
+        never shrinks: other mappings of it, from views or from other processes, would fault on truncated
+        pages. Allocating a fresh buffer (a new Array, or clear()) writes a new file next to `path` and
+        renames it over `path`; mappings of the replaced file stay valid until they are released.
+
+        `mode` is 'w+' to create the file, 'r+' to attach to it for reading and writing, or 'r' to attach
+        read-only. Attaching is what Array.open() does.
+    """
+    name = 'memmap'
+
+    def __init__(self, path: str | os.PathLike, mode: str = 'w+') -> None:
+        if mode not in ('r', 'r+', 'w+'):
+            raise ValueError("mode must be 'r', 'r+' or 'w+'")
+        self.path = os.fspath(path)
+        self.mode = mode
+        self._map: np.memmap | None = None
+        self._view: np.ndarray | None = None
+        self._dtype: np.dtype | None = None
+
+    def allocate(self, size: int, data_type: type) -> np.ndarray:
+        dtype = np.dtype(data_type)
+        if dtype.kind not in 'biufc':
+            raise TypeError(f"MemmapBackend needs a numeric data type, got {dtype}")
+        self._writable()
+        directory, filename = os.path.split(os.path.abspath(self.path))
+        descriptor, temporary = tempfile.mkstemp(prefix=f'{filename}.', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                file.write(_header(dtype, 0, 0))
+                file.truncate(_HEADER_SIZE + size * dtype.itemsize)
+            self._dtype = dtype
+            buffer = self._map_file(temporary, 'r+', size)
+            os.replace(temporary, self.path)
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+        return buffer
+
+    def from_items(self, items: Sequence | np.ndarray, data_type: type, share: bool) -> np.ndarray:
+        if share and items is self._view:
+            return items
+        buffer = self.allocate(len(items), data_type)
+        buffer[:] = items
+        return buffer
+
+    def resize(self, buffer: np.ndarray, size: int, data_type: type, start: int, count: int, at_front: bool=False) -> tuple[np.ndarray, int]:
+        if size <= len(buffer):
+            return buffer, start
+        self._writable()
+        with open(self.path, 'r+b') as file:
+            file.truncate(_HEADER_SIZE + size * self._dtype.itemsize)
+        resized = self._map_file(self.path, 'r+', size)
+        if not at_front:
+            return resized, start
+        new_start = (size - count + 1) // 2
+        resized[new_start:new_start + count] = resized[start:start + count]
+        return resized, new_start
+
+    def attach(self) -> tuple[np.ndarray, np.dtype, int, int]:
+        """ Maps an existing file and returns its buffer, dtype, and the start and count of its items. """
+        if self.mode == 'w+':
+            raise ValueError("attach needs mode 'r' or 'r+'")
+        with open(self.path, 'rb') as file:
+            raw = file.read(_HEADER_SIZE)
+            file_size = os.fstat(file.fileno()).st_size
+        if len(raw) < _HEADER_SIZE or raw[:8] != _MAGIC:
+            raise ValueError(f"{self.path} is not an Array file")
+        _, dtype_string, start, count = _HEADER.unpack_from(raw)
+        self._dtype = np.dtype(dtype_string.rstrip(b'\0').decode('ascii'))
+        size = (file_size - _HEADER_SIZE) // self._dtype.itemsize
+        if start + count > size:
+            raise ValueError(f"{self.path} is truncated")
+        return self._map_file(self.path, self.mode, size), self._dtype, start, count
+
+    def flush(self, buffer: np.ndarray, start: int, count: int) -> None:
+        if self.mode == 'r':
+            return
+        if self._map is not None:
+            self._map.flush()
+        with open(self.path, 'r+b') as file:
+            file.write(_header(self._dtype, start, count))
+            os.fsync(file.fileno())
+
+    def _map_file(self, path: str, mode: str, size: int) -> np.ndarray:
+        if not size:
+            self._map = None
+            self._view = np.empty(0, dtype=self._dtype)
+        else:
+            self._map = np.memmap(path, dtype=self._dtype, mode=mode, offset=_HEADER_SIZE, shape=(size,))
+            # A plain ndarray view of the map skips np.memmap's per-access subclass overhead.
+            self._view = self._map.view(np.ndarray)
+        return self._view
+
+    def _writable(self) -> None:
+        if self.mode == 'r':
+            raise ValueError(f"{self.path} was opened read-only")
+
+    def __repr__(self) -> str:
+        return f'MemmapBackend({self.path!r}, {self.mode!r})'
+
+
+_MAGIC = b'DSARRAY1'
+_HEADER = struct.Struct('<8s16sQQ')
+_HEADER_SIZE = 64
+
+
+def _header(dtype: np.dtype, start: int, count: int) -> bytes:
+    return _HEADER.pack(_MAGIC, dtype.str.encode('ascii'), start, count).ljust(_HEADER_SIZE, b'\0')
+
+
+class _ListWindow(Sequence):
+    """ Write-through window over part of a list, the ListBackend counterpart of an ndarray view. """
+    __slots__ = ('_buffer', '_positions')
+
+    def __init__(self, buffer: list, positions: range) -> None:
+        self._buffer = buffer
+        self._positions = positions
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return _ListWindow(self._buffer, self._positions[index])
+        return self._buffer[self._positions[index]]
+
+    def __setitem__(self, index: int | slice, item: Any) -> None:
+        if isinstance(index, slice):
+            positions = self._positions[index]
+            items = list(item)
+            if len(items) != len(positions):
+                raise ValueError(f"cannot assign {len(items)} items to a window of {len(positions)}")
+            for position, each in zip(positions, items):
+                self._buffer[position] = each
+        else:
+            self._buffer[self._positions[index]] = item
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __iter__(self) -> Iterator[Any]:
+        positions = self._positions
+        if positions.step == 1:
+            return islice(self._buffer, positions.start, positions.stop)
+        buffer = self._buffer
+        return (buffer[position] for position in positions)
+
+
+BACKENDS: dict[str, type[ArrayBackend]] = {
+    NumpyBackend.name: NumpyBackend,
+    ListBackend.name: ListBackend,
+}
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'OOPS!\nThis is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import Callable, Iterator, Optional, Tuple
+
+from datastructures.hashmap import HashMap
+from datastructures.ihashmap import KT, VT, IHashMap
+
+_MASK64 = (1 << 64) - 1
+_MIX1 = 0xBF58476D1CE4E5B9
+_MIX2 = 0x94D049BB133111EB
+
+
+class ConcurrentHashMap(IHashMap[KT, VT]):
+    """
+    Thread-safe HashMap split into lock-striped segments. Each segment is an ordinary HashMap
+    guarded by its own lock, so threads working on keys in different segments never wait on
+    each other. A key's hash is computed once, outside any lock, and the segment's buckets use the
+    same hash, so nothing is hashed twice. The segment comes from the upper bits of a separate mix
+    of the hash (the SplitMix64 finalizer): chaining segments index by its low bits and
+    open-addressing segments by the upper bits of its Fibonacci product, and picking the segment
+    from either would crowd each segment's keys into a fraction of its buckets.
+
+    Iteration is weakly consistent: segments are snapshotted one at a time under their lock, so an
+    iterator never raises because of concurrent writes, reflects every write that finished before it
+    reached a segment, and may or may not reflect writes that happen while it is running.
+    """
+
+    def __init__(self, number_of_buckets=64, load_factor=0.75, custom_hash_function: Optional[Callable[[KT], int]]=None, hash_strategy: str='fast', segments: int=16, storage: str='chaining') -> None:
+        if segments < 1:
+            raise ValueError("segments must be at least 1")
+        segment_count = 1
+        while segment_count < segments:
+            segment_count *= 2
+        self._hash_function = HashMap._select_hash_function(custom_hash_function, hash_strategy)
+        buckets_per_segment = max(1, number_of_buckets // segment_count)
+        self._segments: list[HashMap[KT, VT]] = [HashMap(buckets_per_segment, load_factor, custom_hash_function=self._hash_function, storage=storage) for _ in range(segment_count)]
+        self._locks: list[threading.RLock] = [threading.RLock() for _ in range(segment_count)]
+        self._shift: int = 65 - segment_count.bit_length()
+
+    def _segment_index(self, key_hash: int) -> int:
+        if len(self._segments) == 1:
+            return 0
+        mixed = key_hash & _MASK64
+        mixed = ((mixed ^ (mixed >> 30)) * _MIX1) & _MASK64
+        mixed = ((mixed ^ (mixed >> 27)) * _MIX2) & _MASK64
+        return (mixed ^ (mixed >> 31)) >> self._shift
+
+    def __getitem__(self, key: KT) -> VT:
+        key_hash = self._hash_function(key)
+        index = self._segment_index(key_hash)
+        with self._locks[index]:
+            value = self._segments[index]._get_hashed(key, key_hash, _MISSING)
+        if value is _MISSING:
+            raise KeyError
+        return value
+
+    def get(self, key: KT, default: Optional[VT]=None) -> Optional[VT]:
+        key_hash = self._hash_function(key)
+        index = self._segment_index(key_hash)
+        with self._locks[index]:
+            return self._segments[index]._get_hashed(key, key_hash, default)
+
+    def __setitem__(self, key: KT, value: VT) -> None:
+        key_hash = self._hash_function(key)
+        index = self._segment_index(key_hash)
+        segment = self._segments[index]
+        with self._locks[index]:
+            segment._reserve(len(segment) + 1)
+            segment._store(key, key_hash, value)
+
+    def compute_if_absent(self, key: KT, mapping_function: Callable[[KT], VT]) -> VT:
+        """ Returns the value for `key`, computing and storing it with `mapping_function(key)` if it is missing.
+            The check and the insert happen under one segment lock, so the function runs at most once per key
+            even when several threads race on it. The function may read the map but should be quick, since
+            it blocks every other key in the same segment while it runs.
+
+        Examples:
+            >>> cache = ConcurrentHashMap[str, int]()
+            >>> cache.compute_if_absent('answer', lambda key: 42)
+            42
+
+        Args:
+            key (KT): The key to look up.
+            mapping_function (Callable[[KT], VT]): Produces the value when the key is absent.
+        Returns:
+            VT: The existing or newly computed value.
+        """
+        key_hash = self._hash_function(key)
+        index = self._segment_index(key_hash)
+        segment = self._segments[index]
+        with self._locks[index]:
+            value = segment._get_hashed(key, key_hash, _MISSING)
+            if value is _MISSING:
+                value = mapping_function(key)
+                segment._reserve(len(segment) + 1)
+                segment._store(key, key_hash, value)
+            return value
+
+    def __delitem__(self, key: KT) -> None:
+        key_hash = self._hash_function(key)
+        index = self._segment_index(key_hash)
+        with self._locks[index]:
+            deleted = self._segments[index]._delete_hashed(key, key_hash)
+        if not deleted:
+            raise KeyError
+
+    def __contains__(self, key: KT) -> bool:
+        key_hash = self._hash_function(key)
+        index = self._segment_index(key_hash)
+        with self._locks[index]:
+            return self._segments[index]._get_hashed(key, key_hash, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        # Segment sizes are read without locking; the total is exact when no writes are in flight.
+        return sum(len(segment) for segment in self._segments)
+
+    def items(self) -> Iterator[Tuple[KT, VT]]:
+        for segment, lock in zip(self._segments, self._locks):
+            with lock:
+                snapshot = list(segment.items())
+            yield from snapshot
+
+    def keys(self) -> Iterator[KT]:
+        for key, _ in self.items():
+            yield key
+
+    def values(self) -> Iterator[VT]:
+        for _, value in self.items():
+            yield value
+
+    def __iter__(self) -> Iterator[KT]:
+        return self.keys()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IHashMap):
+            return False
+        if len(self) != len(other):
+            return False
+        for key, value in self.items():
+            if key not in other or other[key] != value:
+                return False
+        return True
+
+    def __str__(self) -> str:
+        return "{" + ", ".join(f"{key}: {value}" for key, value in self.items()) + "}"
+
+    def __repr__(self) -> str:
+        return f"ConcurrentHashMap({str(self)})"
+
+
+_MISSING = object()
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'OOPS!\nThis is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
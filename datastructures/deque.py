@@ -1,7 +1,8 @@
 import os
 from datastructures.iqueue import IQueue
 from datastructures.linkedlist import LinkedList
-from typing import TypeVar
+from datastructures.validation import ValidationMode
+from typing import Optional, TypeVar
 
 T = TypeVar('T')
 
@@ -10,8 +11,8 @@ class Deque[T](IQueue[T]):
     A double-ended queue (deque) implementation.
     """
 
-    def __init__(self, data_type: type = object) -> None:
-        self._list = LinkedList(data_type=data_type)
+    def __init__(self, data_type: type = object, recycle_nodes: int = 0, validation: Optional[ValidationMode | str] = None) -> None:
+        self._list = LinkedList(data_type=data_type, recycle_nodes=recycle_nodes, validation=validation)
 
     def enqueue(self, item: T) -> None:
         self._list.append(item)
@@ -1,5 +1,11 @@
+from __future__ import annotations
+
 import copy
-from typing import Callable, Iterator, Optional, Tuple
+from dataclasses import dataclass
+from itertools import islice
+import sys
+import time
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, Tuple
 from datastructures.ihashmap import KT, VT, IHashMap
 from datastructures.array import Array
 import pickle
@@ -8,94 +14,403 @@ import hashlib
 from datastructures.linkedlist import LinkedList
 
 class HashMap(IHashMap[KT, VT]):
+    _storage: str = 'chaining'
+
+    def __new__(cls, *args, storage: Optional[str]=None, **kwargs) -> HashMap[KT, VT]:
+        storage = cls._storage if storage is None else storage
+        if storage not in _STORAGE_OPTIONS:
+            raise ValueError(f"Unknown storage: {storage!r}")
+        for other_storage, options in _STORAGE_OPTIONS.items():
+            misplaced = [option for option in options if option in kwargs and other_storage != storage]
+            if misplaced:
+                raise ValueError(f"{', '.join(misplaced)} only applies to storage={other_storage!r}")
+        if storage == 'open_addressing' and cls is HashMap:
+            from datastructures.openaddressinghashmap import OpenAddressingHashMap
+            cls = OpenAddressingHashMap
+        return super().__new__(cls)
 
-    def __init__(self, number_of_buckets=7, load_factor=0.75, custom_hash_function: Optional[Callable[[KT], int]]=None) -> None:
-        self._buckets: Array[LinkedList[Tuple[KT, VT]]] = Array(number_of_buckets)
-        for i in range(number_of_buckets):
-            self._buckets[i] = LinkedList()
+    def __init__(self, number_of_buckets=7, load_factor=0.75, custom_hash_function: Optional[Callable[[KT], int]]=None, hash_strategy: str='fast', storage: str='chaining', incremental_resize: bool=False, migration_batch: int=4) -> None:
+        if migration_batch < 1:
+            raise ValueError("migration_batch must be at least 1")
+        self._buckets: Array[Optional[LinkedList[Tuple[int, KT, VT]]]] = self._new_buckets(number_of_buckets)
         self._count: int = 0
         self._load_factor_threshold: float = load_factor
-        self._hash_function = custom_hash_function or self._default_hash_function
+        self._hash_function = self._select_hash_function(custom_hash_function, hash_strategy)
+        self._incremental_resize: bool = incremental_resize
+        self._migration_batch: int = migration_batch
+        self._old_buckets: Optional[Array[Optional[LinkedList[Tuple[int, KT, VT]]]]] = None
+        self._migration_index: int = 0
+        self._reset_instrumentation()
+
+    def _reset_instrumentation(self) -> None:
+        self._equality_checks: int = 0
+        self._equality_checks_avoided: int = 0
+        self._resize_count: int = 0
+        self._resize_seconds: float = 0.0
+        self._sampler: Optional[_LatencySampler] = None
+
+    @staticmethod
+    def _select_hash_function(custom_hash_function: Optional[Callable[[KT], int]], hash_strategy: str) -> Callable[[KT], int]:
+        if custom_hash_function is not None:
+            return custom_hash_function
+        if hash_strategy == 'fast':
+            return HashMap._fast_hash_function
+        if hash_strategy == 'stable':
+            return HashMap._default_hash_function
+        raise ValueError(f"Unknown hash strategy: {hash_strategy!r}")
+
+    @staticmethod
+    def _new_buckets(number_of_buckets: int) -> Array[Optional[LinkedList[Tuple[int, KT, VT]]]]:
+        """ Buckets start out as None and get their LinkedList on first write, which keeps allocating a large table cheap. """
+        return Array([None] * number_of_buckets, copy='none')
+
+    def _bucket_for(self, key_hash: int) -> LinkedList[Tuple[int, KT, VT]]:
+        """ Bucket a write for `key_hash` should go to. Writes drive the incremental migration, reads never do,
+            so an iteration that performs lookups does not see entries move underneath it.
+        """
+        if self._old_buckets is not None:
+            self._migrate_step(key_hash)
+        bucket_index = key_hash % len(self._buckets)
+        bucket = self._buckets[bucket_index]
+        if bucket is None:
+            bucket = LinkedList()
+            self._buckets[bucket_index] = bucket
+        return bucket
+
+    def _place(self, entry: Tuple[int, KT, VT]) -> None:
+        bucket_index = entry[0] % len(self._buckets)
+        bucket = self._buckets[bucket_index]
+        if bucket is None:
+            bucket = LinkedList()
+            self._buckets[bucket_index] = bucket
+        bucket.append(entry)
 
-    def _get_bucket_index(self, key: KT, bucket_size: int) -> int:
-        return self._hash_function(key) % bucket_size
+    def _search(self, bucket: Optional[LinkedList[Tuple[int, KT, VT]]], key: KT, key_hash: int) -> Optional[LinkedList.Node]:
+        """ Walks a bucket comparing the stored hash first, so `==` only runs on entries whose hash matches. """
+        if bucket is None:
+            return None
+        node = bucket.head
+        skipped = 0
+        while node:
+            entry = node.data
+            if entry[0] == key_hash:
+                k = entry[1]
+                if k is key:
+                    break
+                self._equality_checks += 1
+                if k == key:
+                    break
+            else:
+                skipped += 1
+            node = node.next
+        self._equality_checks_avoided += skipped
+        return node
+
+    def _find_node(self, key: KT, key_hash: int) -> Optional[LinkedList.Node]:
+        node = self._search(self._buckets[key_hash % len(self._buckets)], key, key_hash)
+        if node is None and self._old_buckets is not None:
+            node = self._search(self._old_buckets[key_hash % len(self._old_buckets)], key, key_hash)
+        return node
+
+    def _get_hashed(self, key: KT, key_hash: int, default: object) -> VT | object:
+        node = self._find_node(key, key_hash)
+        return default if node is None else node.data[2]
+
+    @property
+    def equality_checks(self) -> int:
+        """ Number of key `==` calls made by lookups, inserts and deletes. """
+        return self._equality_checks
+
+    @property
+    def equality_checks_avoided(self) -> int:
+        """ Number of entries skipped because their stored hash did not match, each one a `==` call saved. """
+        return self._equality_checks_avoided
 
     def __getitem__(self, key: KT) -> VT:
-        bucket_index = self._get_bucket_index(key, len(self._buckets))
-        for k, v in self._buckets[bucket_index]:
-            if k == key:
-                return v
-        raise KeyError
+        if self._sampler is not None and self._sampler.due():
+            return self._sampler.time('get', self.__getitem__, key)
+        node = self._find_node(key, self._hash_function(key))
+        if node is None:
+            raise KeyError
+        return node.data[2]
+
+    def get(self, key: KT, default: Optional[VT]=None) -> Optional[VT]:
+        """ Returns the value for `key`, or `default` when it is missing, hashing the key once. """
+        return self._get_hashed(key, self._hash_function(key), default)
 
-    def __setitem__(self, key: KT, value: VT) -> None:        
+    def __setitem__(self, key: KT, value: VT) -> None:
+        if self._sampler is not None and self._sampler.due():
+            return self._sampler.time('set', self.__setitem__, key, value)
         if self._count / len(self._buckets) >= self._load_factor_threshold:
             self._resize()
-        bucket_index = self._get_bucket_index(key, len(self._buckets))
-        bucket = self._buckets[bucket_index]
-        for i, (k, v) in enumerate(bucket):
-            if k == key:
-                bucket[i] = (key, value)
-                return
-        bucket.append((key, value))
+        self._store(key, self._hash_function(key), value)
+
+    def _store(self, key: KT, key_hash: int, value: VT) -> None:
+        """ Inserts or updates an entry whose hash is already known. Does not check the load factor. """
+        bucket = self._bucket_for(key_hash)
+        node = self._search(bucket, key, key_hash)
+        if node is not None:
+            node.data = (key_hash, key, value)
+            return
+        bucket.append((key_hash, key, value))
         self._count += 1
 
-    def _resize(self) -> None:
+    def _reserve(self, expected_size: int) -> None:
+        """ Grows the bucket array once, with a blocking rebuild, so `expected_size` entries fit under the load factor. """
+        capacity = len(self._buckets)
+        while expected_size / capacity >= self._load_factor_threshold:
+            capacity *= 2
+        if capacity != len(self._buckets):
+            self._resize(capacity, incremental=False)
+
+    def _resize(self, new_capacity: Optional[int]=None, incremental: Optional[bool]=None) -> None:
+        """ Grows the bucket array (doubling by default). Entries are placed with their stored hash, so no key is re-hashed.
+            With `incremental_resize` the old buckets are kept and drained a few at a time by later operations.
+        """
+        if self._old_buckets is not None:
+            self._finish_migration()
+        start = time.perf_counter()
         old_buckets = self._buckets
-        new_capacity = len(old_buckets) * 2
-        self._buckets = Array(new_capacity)
-        for i in range(new_capacity):
-            self._buckets[i] = LinkedList()
-        old_count = self._count
-        self._count = 0
-        for bucket in old_buckets:
-            for k, v in bucket:
-                self[k] = v
-        assert self._count == old_count
+        self._buckets = self._new_buckets(new_capacity or len(old_buckets) * 2)
+        if self._incremental_resize if incremental is None else incremental:
+            self._old_buckets = old_buckets
+            self._migration_index = 0
+        else:
+            for bucket in old_buckets:
+                if bucket is not None:
+                    node = bucket.head
+                    while node:
+                        self._place(node.data)
+                        node = node.next
+        self._resize_count += 1
+        self._resize_seconds += time.perf_counter() - start
+
+    def _migrate_bucket(self, bucket_index: int) -> None:
+        bucket = self._old_buckets[bucket_index]
+        if bucket is None:
+            return
+        node = bucket.head
+        while node:
+            self._place(node.data)
+            node = node.next
+        self._old_buckets[bucket_index] = None
+
+    def _migrate_step(self, key_hash: int) -> None:
+        """ Moves the old bucket that `key_hash` maps to, plus up to `migration_batch` buckets from the migration cursor. """
+        start = time.perf_counter()
+        old_capacity = len(self._old_buckets)
+        self._migrate_bucket(key_hash % old_capacity)
+        stop = min(self._migration_index + self._migration_batch, old_capacity)
+        for bucket_index in range(self._migration_index, stop):
+            self._migrate_bucket(bucket_index)
+        self._migration_index = stop
+        if stop == old_capacity:
+            self._old_buckets = None
+        self._resize_seconds += time.perf_counter() - start
+
+    def _finish_migration(self) -> None:
+        start = time.perf_counter()
+        for bucket_index in range(self._migration_index, len(self._old_buckets)):
+            self._migrate_bucket(bucket_index)
+        self._old_buckets = None
+        self._resize_seconds += time.perf_counter() - start
+
+    def _entries(self) -> Iterator[Tuple[int, KT, VT]]:
+        tables = [self._buckets] if self._old_buckets is None else [self._buckets, self._old_buckets]
+        for buckets in tables:
+            for bucket in buckets:
+                if bucket is not None:
+                    node = bucket.head
+                    while node:
+                        yield node.data
+                        node = node.next
 
     def keys(self) -> Iterator[KT]:
-        for bucket in self._buckets:
-            for k, _ in bucket:
-                yield k
+        for _, k, _ in self._entries():
+            yield k
     
     def values(self) -> Iterator[VT]:
-        for bucket in self._buckets:
-            for _, v in bucket:
-                yield v
+        for _, _, v in self._entries():
+            yield v
 
     def items(self) -> Iterator[Tuple[KT, VT]]:
-        for bucket in self._buckets:
-            for pair in bucket:
-                yield pair
+        for _, k, v in self._entries():
+            yield (k, v)
             
     def __delitem__(self, key: KT) -> None:
-        bucket_index = self._get_bucket_index(key, len(self._buckets))
-        bucket = self._buckets[bucket_index]
-        for i, (k, _) in enumerate(bucket):
-            if k == key:
-                del bucket[i]
-                self._count -= 1
-                return
-        raise KeyError
+        if not self._delete_hashed(key, self._hash_function(key)):
+            raise KeyError
+
+    def _delete_hashed(self, key: KT, key_hash: int) -> bool:
+        bucket = self._bucket_for(key_hash)
+        node = self._search(bucket, key, key_hash)
+        if node is None:
+            return False
+        bucket.remove_node(node)
+        self._count -= 1
+        return True
     
     def __contains__(self, key: KT) -> bool:
-        bucket_index = self._get_bucket_index(key, len(self._buckets))
-        for k, _ in self._buckets[bucket_index]:
-            if k == key:
-                return True
-        return False
-
+        return self._find_node(key, self._hash_function(key)) is not None
 
     def __len__(self) -> int:
         return self._count
+
+    @classmethod
+    def from_items(cls, items: Iterable[Tuple[KT, VT]] | Mapping[KT, VT], expected_size: Optional[int]=None, **options) -> HashMap[KT, VT]:
+        """ Builds a map from key/value pairs (or a mapping) in a single pass.
+
+        Examples:
+            >>> hashmap = HashMap.from_items(((i, str(i)) for i in range(1000)), expected_size=1000)
+            >>> hashmap[999]
+            '999'
+
+        Args:
+            items: The key/value pairs, or a mapping, to load.
+            expected_size (int): Number of entries to pre-size for. Defaults to len(items) when available.
+            options: Passed to the HashMap constructor (storage, hash_strategy, ...).
+        Returns:
+            HashMap[KT, VT]: The populated map.
+        """
+        hashmap = cls(**options)
+        hashmap.update(items, expected_size=expected_size)
+        return hashmap
+
+    def update(self, items: Iterable[Tuple[KT, VT]] | Mapping[KT, VT], expected_size: Optional[int]=None) -> None:
+        """ Inserts or updates every pair from a mapping or an iterable of (key, value) pairs. """
+        if hasattr(items, 'items'):
+            items = items.items()
+        self.set_many(items, expected_size=expected_size)
+
+    def set_many(self, items: Iterable[Tuple[KT, VT]], expected_size: Optional[int]=None) -> None:
+        """ Inserts or updates many pairs. The map is pre-sized once from `expected_size` (or len(items)),
+            then pairs are hashed and stored a batch at a time with a single load-factor check per batch.
+
+        Args:
+            items: An iterable of (key, value) pairs.
+            expected_size (int): Number of new entries to pre-size for.
+        """
+        if expected_size is None and hasattr(items, '__len__'):
+            expected_size = len(items)
+        if expected_size:
+            self._reserve(self._count + expected_size)
+        hash_function = self._hash_function
+        iterator = iter(items)
+        while True:
+            batch = list(islice(iterator, _BATCH_SIZE))
+            if not batch:
+                return
+            self._reserve(self._count + len(batch))
+            store = self._store
+            for key, value in batch:
+                store(key, hash_function(key), value)
+
+    def get_many(self, keys: Iterable[KT], default: Optional[VT]=None) -> list[VT]:
+        """ Returns the value for each key, in order, with `default` for missing keys. """
+        hash_function = self._hash_function
+        get_hashed = self._get_hashed
+        return [get_hashed(key, hash_function(key), default) for key in keys]
+
+    def delete_many(self, keys: Iterable[KT]) -> int:
+        """ Deletes every key that is present. Missing keys are skipped rather than raising KeyError.
+
+        Returns:
+            int: The number of entries deleted.
+        """
+        hash_function = self._hash_function
+        delete_hashed = self._delete_hashed
+        deleted = 0
+        for key in keys:
+            deleted += delete_hashed(key, hash_function(key))
+        return deleted
     
     def __iter__(self) -> Iterator[KT]:
         return self.keys()
+
+    def enable_sampling(self, every: int=100) -> None:
+        """ Times one in every `every` calls to __getitem__ and __setitem__. The results are reported by stats(). """
+        if every < 1:
+            raise ValueError("every must be at least 1")
+        self._sampler = _LatencySampler(every)
+
+    def disable_sampling(self) -> None:
+        self._sampler = None
+
+    def stats(self) -> HashMapStats:
+        """ Returns a snapshot of how the map is laid out and how it has behaved so far.
+            Walks every bucket, so it costs O(n) and is meant for diagnostics, not hot paths.
+
+        Examples:
+            >>> hashmap = HashMap.from_items((i, i) for i in range(100))
+            >>> hashmap.stats().entry_count
+            100
+
+        Returns:
+            HashMapStats: bucket count, load factor, probe histogram, resize history, memory estimate and sampled latencies.
+        """
+        histogram = self._probe_histogram()
+        sampler = self._sampler
+        return HashMapStats(
+            bucket_count=self._bucket_count(),
+            entry_count=self._count,
+            load_factor=self._count / self._bucket_count(),
+            probe_length_histogram=histogram,
+            max_probe_length=max(histogram, default=0),
+            resize_count=self._resize_count,
+            resize_seconds=self._resize_seconds,
+            bytes_per_entry=self._storage_bytes() / self._count if self._count else 0.0,
+            equality_checks=self._equality_checks,
+            equality_checks_avoided=self._equality_checks_avoided,
+            get_samples=sampler.count['get'] if sampler else 0,
+            get_mean_seconds=sampler.mean('get') if sampler else 0.0,
+            get_max_seconds=sampler.maximum['get'] if sampler else 0.0,
+            set_samples=sampler.count['set'] if sampler else 0,
+            set_mean_seconds=sampler.mean('set') if sampler else 0.0,
+            set_max_seconds=sampler.maximum['set'] if sampler else 0.0,
+        )
+
+    def _bucket_count(self) -> int:
+        return len(self._buckets)
+
+    def _probe_histogram(self) -> dict[int, int]:
+        """ Chain length -> number of buckets with that length (empty buckets included). """
+        histogram: dict[int, int] = {}
+        tables = [self._buckets] if self._old_buckets is None else [self._buckets, self._old_buckets]
+        for buckets in tables:
+            for bucket in buckets:
+                length = 0 if bucket is None else len(bucket)
+                histogram[length] = histogram.get(length, 0) + 1
+        return histogram
+
+    def _storage_bytes(self) -> int:
+        """ Estimated bytes used by the table itself: bucket slots, LinkedLists, nodes, entry tuples and stored hashes.
+            Keys and values are not counted.
+        """
+        total = 0
+        tables = [self._buckets] if self._old_buckets is None else [self._buckets, self._old_buckets]
+        for buckets in tables:
+            total += 8 * len(buckets)
+            for bucket in buckets:
+                if bucket is not None:
+                    total += _object_size(bucket)
+                    node = bucket.head
+                    while node:
+                        total += _object_size(node) + sys.getsizeof(node.data) + sys.getsizeof(node.data[0])
+                        node = node.next
+        return total
     
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, HashMap):
+        if not isinstance(other, IHashMap):
             return False
         if len(self) != len(other):
             return False
+        if type(self) is type(other) and self._hash_function is other._hash_function:
+            # Both maps hash keys the same way, so the stored hashes can be used to probe `other` directly.
+            for key_hash, key, value in self._entries():
+                other_value = other._get_hashed(key, key_hash, _MISSING)
+                if other_value is _MISSING or other_value != value:
+                    return False
+            return True
         for key, value in self.items():
             if key not in other or other[key] != value:
                 return False
@@ -107,6 +422,33 @@ class HashMap(IHashMap[KT, VT]):
     def __repr__(self) -> str:
         return f"HashMap({str(self)})"
 
+    @staticmethod
+    def _fast_hash_function(key: KT) -> int:
+        """
+        Tiered hash function used by the HashMap unless `hash_strategy='stable'` is requested.
+        Tier 1: the built-in hash() for hashable keys.
+        Tier 2: for unhashable built-in containers (list, dict, set, bytearray and tuples holding them),
+                the hash of a hashable equivalent built by `_HASHABLE_EQUIVALENTS`, nested values
+                included. set and bytearray become the frozenset and bytes they compare equal to, so
+                (1, {2}) hashes like (1, frozenset({2})).
+        Tier 3: the pickle + MD5 digest of `_default_hash_function` as a last resort.
+        Note: built-in hash() of str/bytes is salted per process, so these hashes are not stable
+        across interpreter runs. Use `_default_hash_function` when that matters.
+
+        Args:
+            key (KT): The key to hash.
+        Returns:
+            int: The hash value of the key.
+        """
+        try:
+            return hash(key)
+        except TypeError:
+            pass
+        equivalent = _HASHABLE_EQUIVALENTS.get(type(key))
+        if equivalent is not None:
+            return hash(equivalent(key))
+        return HashMap._default_hash_function(key)
+
     @staticmethod
     def _default_hash_function(key: KT) -> int:
         """
@@ -127,4 +469,97 @@ class HashMap(IHashMap[KT, VT]):
             key_bytes = pickle.dumps(key)
         except Exception:
             key_bytes = repr(key).encode()
-        return int(hashlib.md5(key_bytes).hexdigest(), 16)
\ No newline at end of file
+        return int(hashlib.md5(key_bytes).hexdigest(), 16)
+
+
+@dataclass(frozen=True, slots=True)
+class HashMapStats:
+    """ Snapshot returned by HashMap.stats(). Latency fields stay 0 unless sampling was enabled. """
+    bucket_count: int
+    entry_count: int
+    load_factor: float
+    probe_length_histogram: dict[int, int]
+    max_probe_length: int
+    resize_count: int
+    resize_seconds: float
+    bytes_per_entry: float
+    equality_checks: int
+    equality_checks_avoided: int
+    get_samples: int
+    get_mean_seconds: float
+    get_max_seconds: float
+    set_samples: int
+    set_mean_seconds: float
+    set_max_seconds: float
+
+
+class _LatencySampler:
+    """ Counts calls down and times every `every`-th one. """
+    __slots__ = ('every', 'countdown', 'count', 'total', 'maximum')
+
+    def __init__(self, every: int) -> None:
+        self.every = every
+        self.countdown = every
+        self.count = {'get': 0, 'set': 0}
+        self.total = {'get': 0.0, 'set': 0.0}
+        self.maximum = {'get': 0.0, 'set': 0.0}
+
+    def due(self) -> bool:
+        self.countdown -= 1
+        if self.countdown > 0:
+            return False
+        # One extra tick absorbs the due() check made by the timed call itself.
+        self.countdown = self.every + 1
+        return True
+
+    def time(self, operation: str, function: Callable, *args) -> object:
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.count[operation] += 1
+            self.total[operation] += elapsed
+            self.maximum[operation] = max(self.maximum[operation], elapsed)
+
+    def mean(self, operation: str) -> float:
+        return self.total[operation] / self.count[operation] if self.count[operation] else 0.0
+
+
+def _object_size(obj: object) -> int:
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+_MISSING = object()
+# Constructor options each storage engine understands on top of the shared ones.
+_STORAGE_OPTIONS: dict[str, tuple[str, ...]] = {
+    'chaining': ('incremental_resize', 'migration_batch'),
+    'open_addressing': ('probing',),
+}
+_BATCH_SIZE = 1024
+
+
+def _hashable(item: object) -> object:
+    """ `item` itself if it is hashable, otherwise a hashable value that every key equal to `item` maps to. """
+    try:
+        hash(item)
+        return item
+    except TypeError:
+        pass
+    equivalent = _HASHABLE_EQUIVALENTS.get(type(item))
+    if equivalent is not None:
+        return equivalent(item)
+    return (type(item), HashMap._default_hash_function(item))
+
+
+# Lists and dicts are never equal to a hashable value, so their equivalents are tagged with their type.
+_HASHABLE_EQUIVALENTS: dict[type, Callable[[Any], object]] = {
+    tuple: lambda key: tuple(_hashable(item) for item in key),
+    list: lambda key: (list, tuple(_hashable(item) for item in key)),
+    set: frozenset,
+    dict: lambda key: (dict, frozenset((k, _hashable(v)) for k, v in key.items())),
+    bytearray: bytes,
+}
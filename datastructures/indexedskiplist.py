@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import os
+import random
+from typing import Iterator, Optional, Sequence, Tuple, overload
+from datastructures.ilinkedlist import ILinkedList, T
+from datastructures.validation import ValidationMode, make_validator
+
+_MAX_LEVELS = 32
+
+
+class IndexedSkipList[T](ILinkedList[T]):
+    """
+    Sequence with the ILinkedList API plus positional access. Items sit on a doubly linked level-0
+    chain. Each node also has forward links on a random number of higher levels, and every link records
+    its width: how many level-0 steps it skips. Positional operations add up widths while descending
+    the levels, so `list[i]`, `insert_at(i, item)` and `del list[i]` take O(log n) expected time.
+    Value-based methods (insert_before, remove, ...) still scan for the value first, then use the
+    positional path.
+
+    A link to the end of the list has width `count + 1 - position` of the node it leaves, with the
+    head at position 0 and item i at position i + 1, so widths stay consistent without a tail sentinel.
+    """
+
+    @dataclass(slots=True)
+    class Node:
+        data: T
+        next: list = field(default_factory=list)
+        width: list = field(default_factory=list)
+        previous: Optional[IndexedSkipList.Node] = None
+
+    def __init__(self, data_type: type = object, seed: Optional[int] = None, validation: Optional[ValidationMode | str] = None) -> None:
+        self._head: IndexedSkipList.Node = self.Node(data=None, next=[None], width=[1])
+        self.tail: Optional[IndexedSkipList.Node] = None
+        self.count: int = 0
+        self.data_type: type = data_type
+        self._validate = make_validator(data_type, validation)
+        self._random: random.Random = random.Random(seed)
+        self._iter_node: object = _START
+
+    @staticmethod
+    def from_sequence(sequence: Sequence[T], data_type: type=object, validation: Optional[ValidationMode | str]=None) -> IndexedSkipList[T]:
+        skip_list = IndexedSkipList(data_type, validation=validation)
+        for item in sequence:
+            skip_list.append(item)
+        return skip_list
+
+    @property
+    def head(self) -> Optional[IndexedSkipList.Node]:
+        """ First item node, matching LinkedList.head. """
+        return self._head.next[0]
+
+    def _random_level(self) -> int:
+        level = 1
+        while level < _MAX_LEVELS and self._random.random() < 0.5:
+            level += 1
+        return level
+
+    def _predecessors(self, index: int) -> Tuple[list, list]:
+        """ For each level, the last node before item `index` and that node's position. """
+        levels = len(self._head.next)
+        chain = [None] * levels
+        positions = [0] * levels
+        node = self._head
+        position = 0
+        for level in range(levels - 1, -1, -1):
+            while node.next[level] is not None and position + node.width[level] <= index:
+                position += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+            positions[level] = position
+        return chain, positions
+
+    def _node_at(self, index: int) -> IndexedSkipList.Node:
+        node = self._head
+        position = 0
+        target = index + 1
+        for level in range(len(self._head.next) - 1, -1, -1):
+            while node.next[level] is not None and position + node.width[level] <= target:
+                position += node.width[level]
+                node = node.next[level]
+            if position == target:
+                return node
+        return node
+
+    def _normalize(self, index: int, upper: int) -> int:
+        if not isinstance(index, int):
+            raise TypeError("Invalid argument type")
+        if index < 0:
+            index += upper
+        if index < 0 or index >= upper:
+            raise IndexError("Index out of bounds")
+        return index
+
+    def insert_at(self, index: int, item: T) -> None:
+        """ Inserts `item` so that it ends up at position `index` (0 <= index <= len, negative counts from the end) in O(log n). """
+        if self._validate is not None:
+            self._validate(item)
+        index = self._normalize(index, self.count + 1)
+        level = self._random_level()
+        head = self._head
+        while len(head.next) < level:
+            head.next.append(None)
+            head.width.append(self.count + 1)
+        chain, positions = self._predecessors(index)
+        new_node = self.Node(data=item, next=[None] * level, width=[0] * level)
+        for current in range(level):
+            predecessor = chain[current]
+            new_node.next[current] = predecessor.next[current]
+            predecessor.next[current] = new_node
+            new_node.width[current] = predecessor.width[current] - (index - positions[current])
+            predecessor.width[current] = index + 1 - positions[current]
+        for current in range(level, len(head.next)):
+            chain[current].width[current] += 1
+        new_node.previous = chain[0] if chain[0] is not head else None
+        if new_node.next[0] is not None:
+            new_node.next[0].previous = new_node
+        else:
+            self.tail = new_node
+        self.count += 1
+
+    def _delete_at(self, index: int) -> T:
+        chain, _ = self._predecessors(index)
+        target = chain[0].next[0]
+        for level in range(len(self._head.next)):
+            predecessor = chain[level]
+            if predecessor.next[level] is target:
+                predecessor.width[level] += target.width[level] - 1
+                predecessor.next[level] = target.next[level]
+            else:
+                predecessor.width[level] -= 1
+        if target.next[0] is not None:
+            target.next[0].previous = target.previous
+        else:
+            self.tail = target.previous
+        self.count -= 1
+        return target.data
+
+    def index(self, item: T) -> int:
+        """ Returns the position of the first occurrence of `item`. Raises ValueError if it is absent. """
+        node = self._head.next[0]
+        position = 0
+        while node:
+            if node.data == item:
+                return position
+            node = node.next[0]
+            position += 1
+        raise ValueError
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.count)
+            if step == 1:
+                return list(self.iter_range(start, stop))
+            return list(self)[index]
+        return self._node_at(self._normalize(index, self.count)).data
+
+    def __setitem__(self, index: int, item: T) -> None:
+        if self._validate is not None:
+            self._validate(item)
+        self._node_at(self._normalize(index, self.count)).data = item
+
+    def __delitem__(self, index: int) -> None:
+        self._delete_at(self._normalize(index, self.count))
+
+    def iter_range(self, start: int=0, stop: Optional[int]=None) -> Iterator[T]:
+        """ Yields the items at positions [start, stop) with slice semantics. Finding `start` is O(log n);
+            each further item is one level-0 step.
+        """
+        start, stop, _ = slice(start, stop).indices(self.count)
+        if start >= stop:
+            return
+        node = self._node_at(start)
+        for _ in range(stop - start):
+            if node is None:
+                return
+            following = node.next[0]
+            yield node.data
+            node = following
+
+    def append(self, item: T) -> None:
+        self.insert_at(self.count, item)
+
+    def prepend(self, item: T) -> None:
+        self.insert_at(0, item)
+
+    def insert_before(self, target: T, item: T) -> None:
+        if self._validate is not None:
+            self._validate(target)
+            self._validate(item)
+        self.insert_at(self.index(target), item)
+
+    def insert_after(self, target: T, item: T) -> None:
+        if self._validate is not None:
+            self._validate(target)
+            self._validate(item)
+        self.insert_at(self.index(target) + 1, item)
+
+    def remove(self, item: T) -> None:
+        if self._validate is not None:
+            self._validate(item)
+        self._delete_at(self.index(item))
+
+    def remove_all(self, item: T) -> None:
+        if self._validate is not None:
+            self._validate(item)
+        positions = [position for position, existing in enumerate(self) if existing == item]
+        for position in reversed(positions):
+            self._delete_at(position)
+
+    def pop(self) -> T:
+        if self.empty:
+            raise IndexError
+        return self._delete_at(self.count - 1)
+
+    def pop_front(self) -> T:
+        if self.empty:
+            raise IndexError
+        return self._delete_at(0)
+
+    @property
+    def front(self) -> T:
+        if self.empty:
+            raise IndexError
+        return self._head.next[0].data
+
+    @property
+    def back(self) -> T:
+        if self.empty:
+            raise IndexError
+        return self.tail.data
+
+    @property
+    def empty(self) -> bool:
+        return self.count == 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        self._head = self.Node(data=None, next=[None], width=[1])
+        self.tail = None
+        self.count = 0
+
+    def __contains__(self, item: T) -> bool:
+        return any(existing == item for existing in self)
+
+    def __iter__(self) -> Iterator[T]:
+        node = self._head.next[0]
+        while node:
+            following = node.next[0]
+            yield node.data
+            node = following
+
+    def __next__(self) -> T:
+        """ Legacy cursor for callers that call next() on the list itself; see LinkedList.__next__. """
+        node = self._head.next[0] if self._iter_node is _START else self._iter_node
+        if node is None:
+            self._iter_node = _START
+            raise StopIteration
+        self._iter_node = node.next[0]
+        return node.data
+
+    def __reversed__(self) -> Iterator[T]:
+        node = self.tail
+        while node:
+            yield node.data
+            node = node.previous
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ILinkedList):
+            return False
+        if len(self) != len(other):
+            return False
+        return all(mine == theirs for mine, theirs in zip(self, other))
+
+    def __str__(self) -> str:
+        return '[' + ', '.join(repr(item) for item in self) + ']'
+
+    def __repr__(self) -> str:
+        return f"IndexedSkipList({' <-> '.join(repr(item) for item in self)}) Count: {self.count}"
+
+
+_START = object()
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'OOPS!\nThis is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
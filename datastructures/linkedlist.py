@@ -2,141 +2,319 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import os
-from typing import Optional, Sequence
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional, Sequence, Tuple
 from datastructures.ilinkedlist import ILinkedList, T
+from datastructures.validation import ValidationMode, make_validator
 
 
 class LinkedList[T](ILinkedList[T]):
 
-    @dataclass
+    @dataclass(slots=True)
     class Node:
         data: T
         next: Optional[LinkedList.Node] = None
         previous: Optional[LinkedList.Node] = None
 
-    def __init__(self, data_type: type = object) -> None:
+    def __init__(self, data_type: type = object, recycle_nodes: int = 0, validation: Optional[ValidationMode | str] = None) -> None:
+        """ `recycle_nodes` > 0 keeps up to that many nodes freed by pop, pop_front, remove, remove_all
+            and clear on a free-list and reuses them for new items, so push/pop churn stops allocating.
+            A recycled node may come back holding a different item, so with recycling on, a node handle
+            must not be used after its item was removed by one of those methods. remove_node never
+            recycles, since its caller holds the handle.
+
+            `validation` picks how items are checked against `data_type` (see datastructures.validation);
+            None uses the package default.
+        """
+        if recycle_nodes < 0:
+            raise ValueError
         self.head: Optional[LinkedList.Node] = None
         self.tail: Optional[LinkedList.Node] = None
         self.count: int = 0
         self.data_type: type = data_type
+        self._validation: Optional[ValidationMode | str] = validation
+        self._validate = make_validator(data_type, validation)
+        self._iter_node: object = _START
+        self._recycle_limit: int = recycle_nodes
+        self._free_nodes: list[LinkedList.Node] = []
     
     @staticmethod
-    def from_sequence(sequence: Sequence[T], data_type: type=object) -> LinkedList[T]:
-        linked_list = LinkedList(data_type)
-        for item in sequence:
-            linked_list.append(item)
+    def from_sequence(sequence: Sequence[T], data_type: type=object, validation: Optional[ValidationMode | str]=None) -> LinkedList[T]:
+        linked_list = LinkedList(data_type, validation=validation)
+        linked_list.extend(sequence)
         return linked_list
 
-    def append(self, item: T) -> None:
-        if not isinstance(item, self.data_type):
-            raise TypeError
-        new_node = self.Node(data=item)
+    def extend(self, items: Iterable[T]) -> None:
+        """ Appends every item in one pass. Types are checked for the whole batch before anything is
+            linked, so a TypeError leaves the list unchanged.
+
+        Examples:
+            >>> linked_list = LinkedList.from_sequence([1, 2])
+            >>> linked_list.extend(range(3, 6))
+            >>> print(linked_list)
+            [1, 2, 3, 4, 5]
+        """
+        items = list(items)
+        if not items:
+            return
+        if self._validate is not None:
+            for item in items:
+                self._validate(item)
+        node_type = self.Node
+        first = previous = node_type(items[0], None, self.tail)
+        for item in islice(items, 1, None):
+            node = node_type(item, None, previous)
+            previous.next = node
+            previous = node
         if self.tail:
-            self.tail.next = new_node
-            new_node.previous = self.tail
-            self.tail = new_node
+            self.tail.next = first
         else:
-            self.head = self.tail = new_node
-        self.count += 1
+            self.head = first
+        self.tail = previous
+        self.count += len(items)
 
-    def prepend(self, item: T) -> None:
-        if not isinstance(item, self.data_type):
-            raise TypeError
-        new_node = self.Node(data=item)
+    def append(self, item: T) -> LinkedList.Node:
+        """ Adds an item at the end and returns its node, which can be passed to the *_node methods. """
+        if self._validate is not None:
+            self._validate(item)
+        new_node = self._new_node(item)
+        self._link_after(self.tail, new_node)
+        return new_node
+
+    def prepend(self, item: T) -> LinkedList.Node:
+        """ Adds an item at the front and returns its node. """
+        if self._validate is not None:
+            self._validate(item)
+        new_node = self._new_node(item)
+        self._link_front(new_node)
+        return new_node
+
+    def _new_node(self, item: T) -> LinkedList.Node:
+        if self._free_nodes:
+            node = self._free_nodes.pop()
+            node.data = item
+            return node
+        return self.Node(data=item)
+
+    def _recycle(self, node: LinkedList.Node) -> None:
+        """ Keeps a detached node for reuse if the free-list has room. The item is dropped so it can be collected. """
+        if len(self._free_nodes) < self._recycle_limit:
+            node.data = None
+            self._free_nodes.append(node)
+
+    def _link_front(self, node: LinkedList.Node) -> None:
+        """ Attaches a detached node at the head in O(1). No type check; the node's data was checked when it was made. """
+        node.previous = None
+        node.next = self.head
         if self.head:
-            self.head.previous = new_node
-            new_node.next = self.head
-            self.head = new_node
+            self.head.previous = node
         else:
-            self.head = self.tail = new_node
+            self.tail = node
+        self.head = node
         self.count += 1
 
-    def insert_before(self, target: T, item: T) -> None:
-        if not isinstance(item, self.data_type) or not isinstance(target, self.data_type):
-            raise TypeError
+    def _link_after(self, anchor: Optional[LinkedList.Node], node: LinkedList.Node) -> None:
+        """ Attaches a detached node after `anchor` in O(1), or at the head when `anchor` is None. """
+        if anchor is None:
+            self._link_front(node)
+            return
+        node.previous = anchor
+        node.next = anchor.next
+        if anchor.next:
+            anchor.next.previous = node
+        else:
+            self.tail = node
+        anchor.next = node
+        self.count += 1
+
+    def _unlink(self, node: LinkedList.Node) -> None:
+        """ Detaches a node that belongs to this list in O(1), without searching for it. """
+        if node.previous:
+            node.previous.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.previous = node.previous
+        else:
+            self.tail = node.previous
+        node.previous = node.next = None
+        self.count -= 1
+
+    def _find_node(self, item: T) -> Optional[LinkedList.Node]:
         current = self.head
         while current:
-            if current.data == target:
-                new_node = self.Node(data=item)
-                new_node.next = current
-                new_node.previous = current.previous
-                if current.previous:
-                    current.previous.next = new_node
-                else:
-                    self.head = new_node
-                current.previous = new_node
-                self.count += 1
-                return
+            if current.data == item:
+                return current
             current = current.next
-        raise ValueError
+        return None
 
-    def insert_after(self, target: T, item: T) -> None:
-        if not isinstance(item, self.data_type) or not isinstance(target, self.data_type):
+    def insert_before_node(self, node: LinkedList.Node, item: T) -> LinkedList.Node:
+        """ Inserts `item` before `node` in O(1) and returns the new node. `node` must belong to this list. """
+        if self._validate is not None:
+            self._validate(item)
+        new_node = self._new_node(item)
+        self._link_after(node.previous, new_node)
+        return new_node
+
+    def insert_after_node(self, node: LinkedList.Node, item: T) -> LinkedList.Node:
+        """ Inserts `item` after `node` in O(1) and returns the new node. `node` must belong to this list. """
+        if self._validate is not None:
+            self._validate(item)
+        new_node = self._new_node(item)
+        self._link_after(node, new_node)
+        return new_node
+
+    def remove_node(self, node: LinkedList.Node) -> T:
+        """ Removes `node` in O(1) and returns its item. `node` must belong to this list; that is not
+            checked, since checking would need the scan this method exists to avoid.
+        """
+        self._unlink(node)
+        return node.data
+
+    def prepend_node(self, node: LinkedList.Node) -> LinkedList.Node:
+        """ Attaches `node`, detached from this or another list by remove_node, at the front in O(1) and
+            returns it. Reusing the node keeps handles to it valid, which a new prepend would not.
+        """
+        if self._validate is not None:
+            self._validate(node.data)
+        self._link_front(node)
+        return node
+
+    def move_to_front(self, node: LinkedList.Node) -> None:
+        """ Moves `node`, which must belong to this list, to the front in O(1). """
+        if node is not self.head:
+            self._unlink(node)
+            self._link_front(node)
+
+    def move_to_back(self, node: LinkedList.Node) -> None:
+        """ Moves `node`, which must belong to this list, to the back in O(1). """
+        if node is not self.tail:
+            self._unlink(node)
+            self._link_after(self.tail, node)
+
+    def splice(self, other: LinkedList[T], after: Optional[LinkedList.Node]=None) -> None:
+        """ Moves every node of `other` into this list in O(1), after `after` or at the end when it is None.
+            `other` is left empty and its nodes keep working as handles into this list.
+
+        Examples:
+            >>> first = LinkedList.from_sequence([1, 4])
+            >>> first.splice(LinkedList.from_sequence([2, 3]), after=first.head)
+            >>> print(first)
+            [1, 2, 3, 4]
+        """
+        if other is self:
+            raise ValueError
+        if not issubclass(other.data_type, self.data_type):
             raise TypeError
-        current = self.head
-        while current:
-            if current.data == target:
-                new_node = self.Node(data=item)
-                new_node.previous = current
-                new_node.next = current.next
-                if current.next:
-                    current.next.previous = new_node
-                else:
-                    self.tail = new_node
-                current.next = new_node
-                self.count += 1
-                return
-            current = current.next
-        raise ValueError
+        if other.empty:
+            return
+        if after is None:
+            after = self.tail
+        first, last = other.head, other.tail
+        if after is None:
+            self.head, self.tail = first, last
+        else:
+            last.next = after.next
+            if after.next:
+                after.next.previous = last
+            else:
+                self.tail = last
+            after.next = first
+            first.previous = after
+        self.count += other.count
+        # Detach directly; clear() could hand the moved nodes to other's free-list.
+        other.head = other.tail = None
+        other.count = 0
+
+    def split_at(self, node: LinkedList.Node) -> LinkedList[T]:
+        """ Detaches `node` and everything after it into a new list, which is returned. Relinking is O(1);
+            the two counts are found by walking outward from `node` towards both ends at once and stopping
+            at whichever end comes first, so the whole call is O(min(len(prefix), len(suffix))).
+            `node` must belong to this list.
+
+        Examples:
+            >>> linked_list = LinkedList.from_sequence([1, 2, 3, 4])
+            >>> tail = linked_list.split_at(linked_list.head.next.next)
+            >>> print(linked_list, tail)
+            [1, 2] [3, 4]
+        """
+        forward, backward = node, node.previous
+        steps = 0
+        while True:
+            forward = forward.next
+            steps += 1
+            if forward is None:
+                suffix = steps
+                break
+            if backward is None:
+                suffix = self.count - (steps - 1)
+                break
+            backward = backward.previous
+        rest = LinkedList(self.data_type, self._recycle_limit, self._validation)
+        rest.head, rest.tail, rest.count = node, self.tail, suffix
+        self.tail = node.previous
+        if self.tail:
+            self.tail.next = None
+        else:
+            self.head = None
+        node.previous = None
+        self.count -= suffix
+        return rest
+
+    def insert_before(self, target: T, item: T) -> None:
+        if self._validate is not None:
+            self._validate(target)
+            self._validate(item)
+        node = self._find_node(target)
+        if node is None:
+            raise ValueError
+        self.insert_before_node(node, item)
+
+    def insert_after(self, target: T, item: T) -> None:
+        if self._validate is not None:
+            self._validate(target)
+            self._validate(item)
+        node = self._find_node(target)
+        if node is None:
+            raise ValueError
+        self.insert_after_node(node, item)
 
     def remove(self, item: T) -> None:
-        if not isinstance(item, self.data_type):
-            raise TypeError
-        current = self.head
-        while current:
-            if current.data == item:
-                if current.previous:
-                    current.previous.next = current.next
-                else:
-                    self.head = current.next
-                if current.next:
-                    current.next.previous = current.previous
-                else:
-                    self.tail = current.previous
-                self.count -= 1
-                return
-            current = current.next
-        raise ValueError
+        if self._validate is not None:
+            self._validate(item)
+        node = self._find_node(item)
+        if node is None:
+            raise ValueError
+        self._unlink(node)
+        self._recycle(node)
 
     def remove_all(self, item: T) -> None:
-        if not isinstance(item, self.data_type):
-            raise TypeError
+        if self._validate is not None:
+            self._validate(item)
         current = self.head
         while current:
+            following = current.next
             if current.data == item:
-                if current.previous:
-                    current.previous.next = current.next
-                else:
-                    self.head = current.next
-                if current.next:
-                    current.next.previous = current.previous
-                else:
-                    self.tail = current.previous
-                self.count -= 1
-            current = current.next
+                self._unlink(current)
+                self._recycle(current)
+            current = following
 
     def pop(self) -> T:
         if self.empty:
             raise IndexError
-        item = self.tail.data
-        self.remove(item)
+        node = self.tail
+        self._unlink(node)
+        item = node.data
+        self._recycle(node)
         return item
     
     def pop_front(self) -> T:
         if self.empty:
             raise IndexError
-        item = self.head.data
-        self.remove(item)
+        node = self.head
+        self._unlink(node)
+        item = node.data
+        self._recycle(node)
         return item
 
     @property
@@ -158,7 +336,74 @@ class LinkedList[T](ILinkedList[T]):
     def __len__(self) -> int:
         return self.count
     
+    def sort(self, key: Optional[Callable[[T], object]]=None, reverse: bool=False) -> None:
+        """ Sorts the list in place with a stable bottom-up merge sort that relinks the existing nodes, so
+            node handles stay valid and no nodes are allocated. Like sorted(), equal items keep their order
+            even when `reverse` is True. With `key`, each item's key is computed once and held in a dict
+            for the duration of the sort.
+
+        Examples:
+            >>> linked_list = LinkedList.from_sequence(['bb', 'a', 'ccc'])
+            >>> linked_list.sort(key=len, reverse=True)
+            >>> print(linked_list)
+            ['ccc', 'bb', 'a']
+        """
+        if self.count < 2:
+            return
+        keys = None
+        if key is not None:
+            keys = {}
+            current = self.head
+            while current:
+                keys[id(current)] = key(current.data)
+                current = current.next
+
+        # Runs are merged through the `next` links only; `previous` links are rebuilt in one pass at the end.
+        anchor = self.Node(data=None)
+        head = self.head
+        width = 1
+        while width < self.count:
+            merged_tail = anchor
+            remaining = head
+            while remaining:
+                left = remaining
+                right = _cut_after(left, width)
+                remaining = _cut_after(right, width)
+                while left and right:
+                    if keys is None:
+                        right_key, left_key = right.data, left.data
+                    else:
+                        right_key, left_key = keys[id(right)], keys[id(left)]
+                    # Take from the right run only when it strictly sorts first, which keeps the sort stable.
+                    if (left_key < right_key) if reverse else (right_key < left_key):
+                        merged_tail.next = right
+                        right = right.next
+                    else:
+                        merged_tail.next = left
+                        left = left.next
+                    merged_tail = merged_tail.next
+                merged_tail.next = left or right
+                while merged_tail.next:
+                    merged_tail = merged_tail.next
+            head = anchor.next
+            width *= 2
+
+        previous = None
+        current = head
+        while current:
+            current.previous = previous
+            previous = current
+            current = current.next
+        self.head = head
+        self.tail = previous
+
     def clear(self) -> None:
+        current = self.head
+        while current and len(self._free_nodes) < self._recycle_limit:
+            following = current.next
+            current.previous = current.next = None
+            self._recycle(current)
+            current = following
         self.head = None
         self.tail = None
         self.count = 0
@@ -171,30 +416,113 @@ class LinkedList[T](ILinkedList[T]):
             current = current.next
         return False
 
-    def __iter__(self) -> ILinkedList[T]:
-        self._iter_node = self.head
-        return self
+    def __iter__(self) -> Iterator[T]:
+        """ Returns a new generator each call, so nested and concurrent loops over one list are independent. """
+        current = self.head
+        while current:
+            # Read the link before yielding so removing the current item inside the loop is safe.
+            following = current.next
+            yield current.data
+            current = following
     
     def __next__(self) -> T:
-        if self._iter_node is None:
+        """ Legacy cursor for callers that call next() on the list itself. It starts at the head and is
+            separate from the generators returned by iter(); once exhausted it starts over.
+        """
+        node = self.head if self._iter_node is _START else self._iter_node
+        if node is None:
+            self._iter_node = _START
             raise StopIteration
-        data = self._iter_node.data
-        self._iter_node = self._iter_node.next
-        return data
-    
-    def __reversed__(self) -> ILinkedList[T]:
-        reversed_list = LinkedList(self.data_type)
-        current = self.tail
-        while current:
-            reversed_list.append(current.data)
-            current = current.previous
-        return reversed_list
+        self._iter_node = node.next
+        return node.data
     
+    def __reversed__(self) -> LinkedList.View:
+        """ Returns a lazy back-to-front view. Creating it is O(1) and iterating it allocates no nodes. """
+        return self.View(self, reverse=True)
+
+    def view(self, start: int=0, stop: Optional[int]=None, reverse: bool=False) -> LinkedList.View:
+        """ Returns a lazy view of the items in positions [start, stop), with slice semantics for negative
+            and out-of-range bounds. The view reads the list when it is iterated, so it reflects later changes.
+
+        Examples:
+            >>> linked_list = LinkedList.from_sequence([0, 1, 2, 3, 4])
+            >>> print(linked_list.view(1, 4, reverse=True))
+            [3, 2, 1]
+        """
+        return self.View(self, start, stop, reverse)
+
+    class View:
+        """ Window over a LinkedList. Iteration starts from whichever end of the list is closer to the window. """
+        __slots__ = ('_list', '_start', '_stop', '_reverse')
+
+        def __init__(self, linked_list: LinkedList, start: int=0, stop: Optional[int]=None, reverse: bool=False) -> None:
+            self._list = linked_list
+            self._start = start
+            self._stop = stop
+            self._reverse = reverse
+
+        def _bounds(self) -> Tuple[int, int]:
+            start, stop, _ = slice(self._start, self._stop).indices(len(self._list))
+            return start, max(start, stop)
+
+        def _node_at(self, index: int) -> LinkedList.Node:
+            count = len(self._list)
+            if index < count // 2:
+                node = self._list.head
+                for _ in range(index):
+                    node = node.next
+            else:
+                node = self._list.tail
+                for _ in range(count - 1 - index):
+                    node = node.previous
+            return node
+
+        def __iter__(self) -> Iterator:
+            start, stop = self._bounds()
+            remaining = stop - start
+            if not remaining:
+                return
+            if self._reverse:
+                node = self._node_at(stop - 1)
+                while remaining and node:
+                    following = node.previous
+                    yield node.data
+                    node = following
+                    remaining -= 1
+            else:
+                node = self._node_at(start)
+                while remaining and node:
+                    following = node.next
+                    yield node.data
+                    node = following
+                    remaining -= 1
+
+        def __reversed__(self) -> LinkedList.View:
+            return LinkedList.View(self._list, self._start, self._stop, not self._reverse)
+
+        def __len__(self) -> int:
+            start, stop = self._bounds()
+            return stop - start
+
+        def __eq__(self, other: object) -> bool:
+            if not isinstance(other, (LinkedList.View, ILinkedList, list, tuple)):
+                return False
+            return list(self) == list(other)
+
+        def __str__(self) -> str:
+            return '[' + ', '.join(repr(item) for item in self) + ']'
+
+        def __repr__(self) -> str:
+            return f"LinkedList.View({' <-> '.join(repr(item) for item in self)})"
+
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, LinkedList):
+        """ Equal to any linked list, LinkedList.View, list or tuple holding equal items in the same order. """
+        if not isinstance(other, (LinkedList, LinkedList.View, ILinkedList, list, tuple)):
             return False
         if len(self) != len(other):
             return False
+        if not isinstance(other, LinkedList):
+            return all(mine == theirs for mine, theirs in zip(self, other))
         current_self = self.head
         current_other = other.head
         while current_self:
@@ -221,6 +549,22 @@ class LinkedList[T](ILinkedList[T]):
         return f"LinkedList({' <-> '.join(items)}) Count: {self.count}"
 
 
+def _cut_after(node: Optional[LinkedList.Node], length: int) -> Optional[LinkedList.Node]:
+    """ Ends the `next` chain `length` nodes after `node` (inclusive) and returns the node that followed, if any. """
+    for _ in range(length - 1):
+        if node is None:
+            return None
+        node = node.next
+    if node is None:
+        return None
+    following = node.next
+    node.next = None
+    return following
+
+
+_START = object()
+
+
 if __name__ == '__main__':
     filename = os.path.basename(__file__)
     print(f'OOPS!\nThis is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
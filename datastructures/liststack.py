@@ -1,8 +1,9 @@
 import os
 from datastructures.istack import IStack
-from typing import Generic
+from typing import Generic, Optional
 
 from datastructures.linkedlist import LinkedList, T
+from datastructures.validation import ValidationMode
 
 class ListStack(IStack[T]):
     """
@@ -10,8 +11,8 @@ class ListStack(IStack[T]):
 
     """
 
-    def __init__(self, data_type:object) -> None:
-        self._list = LinkedList(data_type=data_type)
+    def __init__(self, data_type:object, recycle_nodes: int = 0, validation: Optional[ValidationMode | str] = None) -> None:
+        self._list = LinkedList(data_type=data_type, recycle_nodes=recycle_nodes, validation=validation)
         self.size = 0
 
     def push(self, item: T):
@@ -28,10 +29,7 @@ class ListStack(IStack[T]):
     def peek(self) -> T:
         if self.empty:
             raise IndexError
-        current = self._list.head
-        while current.next:
-            current = current.next
-        return current.data
+        return self._list.back
 
     @property
     def empty(self) -> bool:
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+from array import array
+import os
+import sys
+import time
+from typing import Callable, Iterator, Optional, Tuple
+
+from datastructures.hashmap import HashMap
+from datastructures.ihashmap import KT, VT
+
+_EMPTY = object()
+_TOMBSTONE = object()
+_MASK64 = (1 << 64) - 1
+_FIBONACCI = 0x9E3779B97F4A7C15
+
+
+class OpenAddressingHashMap(HashMap[KT, VT]):
+    """
+    HashMap storage engine that keeps its entries in three parallel arrays (keys, values and
+    64-bit hashes) instead of a LinkedList per bucket. Collisions are resolved by probing forward
+    through the table, either plainly (`probing='linear'`) or with Robin Hood displacement
+    (`probing='robin_hood'`). Usually created through `HashMap(storage='open_addressing')`.
+
+    Linear probing marks deleted slots with a tombstone so later probes keep walking past them;
+    tombstones are reused by inserts and purged on resize. Robin Hood probing uses backward-shift
+    deletion and never leaves tombstones behind.
+    """
+    _storage: str = 'open_addressing'
+
+    def __init__(self, number_of_buckets=8, load_factor=0.75, custom_hash_function: Optional[Callable[[KT], int]]=None, hash_strategy: str='fast', storage: str='open_addressing', probing: str='linear') -> None:
+        if probing not in ('linear', 'robin_hood'):
+            raise ValueError(f"Unknown probing: {probing!r}")
+        if not 0 < load_factor < 1:
+            raise ValueError("load_factor must be between 0 and 1 for open addressing")
+        self._count: int = 0
+        self._load_factor_threshold: float = load_factor
+        self._hash_function = self._select_hash_function(custom_hash_function, hash_strategy)
+        self._robin_hood: bool = probing == 'robin_hood'
+        self._reset_instrumentation()
+        self._allocate(self._capacity_for(number_of_buckets))
+
+    @staticmethod
+    def _capacity_for(number_of_buckets: int) -> int:
+        capacity = 8
+        while capacity < number_of_buckets:
+            capacity *= 2
+        return capacity
+
+    def _allocate(self, capacity: int) -> None:
+        self._keys: list = [_EMPTY] * capacity
+        self._values: list = [None] * capacity
+        self._hashes: array = array('Q', bytes(8 * capacity))
+        self._mask: int = capacity - 1
+        self._shift: int = 65 - capacity.bit_length()
+        self._tombstones: int = 0
+
+    def _find(self, key: KT, key_hash: int) -> int:
+        """ Returns the slot holding `key`, or -1. Slots whose stored hash differs are skipped without calling `==`. """
+        keys = self._keys
+        hashes = self._hashes
+        mask = self._mask
+        shift = self._shift
+        index = ((key_hash * _FIBONACCI) & _MASK64) >> shift
+        skipped = 0
+        distance = 0
+        robin_hood = self._robin_hood
+        while True:
+            k = keys[index]
+            if k is _EMPTY:
+                index = -1
+                break
+            slot_hash = hashes[index]
+            if slot_hash == key_hash and k is not _TOMBSTONE:
+                if k is key:
+                    break
+                self._equality_checks += 1
+                if k == key:
+                    break
+            elif k is not _TOMBSTONE:
+                skipped += 1
+            if robin_hood:
+                if (index - (((slot_hash * _FIBONACCI) & _MASK64) >> shift)) & mask < distance:
+                    index = -1
+                    break
+                distance += 1
+            index = (index + 1) & mask
+        self._equality_checks_avoided += skipped
+        return index
+
+    def _insert(self, key: KT, value: VT, key_hash: int) -> None:
+        """ Places a key that is known to be absent. The caller guarantees there is room. """
+        keys = self._keys
+        values = self._values
+        hashes = self._hashes
+        mask = self._mask
+        shift = self._shift
+        index = ((key_hash * _FIBONACCI) & _MASK64) >> shift
+        if self._robin_hood:
+            distance = 0
+            while True:
+                k = keys[index]
+                if k is _EMPTY:
+                    keys[index] = key
+                    values[index] = value
+                    hashes[index] = key_hash
+                    return
+                slot_hash = hashes[index]
+                slot_distance = (index - (((slot_hash * _FIBONACCI) & _MASK64) >> shift)) & mask
+                if slot_distance < distance:
+                    keys[index], key = key, k
+                    values[index], value = value, values[index]
+                    hashes[index], key_hash = key_hash, slot_hash
+                    distance = slot_distance
+                distance += 1
+                index = (index + 1) & mask
+        while True:
+            k = keys[index]
+            if k is _EMPTY or k is _TOMBSTONE:
+                if k is _TOMBSTONE:
+                    self._tombstones -= 1
+                keys[index] = key
+                values[index] = value
+                hashes[index] = key_hash
+                return
+            index = (index + 1) & mask
+
+    def __getitem__(self, key: KT) -> VT:
+        if self._sampler is not None and self._sampler.due():
+            return self._sampler.time('get', self.__getitem__, key)
+        index = self._find(key, self._hash_function(key) & _MASK64)
+        if index < 0:
+            raise KeyError
+        return self._values[index]
+
+    def __setitem__(self, key: KT, value: VT) -> None:
+        if self._sampler is not None and self._sampler.due():
+            return self._sampler.time('set', self.__setitem__, key, value)
+        if self._count + self._tombstones + 1 > len(self._keys) * self._load_factor_threshold:
+            self._resize()
+        self._store(key, self._hash_function(key), value)
+
+    def _store(self, key: KT, key_hash: int, value: VT) -> None:
+        key_hash &= _MASK64
+        index = self._find(key, key_hash)
+        if index >= 0:
+            self._values[index] = value
+            return
+        self._insert(key, value, key_hash)
+        self._count += 1
+
+    def _reserve(self, expected_size: int) -> None:
+        if expected_size + self._tombstones + 1 > len(self._keys) * self._load_factor_threshold:
+            self._resize(self._capacity_for(int((expected_size + 1) / self._load_factor_threshold) + 1))
+
+    def _resize(self, new_capacity: Optional[int]=None, incremental: Optional[bool]=None) -> None:
+        capacity = len(self._keys)
+        if new_capacity is not None:
+            capacity = max(capacity, new_capacity)
+        # Only grow when live entries are the problem; a table clogged with tombstones is rebuilt at the same size.
+        elif self._count + 1 > capacity * self._load_factor_threshold / 2:
+            capacity *= 2
+        start = time.perf_counter()
+        old_keys, old_values, old_hashes = self._keys, self._values, self._hashes
+        self._allocate(capacity)
+        for k, v, key_hash in zip(old_keys, old_values, old_hashes):
+            if k is not _EMPTY and k is not _TOMBSTONE:
+                self._insert(k, v, key_hash)
+        self._resize_count += 1
+        self._resize_seconds += time.perf_counter() - start
+
+    def __delitem__(self, key: KT) -> None:
+        if not self._delete_hashed(key, self._hash_function(key)):
+            raise KeyError
+
+    def _delete_hashed(self, key: KT, key_hash: int) -> bool:
+        index = self._find(key, key_hash & _MASK64)
+        if index < 0:
+            return False
+        keys = self._keys
+        values = self._values
+        mask = self._mask
+        following = (index + 1) & mask
+        if self._robin_hood:
+            hashes = self._hashes
+            shift = self._shift
+            while keys[following] is not _EMPTY and (following - (((hashes[following] * _FIBONACCI) & _MASK64) >> shift)) & mask:
+                keys[index] = keys[following]
+                values[index] = values[following]
+                hashes[index] = hashes[following]
+                index = following
+                following = (following + 1) & mask
+            keys[index] = _EMPTY
+        elif keys[following] is _EMPTY:
+            keys[index] = _EMPTY
+        else:
+            keys[index] = _TOMBSTONE
+            self._tombstones += 1
+        values[index] = None
+        self._count -= 1
+        return True
+
+    def __contains__(self, key: KT) -> bool:
+        return self._find(key, self._hash_function(key) & _MASK64) >= 0
+
+    def _get_hashed(self, key: KT, key_hash: int, default: object) -> VT | object:
+        index = self._find(key, key_hash & _MASK64)
+        return default if index < 0 else self._values[index]
+
+    def _entries(self) -> Iterator[Tuple[int, KT, VT]]:
+        for k, v, key_hash in zip(self._keys, self._values, self._hashes):
+            if k is not _EMPTY and k is not _TOMBSTONE:
+                yield (key_hash, k, v)
+
+    def _bucket_count(self) -> int:
+        return len(self._keys)
+
+    def _probe_histogram(self) -> dict[int, int]:
+        """ Probe length (1 = found in its home slot) -> number of entries needing that many probes. """
+        histogram: dict[int, int] = {}
+        mask = self._mask
+        shift = self._shift
+        for index, (k, key_hash) in enumerate(zip(self._keys, self._hashes)):
+            if k is not _EMPTY and k is not _TOMBSTONE:
+                length = ((index - (((key_hash * _FIBONACCI) & _MASK64) >> shift)) & mask) + 1
+                histogram[length] = histogram.get(length, 0) + 1
+        return histogram
+
+    def _storage_bytes(self) -> int:
+        """ Bytes used by the three parallel arrays. Keys and values themselves are not counted. """
+        return sys.getsizeof(self._keys) + sys.getsizeof(self._values) + sys.getsizeof(self._hashes)
+
+    def keys(self) -> Iterator[KT]:
+        for k in self._keys:
+            if k is not _EMPTY and k is not _TOMBSTONE:
+                yield k
+
+    def values(self) -> Iterator[VT]:
+        for k, v in zip(self._keys, self._values):
+            if k is not _EMPTY and k is not _TOMBSTONE:
+                yield v
+
+    def items(self) -> Iterator[Tuple[KT, VT]]:
+        for k, v in zip(self._keys, self._values):
+            if k is not _EMPTY and k is not _TOMBSTONE:
+                yield (k, v)
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'OOPS!\nThis is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
@@ -0,0 +1,365 @@
+from __future__ import annotations
+
+import mmap
+import os
+import pickle
+import struct
+from typing import Iterator, Optional, Tuple
+
+from datastructures.hashmap import HashMap
+from datastructures.ihashmap import KT, VT, IHashMap
+
+_INDEX_MAGIC = b'PHMIDX01'
+_DATA_MAGIC = b'PHMDAT01'
+# magic, capacity, count, tombstones, dirty flag
+_INDEX_HEADER = struct.Struct('<8sQQQQ')
+_INDEX_HEADER_SIZE = 64
+_SLOT_SIZE = 16
+# key length, value length, kind
+_RECORD_HEADER = struct.Struct('<QQB')
+_SET = 1
+_DELETE = 2
+# Data offsets start after the data file magic, so 0 and 1 are free to mark empty and deleted slots.
+_EMPTY = 0
+_TOMBSTONE = 1
+_MASK64 = (1 << 64) - 1
+
+
+class PersistentHashMap(IHashMap[KT, VT]):
+    """
+    Disk-backed HashMap made of two files:
+
+    - `<path>.dat`, an append-only log of pickled records. A set appends (key, value) and a delete
+      appends a delete marker for the key, so nothing already written is ever modified.
+    - `<path>.idx`, a memory-mapped open-addressing index of fixed-width slots (64-bit hash, 64-bit
+      offset of the key's latest record in the log). Lookups probe the index and only read the log
+      for slots whose hash matches.
+
+    Keys are hashed with HashMap._default_hash_function (pickle + MD5), which is stable across
+    processes, so an index written by one process is valid in the next.
+
+    Opening a cleanly flushed map only maps the index; nothing is loaded. The index header carries a
+    dirty flag, set (and synced) before the first change after a flush and cleared by flush(). If a
+    map is opened with the flag still set, the process did not flush before stopping, and the index
+    is rebuilt by replaying the log, dropping any partially written record at its end.
+    """
+
+    def __init__(self, path: str, initial_capacity: int=1024, load_factor: float=0.75) -> None:
+        if not 0 < load_factor < 1:
+            raise ValueError("load_factor must be between 0 and 1")
+        self._index_path: str = path + '.idx'
+        self._data_path: str = path + '.dat'
+        self._load_factor_threshold: float = load_factor
+        if not os.path.exists(self._data_path):
+            with open(self._data_path, 'wb') as data_file:
+                data_file.write(_DATA_MAGIC)
+                data_file.flush()
+                os.fsync(data_file.fileno())
+        self._data = open(self._data_path, 'r+b')
+        if self._data.read(len(_DATA_MAGIC)) != _DATA_MAGIC:
+            self._data.close()
+            raise ValueError(f"{self._data_path} is not a PersistentHashMap data file")
+        self._data_end: int = self._data.seek(0, os.SEEK_END)
+        self._dirty: bool = False
+        if self._index_is_clean():
+            self._map_index(open(self._index_path, 'r+b'))
+        else:
+            self._rebuild_index(self._capacity_for(initial_capacity))
+
+    @staticmethod
+    def _capacity_for(entries: int) -> int:
+        capacity = 16
+        while capacity < entries:
+            capacity *= 2
+        return capacity
+
+    @staticmethod
+    def _hash(key: KT) -> int:
+        return HashMap._default_hash_function(key) & _MASK64
+
+    # Index file
+
+    def _index_is_clean(self) -> bool:
+        if not os.path.exists(self._index_path):
+            return False
+        with open(self._index_path, 'rb') as index_file:
+            header = index_file.read(_INDEX_HEADER.size)
+        if len(header) < _INDEX_HEADER.size:
+            return False
+        magic, _, _, _, dirty = _INDEX_HEADER.unpack(header)
+        return magic == _INDEX_MAGIC and not dirty
+
+    @staticmethod
+    def _create_index_file(path: str, capacity: int) -> None:
+        with open(path, 'wb') as index_file:
+            index_file.truncate(_INDEX_HEADER_SIZE + capacity * _SLOT_SIZE)
+            index_file.write(_INDEX_HEADER.pack(_INDEX_MAGIC, capacity, 0, 0, 1))
+
+    def _map_index(self, index_file) -> None:
+        self._index_file = index_file
+        self._index = mmap.mmap(index_file.fileno(), 0)
+        _, self._capacity, self._count, self._tombstones, _ = _INDEX_HEADER.unpack_from(self._index, 0)
+        # slots[2 * i] is the hash of slot i and slots[2 * i + 1] the offset of its record.
+        self._slots = memoryview(self._index)[_INDEX_HEADER_SIZE:].cast('Q')
+
+    def _unmap_index(self) -> None:
+        self._slots.release()
+        self._index.close()
+        self._index_file.close()
+
+    def _write_header(self, dirty: bool) -> None:
+        _INDEX_HEADER.pack_into(self._index, 0, _INDEX_MAGIC, self._capacity, self._count, self._tombstones, int(dirty))
+
+    def _mark_dirty(self) -> None:
+        if not self._dirty:
+            self._write_header(dirty=True)
+            self._index.flush(0, _INDEX_HEADER_SIZE)
+            self._dirty = True
+
+    def _replace_index(self, capacity: int, dirty: bool) -> None:
+        """ Writes every live slot into a fresh index of `capacity` slots and swaps it in. Placement uses
+            the stored hashes, so the log is not read.
+        """
+        temporary_path = self._index_path + '.tmp'
+        self._create_index_file(temporary_path, capacity)
+        live = [(self._slots[2 * i], self._slots[2 * i + 1]) for i in range(self._capacity) if self._slots[2 * i + 1] > _TOMBSTONE]
+        count = self._count
+        self._unmap_index()
+        self._map_index(open(temporary_path, 'r+b'))
+        mask = capacity - 1
+        for key_hash, offset in live:
+            index = key_hash & mask
+            while self._slots[2 * index + 1] != _EMPTY:
+                index = (index + 1) & mask
+            self._slots[2 * index] = key_hash
+            self._slots[2 * index + 1] = offset
+        self._count = count
+        self._write_header(dirty)
+        self._index.flush()
+        os.replace(temporary_path, self._index_path)
+
+    def _probe(self, key: KT, key_hash: int) -> Tuple[int, int]:
+        """ Returns (slot holding `key` or -1, first slot an insert of `key` could use). """
+        slots = self._slots
+        mask = self._capacity - 1
+        index = key_hash & mask
+        free = -1
+        while True:
+            offset = slots[2 * index + 1]
+            if offset == _EMPTY:
+                return -1, index if free < 0 else free
+            if offset == _TOMBSTONE:
+                if free < 0:
+                    free = index
+            elif slots[2 * index] == key_hash and self._read_key(offset) == key:
+                return index, free
+            index = (index + 1) & mask
+
+    def _index_put(self, key: KT, key_hash: int, offset: int) -> None:
+        index, free = self._probe(key, key_hash)
+        if index >= 0:
+            self._slots[2 * index + 1] = offset
+            return
+        if self._count + self._tombstones + 1 > self._capacity * self._load_factor_threshold:
+            self._replace_index(self._capacity_for(int((self._count + 1) / self._load_factor_threshold) + 1), dirty=True)
+            _, free = self._probe(key, key_hash)
+        if self._slots[2 * free + 1] == _TOMBSTONE:
+            self._tombstones -= 1
+        self._slots[2 * free] = key_hash
+        self._slots[2 * free + 1] = offset
+        self._count += 1
+
+    def _index_remove(self, key: KT, key_hash: int) -> bool:
+        index, _ = self._probe(key, key_hash)
+        if index < 0:
+            return False
+        self._slots[2 * index + 1] = _TOMBSTONE
+        self._tombstones += 1
+        self._count -= 1
+        return True
+
+    def _rebuild_index(self, capacity: int) -> None:
+        """ Recreates the index from scratch by replaying the log, then flushes it clean. """
+        self._create_index_file(self._index_path, capacity)
+        self._map_index(open(self._index_path, 'r+b'))
+        self._dirty = True
+        offset = len(_DATA_MAGIC)
+        while True:
+            record = self._read_record(offset)
+            if record is None:
+                break
+            kind, key_bytes, _, length = record
+            key = pickle.loads(key_bytes)
+            if kind == _SET:
+                self._index_put(key, self._hash(key), offset)
+            else:
+                self._index_remove(key, self._hash(key))
+            offset += length
+        if offset != self._data_end:
+            # A record was cut off part-way through; drop it.
+            self._data.truncate(offset)
+            self._data_end = offset
+        self.flush()
+
+    # Data file
+
+    def _read_record(self, offset: int) -> Optional[Tuple[int, bytes, bytes, int]]:
+        """ Returns (kind, key bytes, value bytes, total length) or None if no complete record starts at `offset`. """
+        self._data.seek(offset)
+        header = self._data.read(_RECORD_HEADER.size)
+        if len(header) < _RECORD_HEADER.size:
+            return None
+        key_length, value_length, kind = _RECORD_HEADER.unpack(header)
+        body = self._data.read(key_length + value_length)
+        if len(body) < key_length + value_length or kind not in (_SET, _DELETE):
+            return None
+        return kind, body[:key_length], body[key_length:], _RECORD_HEADER.size + key_length + value_length
+
+    def _read_key(self, offset: int) -> KT:
+        self._data.seek(offset)
+        key_length, _, _ = _RECORD_HEADER.unpack(self._data.read(_RECORD_HEADER.size))
+        return pickle.loads(self._data.read(key_length))
+
+    def _read_item(self, offset: int) -> Tuple[KT, VT]:
+        _, key_bytes, value_bytes, _ = self._read_record(offset)
+        return pickle.loads(key_bytes), pickle.loads(value_bytes)
+
+    def _append(self, kind: int, key_bytes: bytes, value_bytes: bytes) -> int:
+        offset = self._data_end
+        self._data.seek(offset)
+        self._data.write(_RECORD_HEADER.pack(len(key_bytes), len(value_bytes), kind) + key_bytes + value_bytes)
+        self._data_end += _RECORD_HEADER.size + len(key_bytes) + len(value_bytes)
+        return offset
+
+    # IHashMap
+
+    def __getitem__(self, key: KT) -> VT:
+        index, _ = self._probe(key, self._hash(key))
+        if index < 0:
+            raise KeyError
+        return self._read_item(self._slots[2 * index + 1])[1]
+
+    def __setitem__(self, key: KT, value: VT) -> None:
+        key_hash = self._hash(key)
+        self._mark_dirty()
+        offset = self._append(_SET, pickle.dumps(key), pickle.dumps(value))
+        self._index_put(key, key_hash, offset)
+
+    def __delitem__(self, key: KT) -> None:
+        key_hash = self._hash(key)
+        index, _ = self._probe(key, key_hash)
+        if index < 0:
+            raise KeyError
+        self._mark_dirty()
+        self._append(_DELETE, pickle.dumps(key), b'')
+        self._index_remove(key, key_hash)
+
+    def __contains__(self, key: KT) -> bool:
+        return self._probe(key, self._hash(key))[0] >= 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _live_offsets(self) -> list[int]:
+        slots = self._slots
+        return [slots[2 * i + 1] for i in range(self._capacity) if slots[2 * i + 1] > _TOMBSTONE]
+
+    def items(self) -> Iterator[Tuple[KT, VT]]:
+        for offset in self._live_offsets():
+            yield self._read_item(offset)
+
+    def keys(self) -> Iterator[KT]:
+        for offset in self._live_offsets():
+            yield self._read_key(offset)
+
+    def values(self) -> Iterator[VT]:
+        for _, value in self.items():
+            yield value
+
+    def __iter__(self) -> Iterator[KT]:
+        return self.keys()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IHashMap):
+            return False
+        if len(self) != len(other):
+            return False
+        for key, value in self.items():
+            if key not in other or other[key] != value:
+                return False
+        return True
+
+    def __str__(self) -> str:
+        return "{" + ", ".join(f"{key}: {value}" for key, value in self.items()) + "}"
+
+    def __repr__(self) -> str:
+        return f"PersistentHashMap({str(self)})"
+
+    # Durability
+
+    def flush(self) -> None:
+        """ Makes every change so far durable: the log is fsynced first, then the index is synced with its dirty flag cleared. """
+        self._data.flush()
+        os.fsync(self._data.fileno())
+        self._write_header(dirty=False)
+        self._index.flush()
+        self._dirty = False
+
+    def compact(self) -> None:
+        """ Rewrites the log with only the latest record of each live key and rebuilds a right-sized index.
+            Both files are written to the side first. The current index is marked dirty before the swap,
+            so a crash between the two renames is repaired by a log replay on the next open.
+        """
+        temporary_data_path = self._data_path + '.compact'
+        live = [(self._slots[2 * i], self._slots[2 * i + 1]) for i in range(self._capacity) if self._slots[2 * i + 1] > _TOMBSTONE]
+        relocated = []
+        with open(temporary_data_path, 'wb') as compacted:
+            compacted.write(_DATA_MAGIC)
+            for key_hash, offset in live:
+                kind, key_bytes, value_bytes, _ = self._read_record(offset)
+                relocated.append((key_hash, compacted.tell()))
+                compacted.write(_RECORD_HEADER.pack(len(key_bytes), len(value_bytes), kind) + key_bytes + value_bytes)
+            compacted.flush()
+            os.fsync(compacted.fileno())
+
+        capacity = self._capacity_for(int((len(relocated) + 1) / self._load_factor_threshold) + 1)
+        temporary_index_path = self._index_path + '.compact'
+        self._create_index_file(temporary_index_path, capacity)
+        with open(temporary_index_path, 'r+b') as index_file, mmap.mmap(index_file.fileno(), 0) as index:
+            slots = memoryview(index)[_INDEX_HEADER_SIZE:].cast('Q')
+            mask = capacity - 1
+            for key_hash, offset in relocated:
+                slot = key_hash & mask
+                while slots[2 * slot + 1] != _EMPTY:
+                    slot = (slot + 1) & mask
+                slots[2 * slot] = key_hash
+                slots[2 * slot + 1] = offset
+            slots.release()
+            _INDEX_HEADER.pack_into(index, 0, _INDEX_MAGIC, capacity, len(relocated), 0, 0)
+            index.flush()
+
+        self._mark_dirty()
+        self._data.close()
+        os.replace(temporary_data_path, self._data_path)
+        self._data = open(self._data_path, 'r+b')
+        self._data_end = self._data.seek(0, os.SEEK_END)
+        self._unmap_index()
+        os.replace(temporary_index_path, self._index_path)
+        self._map_index(open(self._index_path, 'r+b'))
+        self._dirty = False
+
+    def close(self) -> None:
+        self.flush()
+        self._unmap_index()
+        self._data.close()
+
+    def __enter__(self) -> PersistentHashMap[KT, VT]:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'OOPS!\nThis is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
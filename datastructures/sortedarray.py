@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import os
+from typing import Any, Callable, Optional, Sequence, overload
+
+from datastructures.array import Array, T
+from datastructures.arraybackends import ArrayBackend
+from datastructures.validation import ValidationMode
+
+
+class SortedArray(Array[T]):
+    """
+    Array that keeps its items in ascending order, by `key` if one is given. Equal items stay in
+    insertion order. Membership, index() and count() binary-search instead of scanning, so they are
+    O(log n) (plus the number of items with an equal key, when there is a key). append and append_front
+    place items in order with insert_sorted. Assigning to a position would break the order and raises
+    TypeError, and slicing returns a copy rather than a write-through view for the same reason.
+    """
+
+    def __init__(self, starting_sequence: Sequence[T] | int = [], data_type: type = object, validation: ValidationMode | str | None = None, copy: str = 'deep', backend: ArrayBackend | str | None = None, key: Optional[Callable[[T], Any]] = None) -> None:
+        super().__init__(starting_sequence, data_type, validation, copy, backend)
+        self.key: Optional[Callable[[T], Any]] = key
+        super().sort(key=key)
+
+    def _span(self, item: T) -> tuple[int, int]:
+        """ The positions [first, last) of the items whose key equals the key of `item`. """
+        probe = item if self.key is None else self.key(item)
+        return self.bisect_left(probe, key=self.key), self.bisect_right(probe, key=self.key)
+
+    def insert_sorted(self, item: T, key: Optional[Callable[[T], Any]] = None) -> int:
+        """ Inserts `item` in order and returns its position. The array's own key is always used; passing
+            a different `key` would break the order and raises ValueError.
+        """
+        if key is not None and key is not self.key:
+            raise ValueError("SortedArray orders items by its own key; use sort(key=...) to change it")
+        return super().insert_sorted(item, key=self.key)
+
+    def append(self, data: T) -> None:
+        self.insert_sorted(data)
+
+    def append_front(self, data: T) -> None:
+        self.insert_sorted(data)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+    @overload
+    def __getitem__(self, index: slice) -> Array[T]: ...
+    def __getitem__(self, index: int | slice) -> T | Array[T]:
+        if isinstance(index, slice):
+            return super().__getitem__(index).copy()
+        return super().__getitem__(index)
+
+    def __setitem__(self, index: int, item: T) -> None:
+        raise TypeError("SortedArray decides positions itself; use append or insert_sorted")
+
+    def sort(self, key: Optional[Callable[[T], Any]] = None, reverse: bool = False, algorithm: str = 'auto') -> None:
+        """ Re-sorts the items, optionally switching to a new key for later inserts and searches. The order
+            is always ascending; to keep items in descending order, give a key that inverts it.
+        """
+        if reverse:
+            raise ValueError("SortedArray is always in ascending order; use a key to invert it")
+        if key is not None:
+            self.key = key
+        super().sort(key=self.key, algorithm=algorithm)
+
+    def __contains__(self, item: Any) -> bool:
+        try:
+            first, last = self._span(item)
+        except TypeError:
+            # Items that cannot be compared with ours cannot be among them.
+            return False
+        return any(self[position] == item for position in range(first, last))
+
+    def index(self, item: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        first, last = self._span(item)
+        stop = len(self) if stop is None else stop
+        for position in range(max(first, start), min(last, stop)):
+            if self[position] == item:
+                return position
+        raise ValueError(f"{item!r} is not in the SortedArray")
+
+    def count(self, item: Any) -> int:
+        first, last = self._span(item)
+        if self.key is None:
+            return last - first
+        return sum(1 for position in range(first, last) if self[position] == item)
+
+    def __repr__(self) -> str:
+        return f"Sorted{super().__repr__()}"
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'OOPS!\nThis is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
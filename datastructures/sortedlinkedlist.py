@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import heapq
+import os
+from typing import Callable, Iterable, Optional, Sequence
+
+from datastructures.linkedlist import LinkedList, T
+from datastructures.validation import ValidationMode
+
+
+class SortedLinkedList(LinkedList[T]):
+    """
+    LinkedList that keeps its items ordered by `key` (the items themselves by default), descending when
+    `reverse` is True. Equal items stay in insertion order. append, prepend and extend place items in
+    order, and merge() folds in other sorted lists by relinking their nodes. Methods that insert at an
+    explicit position (insert_before, insert_after, the *_node inserts, prepend_node,
+    move_to_front/back, splice) would break the order and raise TypeError.
+    """
+
+    def __init__(self, data_type: type = object, key: Optional[Callable[[T], object]] = None, reverse: bool = False, recycle_nodes: int = 0, validation: Optional[ValidationMode | str] = None) -> None:
+        super().__init__(data_type, recycle_nodes, validation)
+        self.key: Callable[[T], object] = key if key is not None else _identity
+        self.reverse: bool = reverse
+
+    @staticmethod
+    def from_sequence(sequence: Sequence[T], data_type: type=object, key: Optional[Callable[[T], object]]=None, reverse: bool=False, validation: Optional[ValidationMode | str]=None) -> SortedLinkedList[T]:
+        sorted_list = SortedLinkedList(data_type, key, reverse, validation=validation)
+        sorted_list.extend(sequence)
+        return sorted_list
+
+    def _before(self, first: object, second: object) -> bool:
+        """ True if an item with key `first` belongs strictly before one with key `second`. """
+        return second < first if self.reverse else first < second
+
+    def insert_sorted(self, item: T) -> LinkedList.Node:
+        """ Inserts `item` after every item that does not sort after it and returns its node. Items that
+            belong at the end, the common case for time-ordered streams, are placed in O(1); otherwise
+            the list is scanned from the front.
+
+        Examples:
+            >>> events = SortedLinkedList.from_sequence([1, 5, 9])
+            >>> events.insert_sorted(6).next.data
+            9
+        """
+        item_key = self.key(item)
+        if self.tail is None or not self._before(item_key, self.key(self.tail.data)):
+            return super().append(item)
+        current = self.head
+        while current and not self._before(item_key, self.key(current.data)):
+            current = current.next
+        return super().insert_before_node(current, item)
+
+    def append(self, item: T) -> LinkedList.Node:
+        return self.insert_sorted(item)
+
+    def prepend(self, item: T) -> LinkedList.Node:
+        return self.insert_sorted(item)
+
+    def extend(self, items: Iterable[T]) -> None:
+        """ Adds a batch by building it as a chain, sorting that, and merging it in: O(k log k + n). """
+        batch = LinkedList(self.data_type, validation=self._validation)
+        batch.extend(items)
+        batch.sort(key=self._sort_key(), reverse=self.reverse)
+        self.merge(batch)
+
+    def merge(self, *others: LinkedList[T]) -> None:
+        """ k-way merge of already sorted lists into this one, by the same key and direction. The nodes of
+            `others` are relinked, not copied, so the other lists are left empty. Ties keep this list's
+            items first, then the others' in argument order. Costs O(n log k) for n items in k lists.
+        """
+        runs = [self] + [other for other in others if other is not self]
+        for other in runs[1:]:
+            if not issubclass(other.data_type, self.data_type):
+                raise TypeError
+        key = self.key
+        heap = []
+        for index, run in enumerate(runs):
+            if run.head is not None:
+                heap.append((_HeapKey(key(run.head.data), self.reverse), index, run.head))
+        heapq.heapify(heap)
+        total = sum(len(run) for run in runs)
+        for run in runs[1:]:
+            # Detach directly; clear() could hand the nodes to the free-list.
+            run.head = run.tail = None
+            run.count = 0
+        head = tail = None
+        while heap:
+            _, index, node = heap[0]
+            following = node.next
+            if following is not None:
+                heapq.heapreplace(heap, (_HeapKey(key(following.data), self.reverse), index, following))
+            else:
+                heapq.heappop(heap)
+            node.previous = tail
+            node.next = None
+            if tail is None:
+                head = node
+            else:
+                tail.next = node
+            tail = node
+        self.head, self.tail, self.count = head, tail, total
+
+    def sort(self, key: Optional[Callable[[T], object]]=None, reverse: Optional[bool]=None) -> None:
+        """ Re-sorts the list, optionally switching to a new key and/or direction for later inserts. """
+        if key is not None:
+            self.key = key
+        if reverse is not None:
+            self.reverse = reverse
+        super().sort(self._sort_key(), self.reverse)
+
+    def _sort_key(self) -> Optional[Callable[[T], object]]:
+        # Without a custom key, LinkedList.sort compares items directly and skips building a key table.
+        return None if self.key is _identity else self.key
+
+    def _positional(self, *args, **kwargs) -> None:
+        raise TypeError("SortedLinkedList decides positions itself; use insert_sorted or merge")
+
+    insert_before = insert_after = _positional
+    insert_before_node = insert_after_node = prepend_node = _positional
+    move_to_front = move_to_back = splice = _positional
+
+    def __repr__(self) -> str:
+        return f"Sorted{super().__repr__()}"
+
+
+class _HeapKey:
+    """ Heap entry key that flips the comparison for descending merges. """
+    __slots__ = ('key', 'reverse')
+
+    def __init__(self, key: object, reverse: bool) -> None:
+        self.key = key
+        self.reverse = reverse
+
+    def __lt__(self, other: _HeapKey) -> bool:
+        return other.key < self.key if self.reverse else self.key < other.key
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _HeapKey) and not self < other and not other < self
+
+
+def _identity(item: T) -> T:
+    return item
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'OOPS!\nThis is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
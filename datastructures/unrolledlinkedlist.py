@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import os
+from typing import Iterator, Optional, Sequence, Tuple
+from datastructures.ilinkedlist import ILinkedList, T
+from datastructures.linkedlist import LinkedList
+from datastructures.validation import ValidationMode, make_validator
+
+
+class UnrolledLinkedList[T](ILinkedList[T]):
+    """
+    Doubly linked list of chunks. Each node holds a Python list of up to `chunk_capacity` items, so
+    iteration, membership and search run over contiguous lists instead of one node per item.
+
+    Inserting into a full chunk splits it in half. Removing an item from a chunk that drops below half
+    full either merges it with its next chunk, if both fit in one, or moves items over from that
+    chunk. Every chunk except the last stays at least half full, so a list of n items has about
+    n / chunk_capacity nodes at most twice over.
+    """
+
+    @dataclass(slots=True)
+    class Node:
+        items: list = field(default_factory=list)
+        next: Optional[UnrolledLinkedList.Node] = None
+        previous: Optional[UnrolledLinkedList.Node] = None
+
+    def __init__(self, data_type: type = object, chunk_capacity: int = 64, validation: Optional[ValidationMode | str] = None) -> None:
+        if chunk_capacity < 2:
+            raise ValueError("chunk_capacity must be at least 2")
+        self.head: Optional[UnrolledLinkedList.Node] = None
+        self.tail: Optional[UnrolledLinkedList.Node] = None
+        self.count: int = 0
+        self.data_type: type = data_type
+        self._validate = make_validator(data_type, validation)
+        self.chunk_capacity: int = chunk_capacity
+        self._iter_position: Optional[Tuple[UnrolledLinkedList.Node, int]] = None
+        self._iter_started: bool = False
+
+    @staticmethod
+    def from_sequence(sequence: Sequence[T], data_type: type=object, chunk_capacity: int=64, validation: Optional[ValidationMode | str]=None) -> UnrolledLinkedList[T]:
+        unrolled_list = UnrolledLinkedList(data_type, chunk_capacity, validation)
+        items = list(sequence)
+        if unrolled_list._validate is not None:
+            for item in items:
+                unrolled_list._validate(item)
+        for start in range(0, len(items), chunk_capacity):
+            unrolled_list._link_after(unrolled_list.tail, UnrolledLinkedList.Node(items[start:start + chunk_capacity]))
+        unrolled_list.count = len(items)
+        return unrolled_list
+
+    def _link_after(self, anchor: Optional[UnrolledLinkedList.Node], node: UnrolledLinkedList.Node) -> None:
+        """ Attaches a chunk after `anchor`, or at the head when `anchor` is None. Does not touch `count`. """
+        node.previous = anchor
+        node.next = anchor.next if anchor else self.head
+        if node.next:
+            node.next.previous = node
+        else:
+            self.tail = node
+        if anchor:
+            anchor.next = node
+        else:
+            self.head = node
+
+    def _unlink(self, node: UnrolledLinkedList.Node) -> None:
+        if node.previous:
+            node.previous.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.previous = node.previous
+        else:
+            self.tail = node.previous
+
+    def _split(self, node: UnrolledLinkedList.Node) -> None:
+        """ Moves the upper half of a full chunk into a new chunk after it. """
+        half = len(node.items) // 2
+        self._link_after(node, self.Node(node.items[half:]))
+        del node.items[half:]
+
+    def _insert_at(self, node: UnrolledLinkedList.Node, index: int, item: T) -> None:
+        if len(node.items) >= self.chunk_capacity:
+            self._split(node)
+            if index > len(node.items):
+                index -= len(node.items)
+                node = node.next
+        node.items.insert(index, item)
+        self.count += 1
+
+    def _delete_at(self, node: UnrolledLinkedList.Node, index: int) -> T:
+        item = node.items.pop(index)
+        self.count -= 1
+        self._rebalance(node)
+        return item
+
+    def _rebalance(self, node: UnrolledLinkedList.Node) -> None:
+        """ Restores the half-full invariant for `node` after items were taken out of it. """
+        if not node.items:
+            self._unlink(node)
+            return
+        minimum = self.chunk_capacity // 2
+        following = node.next
+        if len(node.items) >= minimum or following is None:
+            return
+        if len(node.items) + len(following.items) <= self.chunk_capacity:
+            node.items.extend(following.items)
+            self._unlink(following)
+        else:
+            moved = minimum - len(node.items)
+            node.items.extend(following.items[:moved])
+            del following.items[:moved]
+
+    def _locate(self, item: T) -> Optional[Tuple[UnrolledLinkedList.Node, int]]:
+        """ Returns (chunk, index) of the first occurrence of `item`, or None. """
+        current = self.head
+        while current:
+            if item in current.items:
+                return current, current.items.index(item)
+            current = current.next
+        return None
+
+    def append(self, item: T) -> None:
+        if self._validate is not None:
+            self._validate(item)
+        if self.tail is None or len(self.tail.items) >= self.chunk_capacity:
+            self._link_after(self.tail, self.Node())
+        self.tail.items.append(item)
+        self.count += 1
+
+    def prepend(self, item: T) -> None:
+        if self._validate is not None:
+            self._validate(item)
+        if self.head is None:
+            self._link_after(None, self.Node())
+        # A full head is split rather than given a new one-item chunk in front, which would not be half full.
+        self._insert_at(self.head, 0, item)
+
+    def insert_before(self, target: T, item: T) -> None:
+        if self._validate is not None:
+            self._validate(target)
+            self._validate(item)
+        position = self._locate(target)
+        if position is None:
+            raise ValueError
+        self._insert_at(position[0], position[1], item)
+
+    def insert_after(self, target: T, item: T) -> None:
+        if self._validate is not None:
+            self._validate(target)
+            self._validate(item)
+        position = self._locate(target)
+        if position is None:
+            raise ValueError
+        self._insert_at(position[0], position[1] + 1, item)
+
+    def remove(self, item: T) -> None:
+        if self._validate is not None:
+            self._validate(item)
+        position = self._locate(item)
+        if position is None:
+            raise ValueError
+        self._delete_at(*position)
+
+    def remove_all(self, item: T) -> None:
+        if self._validate is not None:
+            self._validate(item)
+        current = self.head
+        while current:
+            following = current.next
+            if item in current.items:
+                kept = [existing for existing in current.items if existing != item]
+                self.count -= len(current.items) - len(kept)
+                current.items[:] = kept
+                if not kept:
+                    self._unlink(current)
+            current = following
+        # Merge the chunks that filtering left underfull. A merge can leave a chunk still underfull, so each
+        # one is rebalanced until it is half full or the last before moving on.
+        minimum = self.chunk_capacity // 2
+        current = self.head
+        while current:
+            while len(current.items) < minimum and current.next:
+                self._rebalance(current)
+            current = current.next
+
+    def pop(self) -> T:
+        if self.empty:
+            raise IndexError
+        return self._delete_at(self.tail, len(self.tail.items) - 1)
+
+    def pop_front(self) -> T:
+        if self.empty:
+            raise IndexError
+        return self._delete_at(self.head, 0)
+
+    @property
+    def front(self) -> T:
+        if self.empty:
+            raise IndexError
+        return self.head.items[0]
+
+    @property
+    def back(self) -> T:
+        if self.empty:
+            raise IndexError
+        return self.tail.items[-1]
+
+    @property
+    def empty(self) -> bool:
+        return self.count == 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        self.head = None
+        self.tail = None
+        self.count = 0
+
+    def __contains__(self, item: T) -> bool:
+        current = self.head
+        while current:
+            if item in current.items:
+                return True
+            current = current.next
+        return False
+
+    def __iter__(self) -> Iterator[T]:
+        current = self.head
+        while current:
+            yield from current.items
+            current = current.next
+
+    def __next__(self) -> T:
+        """ Legacy cursor for callers that call next() on the list itself; see LinkedList.__next__. """
+        if not self._iter_started:
+            self._iter_started = True
+            self._iter_position = (self.head, 0) if self.head else None
+        if self._iter_position is None:
+            self._iter_started = False
+            raise StopIteration
+        node, index = self._iter_position
+        item = node.items[index]
+        if index + 1 < len(node.items):
+            self._iter_position = (node, index + 1)
+        else:
+            self._iter_position = (node.next, 0) if node.next else None
+        return item
+
+    def __reversed__(self) -> Iterator[T]:
+        """ Returns a lazy back-to-front iterator; nothing is copied. """
+        current = self.tail
+        while current:
+            yield from reversed(current.items)
+            current = current.previous
+
+    def __eq__(self, other: object) -> bool:
+        """ Equal to any linked list, LinkedList.View, list or tuple holding equal items in the same order. """
+        if not isinstance(other, (ILinkedList, LinkedList.View, list, tuple)):
+            return False
+        if len(self) != len(other):
+            return False
+        return all(mine == theirs for mine, theirs in zip(self, other))
+
+    def __str__(self) -> str:
+        return '[' + ', '.join(repr(item) for item in self) + ']'
+
+    def __repr__(self) -> str:
+        return f"UnrolledLinkedList({' <-> '.join(repr(item) for item in self)}) Count: {self.count}"
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'OOPS!\nThis is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
@@ -0,0 +1,101 @@
+""" Package-wide policy for the `data_type` checks made by the containers in this package.
+
+    Each container resolves its policy once, when it is constructed, from its `validation=` argument or,
+    when that is None, from the global default set with set_default_validation(). Containers with
+    `data_type=object` never check anything, whatever the mode.
+"""
+
+from __future__ import annotations
+
+from enum import Enum
+import os
+from typing import Callable, Optional
+
+
+class ValidationMode(Enum):
+    STRICT = 'strict'
+    """ Every item is checked. """
+    SAMPLED = 'sampled'
+    """ One item in every `sample_every` is checked, which catches systematic mistakes cheaply. """
+    DEBUG = 'debug'
+    """ Strict normally, off when Python runs with -O (when `__debug__` is False). """
+    OFF = 'off'
+    """ Nothing is checked; the caller guarantees the data is homogeneous. """
+
+
+_default_mode: ValidationMode = ValidationMode.STRICT
+DEFAULT_SAMPLE_EVERY = 64
+
+Validator = Callable[[object], None]
+
+
+def set_default_validation(mode: ValidationMode | str) -> None:
+    """ Sets the mode used by containers constructed afterwards without an explicit `validation=`. """
+    global _default_mode
+    _default_mode = ValidationMode(mode)
+
+
+def get_default_validation() -> ValidationMode:
+    return _default_mode
+
+
+class _SampledValidator:
+    """ Checks the first item and then every `every`-th one. """
+    __slots__ = ('accepted', 'every', 'countdown')
+
+    def __init__(self, accepted: type | tuple[type, ...], every: int) -> None:
+        self.accepted = accepted
+        self.every = every
+        self.countdown = 1
+
+    def __call__(self, item: object) -> None:
+        self.countdown -= 1
+        if self.countdown:
+            return
+        self.countdown = self.every
+        if not isinstance(item, self.accepted):
+            raise TypeError(f"Expected {_describe(self.accepted)}, got {type(item).__name__}")
+
+
+def make_validator(accepted: type | tuple[type, ...], mode: Optional[ValidationMode | str]=None, sample_every: int=DEFAULT_SAMPLE_EVERY) -> Optional[Validator]:
+    """ Returns a callable that raises TypeError for items that are not instances of `accepted`, or None
+        when the resolved mode checks nothing, so hot paths can skip the call with one `is None` test.
+
+    Examples:
+        >>> validate = make_validator(int, 'strict')
+        >>> validate('one')
+        Traceback (most recent call last):
+        TypeError: Expected int, got str
+        >>> make_validator(int, 'off') is None
+        True
+
+    Args:
+        accepted (type | tuple[type, ...]): The type or types items must be instances of.
+        mode (ValidationMode | str | None): The mode to use; None means the global default.
+        sample_every (int): How often SAMPLED mode checks an item.
+    Returns:
+        Optional[Validator]: The validator, or None when nothing needs checking.
+    """
+    mode = _default_mode if mode is None else ValidationMode(mode)
+    if accepted is object or mode is ValidationMode.OFF or (mode is ValidationMode.DEBUG and not __debug__):
+        return None
+    if mode is ValidationMode.SAMPLED:
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        return _SampledValidator(accepted, sample_every)
+
+    def validate(item: object) -> None:
+        if not isinstance(item, accepted):
+            raise TypeError(f"Expected {_describe(accepted)}, got {type(item).__name__}")
+    return validate
+
+
+def _describe(accepted: type | tuple[type, ...]) -> str:
+    if isinstance(accepted, tuple):
+        return ' or '.join(kind.__name__ for kind in accepted)
+    return accepted.__name__
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'OOPS!\nThis is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
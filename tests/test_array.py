@@ -1,4 +1,6 @@
+import array
 import copy
+import numpy as np
 import pytest
 from datastructures.array import Array
 
@@ -112,11 +114,345 @@ class TestArray:
             assert expected == item
             expected -= 1
 
-    # def test_setitem_operator_should_raise_a_type_error_exception_if_the_item_being_set_is_not_the_same_type_as_the_array(self, setup_numerical_array: Array):
-    #     with pytest.raises(TypeError):
-    #         setup_numerical_array[0] = 'string'
+    def test_setitem_operator_should_raise_a_type_error_exception_if_the_item_being_set_is_not_the_same_type_as_the_array(self, setup_numerical_array: Array):
+        with pytest.raises(TypeError):
+            setup_numerical_array[0] = 'string'
 
     def test_bracket_operator_should_return_a_slice_of_the_array_if_a_slice_is_passed_in(self, setup_numerical_array: Array):
         assert setup_numerical_array[1:5] == Array([1, 2, 3, 4])
 
+    def test_constructing_with_copy_shallow_should_copy_the_items_but_not_what_they_reference(self):
+        cars = [self.car1, self.car2]
+        shallow = Array(cars, Car, copy='shallow')
+        assert shallow[0] is not self.car1
+        assert shallow[0].vin == self.car1.vin
+
+    def test_constructing_with_copy_none_should_store_the_callers_objects(self):
+        none = Array([self.car1, self.car2], Car, copy='none')
+        assert none[0] is self.car1
+        assert none[1] is self.car2
+
+    def test_constructing_with_an_unknown_copy_mode_should_raise_a_value_error(self):
+        with pytest.raises(ValueError):
+            Array([1, 2], int, copy='sometimes')
+
+    def test_constructing_from_a_numpy_array_should_copy_its_data(self):
+        source = np.arange(5, dtype=np.int64)
+        copied = Array(source, int)
+        source[0] = 100
+        assert list(copied) == [0, 1, 2, 3, 4]
+
+    def test_constructing_from_a_numpy_array_with_copy_none_should_share_its_buffer(self):
+        source = np.arange(5, dtype=np.int64)
+        shared = Array(source, int, copy='none')
+        source[0] = 100
+        assert shared[0] == 100
+
+    def test_constructing_from_buffer_protocol_sources_should_load_their_items(self):
+        assert list(Array(array.array('i', [1, 2, 3]), int)) == [1, 2, 3]
+        assert list(Array(bytes([4, 5, 6]), int)) == [4, 5, 6]
+        assert list(Array(memoryview(array.array('d', [1.5, 2.5])), float)) == [1.5, 2.5]
+
+    def test_constructing_from_a_buffer_of_another_kind_should_raise_a_type_error(self):
+        with pytest.raises(TypeError):
+            Array(array.array('d', [1.5, 2.5]), int)
+
+    def test_constructing_from_a_buffer_of_another_kind_should_cast_when_validation_is_off(self):
+        assert list(Array(array.array('d', [1.5, 2.5]), int, validation='off')) == [1, 2]
+
+    def test_constructing_an_object_array_from_a_numpy_array_should_hold_python_objects(self):
+        objects = Array(np.arange(3))
+        assert list(objects) == [0, 1, 2]
+        assert type(objects[0]) is int
+
+    def test_slicing_should_return_a_view_that_shares_the_arrays_buffer(self, setup_numerical_array: Array):
+        window = setup_numerical_array[2:5]
+        assert isinstance(window, Array.View)
+        window[0] = 20
+        assert setup_numerical_array[2] == 20
+        setup_numerical_array[3] = 30
+        assert window[1] == 30
+
+    def test_slicing_should_support_strides_and_nested_views(self, setup_numerical_array: Array):
+        evens = setup_numerical_array[::2]
+        assert list(evens) == [0, 2, 4, 6, 8]
+        assert list(evens[1:4]) == [2, 4, 6]
+        assert list(reversed(evens)) == [8, 6, 4, 2, 0]
+        evens[1:3] = [-2, -4]
+        assert list(setup_numerical_array[:5]) == [0, 1, -2, 3, -4]
+
+    def test_slicing_should_stop_at_the_logical_size(self):
+        array = Array[int](20, int)
+        array.append(1)
+        array.append(2)
+        assert len(array[:]) == 2
+
+    def test_view_should_support_len_contains_and_equality(self, setup_numerical_array: Array):
+        window = setup_numerical_array[4:7]
+        assert len(window) == 3
+        assert 5 in window
+        assert 9 not in window
+        assert window == [4, 5, 6]
+        assert Array([4, 5, 6], int) == window
+
+    def test_view_index_out_of_bounds_should_raise_an_index_error(self, setup_numerical_array: Array):
+        with pytest.raises(IndexError):
+            setup_numerical_array[2:4][2]
+
+    def test_view_setitem_should_validate_against_the_arrays_data_type(self, setup_numerical_array: Array):
+        window = setup_numerical_array[0:3]
+        with pytest.raises(TypeError):
+            window[0] = 'string'
+        with pytest.raises(TypeError):
+            window[0:2] = [1, 'two']
+
+    def test_view_copy_should_return_an_independent_array(self, setup_numerical_array: Array):
+        copied = setup_numerical_array[1:4].copy()
+        assert isinstance(copied, Array)
+        copied[0] = 100
+        assert setup_numerical_array[1] == 1
+        assert copied == Array([100, 2, 3], int)
+
+    def test_view_copy_of_complex_objects_should_deep_copy_them(self, setup_complex_object_array: Array[Car]):
+        copied = setup_complex_object_array[:2].copy()
+        assert copied[0] is not setup_complex_object_array[0]
+        assert copied[0].vin == setup_complex_object_array[0].vin
+
+    def test_append_front_should_keep_the_documented_physical_sizes(self):
+        array = Array[int](data_type=int)
+        sizes = []
+        for num in range(10, 0, -1):
+            array.append_front(num)
+            sizes.append(array._Array__physical_size)
+        assert list(array) == list(range(1, 11))
+        assert sizes == [1, 2, 4, 4, 8, 8, 8, 8, 16, 16]
+
+    def test_append_should_keep_the_documented_physical_sizes(self):
+        array = Array[int](data_type=int)
+        sizes = []
+        for num in range(10):
+            array.append(num)
+            sizes.append(array._Array__physical_size)
+        assert sizes == [1, 2, 4, 4, 8, 8, 8, 8, 16, 16]
+
+    def test_pop_front_should_shrink_by_half_at_a_quarter_full(self, setup_numerical_array: Array):
+        for _ in range(7):
+            setup_numerical_array.pop_front()
+        assert setup_numerical_array._Array__physical_size == 10
+        setup_numerical_array.pop_front()
+        assert setup_numerical_array._Array__physical_size == 5
+        assert list(setup_numerical_array) == [8, 9]
+
+    def test_mixed_front_and_back_operations_should_keep_the_items_in_order(self):
+        array = Array[int](data_type=int)
+        expected = []
+        for num in range(1, 200):
+            if num % 3 == 0:
+                array.append_front(num)
+                expected.insert(0, num)
+            else:
+                array.append(num)
+                expected.append(num)
+            if num % 7 == 0:
+                array.pop_front()
+                expected.pop(0)
+            if num % 11 == 0:
+                array.pop()
+                expected.pop()
+        assert list(array) == expected
+        assert list(reversed(array)) == expected[::-1]
+        del array[3]
+        del array[len(array) - 3]
+        del expected[3]
+        del expected[len(expected) - 3]
+        assert list(array) == expected
+        assert [array[i] for i in range(len(array))] == expected
+
+    def test_queue_use_should_not_grow_the_array(self, setup_numerical_array: Array):
+        for num in range(10, 1000):
+            setup_numerical_array.append(num)
+            setup_numerical_array.pop_front()
+        assert list(setup_numerical_array) == list(range(990, 1000))
+        assert setup_numerical_array._Array__physical_size <= 20
+
+    def test_asarray_should_view_the_live_items_without_copying(self, setup_numerical_array: Array):
+        setup_numerical_array.pop_front()
+        items = np.asarray(setup_numerical_array)
+        assert items.tolist() == list(range(1, 10))
+        items[0] = 100
+        assert setup_numerical_array[0] == 100
+
+    def test_asarray_with_copy_should_not_share_the_items(self, setup_numerical_array: Array):
+        items = np.array(setup_numerical_array, copy=True)
+        items[0] = 100
+        assert setup_numerical_array[0] == 0
+
+    def test_asarray_of_a_list_backed_array_should_copy_or_refuse(self):
+        cars = Array([self.car1, self.car2], Car, copy='none')
+        assert np.asarray(cars).tolist() == [self.car1, self.car2]
+        with pytest.raises(ValueError):
+            np.asarray(cars, copy=False)
+
+    def test_memoryview_should_expose_the_live_items(self, setup_numerical_array: Array):
+        view = memoryview(setup_numerical_array)
+        assert view.shape == (10,)
+        assert view.tolist() == list(range(10))
+
+    def test_memoryview_of_a_list_backed_array_should_raise_a_type_error(self, setup_complex_object_array: Array[Car]):
+        with pytest.raises(TypeError):
+            memoryview(setup_complex_object_array)
+
+    def test_array_interface_should_describe_the_live_items(self, setup_numerical_array: Array):
+        interface = setup_numerical_array.__array_interface__
+        assert interface['shape'] == (10,)
+        assert interface['data'][0] == np.asarray(setup_numerical_array).ctypes.data
+        assert not hasattr(Array([self.car1], Car), '__array_interface__')
+
+    def test_from_buffer_should_share_the_buffers_memory(self):
+        raw = bytearray([1, 2, 3])
+        shared = Array.from_buffer(raw)
+        shared[0] = 9
+        assert raw[0] == 9
+        assert list(Array.from_buffer(array.array('d', [1.5, 2.5]))) == [1.5, 2.5]
+
+    def test_from_buffer_with_another_data_type_should_cast(self):
+        assert list(Array.from_buffer(array.array('i', [1, 2]), float)) == [1.0, 2.0]
+
+    def test_repr_should_show_the_sizes_and_type(self, setup_numerical_array: Array):
+        assert repr(setup_numerical_array) == "Array [0, 1, 2, 3, 4, 5, 6, 7, 8, 9], Logical: 10, Physical: 10, type: <class 'int'>"
+
+    def test_reductions_should_cover_only_the_live_items(self, setup_numerical_array: Array):
+        setup_numerical_array.pop_front()
+        setup_numerical_array.pop()
+        assert setup_numerical_array.sum() == 36
+        assert setup_numerical_array.min() == 1
+        assert setup_numerical_array.max() == 8
+        assert setup_numerical_array.mean() == 4.5
+
+    def test_reductions_of_an_empty_array_should_raise_a_value_error(self):
+        empty = Array[int](data_type=int)
+        assert empty.sum() == 0
+        for reduction in (empty.min, empty.max, empty.mean):
+            with pytest.raises(ValueError):
+                reduction()
+
+    def test_arithmetic_with_a_scalar_should_return_a_new_array(self, setup_numerical_array: Array):
+        doubled = setup_numerical_array * 2
+        assert list(doubled) == [2 * i for i in range(10)]
+        assert doubled.data_type is int
+        assert list(1 + setup_numerical_array) == list(range(1, 11))
+        assert list(10 - setup_numerical_array) == list(range(10, 0, -1))
+        assert list(setup_numerical_array) == list(range(10))
+
+    def test_arithmetic_should_widen_the_data_type_when_numpy_does(self, setup_numerical_array: Array):
+        halves = setup_numerical_array / 2
+        assert halves[1] == 0.5
+        assert np.dtype(halves.data_type) == np.float64
+
+    def test_arithmetic_between_arrays_should_be_elementwise(self):
+        first = Array([1, 2, 3], int)
+        second = Array([10, 20, 30], int)
+        assert list(first + second) == [11, 22, 33]
+        assert list(second[::-1] - first) == [29, 18, 7]
+        assert list(-first) == [-1, -2, -3]
+        with pytest.raises(ValueError):
+            first + Array([1, 2], int)
+        with pytest.raises(ValueError):
+            first + Array([1], int)
+        with pytest.raises(ValueError):
+            first * [2]
+        with pytest.raises(ValueError):
+            np.array([1]) + first
+
+    def test_ufuncs_and_ndarray_operands_should_return_an_array(self):
+        numbers = Array([1, 4, 9], int)
+        roots = np.sqrt(numbers)
+        assert isinstance(roots, Array)
+        assert list(roots) == [1.0, 2.0, 3.0]
+        total = np.array([1, 2, 3]) + numbers
+        assert isinstance(total, Array)
+        assert list(total) == [2, 6, 12]
+        assert list(np.arange(3) * numbers) == [0, 4, 18]
+        assert np.add.reduce(numbers) == 14
+
+    def test_map_should_apply_a_ufunc_to_every_item(self):
+        roots = Array([1, 4, 9], int).map(np.sqrt)
+        assert list(roots) == [1.0, 2.0, 3.0]
+        assert list(Array([1, 5, 9], int).map(np.clip, 2, 8)) == [2, 5, 8]
+        with pytest.raises(ValueError):
+            Array([1, 2], int).map(np.sum)
+
+    def test_filter_should_keep_the_items_where_the_mask_is_true(self, setup_numerical_array: Array):
+        assert list(setup_numerical_array.filter(lambda items: items % 3 == 0)) == [0, 3, 6, 9]
+        assert list(setup_numerical_array[:3].copy().filter([True, False, True])) == [0, 2]
+        with pytest.raises(TypeError):
+            setup_numerical_array.filter(list(range(10)))
+
+    def test_argsort_and_sort_should_be_stable(self):
+        numbers = Array([3, 1, 2, 1], int)
+        assert list(numbers.argsort()) == [1, 3, 2, 0]
+        numbers.sort()
+        assert list(numbers) == [1, 1, 2, 3]
+
+    def test_sort_of_a_list_backed_array_should_sort_in_place(self):
+        words = Array(['pear', 'apple', 'fig'])
+        words.append_front('kiwi')
+        words.sort()
+        assert list(words) == ['apple', 'fig', 'kiwi', 'pear']
+
+    @pytest.mark.parametrize('algorithm', ['auto', 'radix', 'numpy', 'timsort'])
+    def test_sort_algorithms_should_agree_with_sorted(self, algorithm: str):
+        items = [((i * 7919) % 1000) - 500 for i in range(1000)]
+        for reverse in (False, True):
+            numbers = Array(items, int)
+            numbers.sort(reverse=reverse, algorithm=algorithm)
+            assert list(numbers) == sorted(items, reverse=reverse)
+
+    def test_radix_sort_should_handle_the_full_integer_range(self):
+        items = [2 ** 63 - 1, -2 ** 63, 0, -1, 1, 2 ** 40, -2 ** 40]
+        numbers = Array(items, int)
+        numbers.sort(algorithm='radix')
+        assert list(numbers) == sorted(items)
+        unsigned = Array(np.array([2 ** 64 - 1, 0, 2 ** 32], dtype=np.uint64), np.uint64)
+        unsigned.sort(algorithm='radix')
+        assert list(unsigned) == [0, 2 ** 32, 2 ** 64 - 1]
+
+    def test_sort_with_a_key_should_be_stable_in_both_directions(self):
+        cars = Array([self.car1, self.car2, self.car3], Car, copy='none')
+        cars.sort(key=lambda car: car.make.value, reverse=True)
+        assert [car.make for car in cars] == sorted([self.car1.make, self.car2.make, self.car3.make], key=lambda make: make.value, reverse=True)
+        toyotas = [car for car in cars if car.make == self.car1.make]
+        assert toyotas == [self.car1, self.car2]
+
+    def test_sort_should_reject_algorithms_that_do_not_fit(self):
+        with pytest.raises(ValueError):
+            Array([1.5, 0.5], float).sort(algorithm='radix')
+        with pytest.raises(ValueError):
+            Array([1, 2], int).sort(key=abs, algorithm='numpy')
+        with pytest.raises(ValueError):
+            Array([1, 2], int).sort(algorithm='quick')
+
+    def test_bisect_should_find_insertion_points_in_sorted_items(self):
+        for backend in ('numpy', 'list'):
+            numbers = Array([1, 2, 2, 2, 5], int, backend=backend)
+            numbers.pop_front()
+            assert numbers.bisect_left(2) == 0
+            assert numbers.bisect_right(2) == 3
+            assert numbers.bisect_left(9) == 4
+            assert numbers.bisect_left(2, 1) == 1
+            assert numbers.bisect_right(5, 0, 3) == 3
+
+    def test_bisect_with_a_key_should_compare_keys(self):
+        cars = Array([self.car1, self.car2, self.car3], Car, copy='none')
+        assert cars.bisect_left('456', key=lambda car: car.vin) == 1
+        assert cars.bisect_right('456', key=lambda car: car.vin) == 2
+
+    def test_insert_sorted_should_keep_the_items_sorted(self):
+        for backend in ('numpy', 'list'):
+            numbers = Array(data_type=int, backend=backend)
+            for item in (5, 1, 9, 3, 3, 7, 0, 10):
+                numbers.insert_sorted(item)
+            assert list(numbers) == [0, 1, 3, 3, 5, 7, 9, 10]
+        with pytest.raises(TypeError):
+            numbers.insert_sorted('eleven')
 
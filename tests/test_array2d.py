@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from datastructures.array2d import Array2D
@@ -108,4 +109,26 @@ class TestArray2D:
     def test_init_inconsistent_lengths(self) -> None:
         """Ensures a ValueError is raised if rows in `starting_sequence` have different lengths."""
         with pytest.raises(ValueError):
-            _ = Array2D([[1, 2, 3], [4, 5]], data_type=int)
\ No newline at end of file
+            _ = Array2D([[1, 2, 3], [4, 5]], data_type=int)
+
+    def test_asarray_should_view_the_items_as_rows_and_columns(self, filled3x3: Array2D[int]) -> None:
+        """Checks that np.asarray returns a 3x3 view that writes through."""
+        items = np.asarray(filled3x3)
+        assert items.shape == (3, 3)
+        items[1, 1] = 50
+        assert filled3x3[1][1] == 50
+
+    def test_memoryview_and_array_interface_should_be_two_dimensional(self, filled3x3: Array2D[int]) -> None:
+        """Checks the buffer protocol and array interface report the 2D shape."""
+        assert memoryview(filled3x3).tolist() == [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+        assert filled3x3.__array_interface__['shape'] == (3, 3)
+
+    def test_from_buffer_should_share_memory(self) -> None:
+        """Checks that Array2D.from_buffer wraps a buffer without copying."""
+        source = np.arange(6.0)
+        grid = Array2D.from_buffer(source, 2, 3)
+        grid[1][2] = 50.0
+        assert source[5] == 50.0
+        with pytest.raises(ValueError):
+            Array2D.from_buffer(source, 4, 4)
+
@@ -0,0 +1,159 @@
+import numpy as np
+import pytest
+from datastructures.array import Array
+from datastructures.arraybackends import ListBackend, MemmapBackend, NumpyBackend
+
+from tests.car import Car, Color, Make, Model
+
+class TestArrayBackends:
+    car1 = Car('123', Color.RED, Make.TOYOTA, Model.CAMRY)
+    car2 = Car('456', Color.BLUE, Make.TOYOTA, Model.CIVIC)
+
+    @pytest.fixture(params=['list', 'numpy', 'memmap'])
+    def backend(self, request, tmp_path):
+        if request.param == 'memmap':
+            return MemmapBackend(tmp_path / 'array.bin')
+        return request.param
+
+    def test_backend_should_default_to_numpy_for_numeric_data_types(self):
+        assert isinstance(Array([1, 2], int).backend, NumpyBackend)
+        assert isinstance(Array([1.5], np.float32).backend, NumpyBackend)
+
+    def test_backend_should_default_to_list_for_other_data_types(self):
+        assert isinstance(Array([self.car1], Car).backend, ListBackend)
+        assert isinstance(Array(['a', 'b'], str).backend, ListBackend)
+        assert isinstance(Array([None, 1]).backend, ListBackend)
+
+    def test_unknown_backend_should_raise_a_value_error(self):
+        with pytest.raises(ValueError):
+            Array([1], int, backend='tape')
+
+    def test_memmap_backend_should_reject_non_numeric_data_types(self, tmp_path):
+        with pytest.raises(TypeError):
+            Array([self.car1], Car, backend=MemmapBackend(tmp_path / 'cars.bin'))
+
+    def test_every_backend_should_support_the_array_operations(self, backend):
+        array = Array([3, 4, 5], int, backend=backend)
+        array.append(6)
+        array.append_front(2)
+        array.append_front(1)
+        array[0] = 0
+        assert list(array) == [0, 2, 3, 4, 5, 6]
+        assert list(reversed(array)) == [6, 5, 4, 3, 2, 0]
+        assert 4 in array
+        assert 7 not in array
+        del array[1]
+        array.pop()
+        array.pop_front()
+        assert list(array) == [3, 4, 5]
+        assert array == Array([3, 4, 5], int)
+
+    def test_every_backend_should_support_write_through_views(self, backend):
+        array = Array(list(range(10)), int, backend=backend)
+        evens = array[::2]
+        evens[1] = 20
+        evens[2:4] = [40, 60]
+        assert list(array[:7]) == [0, 1, 20, 3, 40, 5, 60]
+        assert list(evens[1:3]) == [20, 40]
+        assert list(reversed(evens)) == [8, 60, 40, 20, 0]
+
+    def test_list_backend_should_store_the_objects_it_is_given(self):
+        array = Array([self.car1, self.car2], Car, copy='none')
+        assert array[0] is self.car1
+        assert type(array[0]) is Car
+
+    def test_list_backend_should_adopt_a_list_passed_with_copy_none(self):
+        buckets = [None] * 4
+        array = Array(buckets, copy='none')
+        array[2] = 'bucket'
+        assert buckets[2] == 'bucket'
+
+    def test_list_backend_should_copy_the_sequence_otherwise(self):
+        items = [1, 2, 3]
+        array = Array(items, int, backend='list')
+        array[0] = 100
+        assert items[0] == 1
+        assert type(array[1]) is int
+
+    def test_list_window_should_reject_slice_assignment_of_another_length(self):
+        array = Array([1, 2, 3, 4])
+        window = array[:]
+        with pytest.raises(ValueError):
+            window[0:2] = [1]
+
+    def test_memmap_backend_should_keep_the_buffer_in_its_file(self, tmp_path):
+        path = tmp_path / 'numbers.bin'
+        array = Array(np.arange(8, dtype=np.int64), np.int64, backend=MemmapBackend(path))
+        array.append(8)
+        assert path.stat().st_size == 64 + 16 * 8
+        assert list(array) == list(range(9))
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_open_should_create_an_array_file_that_can_be_attached_to_again(self, tmp_path):
+        path = tmp_path / 'readings.bin'
+        with Array.open(path, float, 'w+') as readings:
+            for value in (1.5, 2.5, 3.5):
+                readings.append(value)
+            readings.append_front(0.5)
+        attached = Array.open(path, mode='r')
+        assert list(attached) == [0.5, 1.5, 2.5, 3.5]
+        assert isinstance(attached.backend, MemmapBackend)
+
+    def test_open_should_grow_the_file_by_doubling_without_moving_the_items(self, tmp_path):
+        path = tmp_path / 'counts.bin'
+        counts = Array.open(path, np.int32, 'w+')
+        for value in range(5):
+            counts.append(value)
+        assert path.stat().st_size == 64 + 8 * 4
+        counts.flush()
+        counts = Array.open(path, np.int32)
+        counts.append(5)
+        counts.flush()
+        assert list(Array.open(path, mode='r')) == [0, 1, 2, 3, 4, 5]
+
+    def test_open_should_not_shrink_the_file(self, tmp_path):
+        path = tmp_path / 'counts.bin'
+        counts = Array.open(path, int, 'w+')
+        for value in range(16):
+            counts.append(value)
+        size = path.stat().st_size
+        for _ in range(14):
+            counts.pop_front()
+        counts.flush()
+        assert path.stat().st_size == size
+        assert list(Array.open(path)) == [14, 15]
+
+    def test_open_should_only_see_changes_after_a_flush(self, tmp_path):
+        path = tmp_path / 'shared.bin'
+        writer = Array.open(path, int, 'w+')
+        writer.append(1)
+        writer.flush()
+        writer.append(2)
+        assert list(Array.open(path, mode='r')) == [1]
+        writer.flush()
+        assert list(Array.open(path, mode='r')) == [1, 2]
+
+    def test_open_read_only_should_refuse_to_grow(self, tmp_path):
+        path = tmp_path / 'fixed.bin'
+        Array.open(path, int, 'w+').flush()
+        fixed = Array.open(path, mode='r')
+        with pytest.raises(ValueError):
+            fixed.append(1)
+
+    def test_open_should_check_the_data_type_against_the_file(self, tmp_path):
+        path = tmp_path / 'typed.bin'
+        Array.open(path, np.int64, 'w+').flush()
+        assert Array.open(path, int).data_type is int
+        with pytest.raises(TypeError):
+            Array.open(path, float)
+
+    def test_open_should_reject_files_that_are_not_array_files(self, tmp_path):
+        path = tmp_path / 'other.bin'
+        path.write_bytes(b'not an array')
+        with pytest.raises(ValueError):
+            Array.open(path)
+
+    def test_open_for_writing_should_need_a_data_type(self, tmp_path):
+        with pytest.raises(ValueError):
+            Array.open(tmp_path / 'untyped.bin', mode='w+')
+
@@ -0,0 +1,131 @@
+from datastructures.cache import LFUCache, LRUCache, TTLCache, cached
+import pytest
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+class TestLRUCache:
+
+    @pytest.fixture
+    def cache(self) -> LRUCache[str, int]:
+        return LRUCache[str, int](max_size=3)
+
+    def test_evicts_least_recently_used(self, cache: LRUCache[str, int]):
+        cache['a'] = 1
+        cache['b'] = 2
+        cache['c'] = 3
+        assert cache['a'] == 1
+        cache['d'] = 4
+        assert 'b' not in cache
+        assert sorted(cache) == ['a', 'c', 'd']
+        assert cache.stats().evictions == 1
+
+    def test_counters(self, cache: LRUCache[str, int]):
+        cache['a'] = 1
+        cache.get('a')
+        cache.get('missing')
+        with pytest.raises(KeyError):
+            _ = cache['missing']
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (1, 2)
+        assert stats.hit_rate == pytest.approx(1 / 3)
+
+    def test_overwrite_and_delete(self, cache: LRUCache[str, int]):
+        cache['a'] = 1
+        cache['a'] = 2
+        assert len(cache) == 1
+        assert cache['a'] == 2
+        del cache['a']
+        assert len(cache) == 0
+        with pytest.raises(KeyError):
+            del cache['a']
+
+    def test_max_bytes(self):
+        cache = LRUCache[str, bytes](max_size=None, max_bytes=100, sizeof=len)
+        cache['a'] = b'x' * 40
+        cache['b'] = b'x' * 40
+        cache['c'] = b'x' * 40
+        assert sorted(cache) == ['b', 'c']
+        assert cache.stats().bytes == 80
+        cache['huge'] = b'x' * 101
+        assert 'huge' not in cache
+
+    def test_clear(self, cache: LRUCache[str, int]):
+        cache['a'] = 1
+        cache['b'] = 2
+        cache.clear()
+        assert len(cache) == 0
+        assert cache._order.empty
+
+    def test_requires_a_bound(self):
+        with pytest.raises(ValueError):
+            LRUCache(max_size=None)
+
+class TestLFUCache:
+
+    def test_evicts_least_frequently_used(self):
+        cache = LFUCache[str, int](max_size=3)
+        cache['a'] = 1
+        cache['b'] = 2
+        cache['c'] = 3
+        cache.get('a')
+        cache.get('a')
+        cache.get('c')
+        cache['d'] = 4
+        assert 'b' not in cache
+        cache['e'] = 5
+        assert 'd' not in cache
+        assert sorted(cache) == ['a', 'c', 'e']
+
+    def test_ties_break_by_recency(self):
+        cache = LFUCache[str, int](max_size=2)
+        cache['a'] = 1
+        cache['b'] = 2
+        cache['c'] = 3
+        assert sorted(cache) == ['b', 'c']
+
+    def test_delete_lowest_frequency(self):
+        cache = LFUCache[str, int](max_size=2)
+        cache['a'] = 1
+        cache['b'] = 2
+        cache.get('b')
+        del cache['a']
+        cache['c'] = 3
+        cache['d'] = 4
+        assert sorted(cache) == ['b', 'd']
+
+class TestTTLCache:
+
+    def test_entries_expire(self):
+        timer = FakeTimer()
+        cache = TTLCache[str, int](ttl=10, timer=timer)
+        cache['a'] = 1
+        timer.now = 5
+        cache['b'] = 2
+        timer.now = 10
+        assert 'a' not in cache
+        assert cache['b'] == 2
+        timer.now = 20
+        assert cache.expire() == 1
+        assert len(cache) == 0
+        assert cache.stats().expirations == 2
+
+class TestCachedDecorator:
+
+    def test_memoizes(self):
+        calls = []
+
+        @cached(LRUCache(max_size=8))
+        def add(a, b=0):
+            calls.append((a, b))
+            return a + b
+
+        assert add(1, b=2) == 3
+        assert add(1, b=2) == 3
+        assert add(1, 2) == 3
+        assert calls == [(1, 2), (1, 2)]
+        assert add.cache.stats().hits == 1
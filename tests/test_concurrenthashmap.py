@@ -0,0 +1,84 @@
+import threading
+
+from datastructures.concurrenthashmap import ConcurrentHashMap
+from datastructures.hashmap import HashMap
+import pytest
+
+class TestConcurrentHashMap:
+
+    @pytest.fixture
+    def empty_map(self) -> ConcurrentHashMap[int, str]:
+        return ConcurrentHashMap[int, str](segments=4)
+
+    @pytest.fixture
+    def populated_map(self, empty_map: ConcurrentHashMap[int, str]) -> ConcurrentHashMap[int, str]:
+        for i in range(100):
+            empty_map[i] = str(i)
+        return empty_map
+
+    def test_set_get_delete(self, empty_map: ConcurrentHashMap[int, str]):
+        empty_map[1] = "one"
+        assert empty_map[1] == "one"
+        assert 1 in empty_map
+        del empty_map[1]
+        assert 1 not in empty_map
+        with pytest.raises(KeyError):
+            _ = empty_map[1]
+        with pytest.raises(KeyError):
+            del empty_map[1]
+
+    def test_len_and_iteration(self, populated_map: ConcurrentHashMap[int, str]):
+        assert len(populated_map) == 100
+        assert sorted(populated_map) == list(range(100))
+        assert sorted(populated_map.values(), key=int) == [str(i) for i in range(100)]
+
+    def test_keys_spread_over_segments(self, populated_map: ConcurrentHashMap[int, str]):
+        assert all(len(segment) > 0 for segment in populated_map._segments)
+
+    def test_open_addressing_segments_do_not_cluster(self):
+        concurrent_map = ConcurrentHashMap[int, int](segments=16, storage="open_addressing")
+        for i in range(8000):
+            concurrent_map[i] = i
+        assert all(segment.stats().max_probe_length < 64 for segment in concurrent_map._segments)
+        assert all(concurrent_map[i] == i for i in range(8000))
+
+    def test_equal_to_hashmap(self, populated_map: ConcurrentHashMap[int, str]):
+        hashmap = HashMap.from_items((i, str(i)) for i in range(100))
+        assert populated_map == hashmap
+        assert hashmap == populated_map
+
+    def test_compute_if_absent_runs_once_per_key(self, empty_map: ConcurrentHashMap[int, str]):
+        calls = []
+        def compute(key: int) -> str:
+            calls.append(key)
+            return str(key)
+
+        def worker() -> None:
+            for i in range(200):
+                assert empty_map.compute_if_absent(i, compute) == str(i)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sorted(calls) == list(range(200))
+        assert len(empty_map) == 200
+
+    def test_concurrent_writers_and_iteration(self, empty_map: ConcurrentHashMap[int, str]):
+        def writer(offset: int) -> None:
+            for i in range(offset, offset + 500):
+                empty_map[i] = str(i)
+                if i % 2:
+                    del empty_map[i]
+
+        threads = [threading.Thread(target=writer, args=(n * 500,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            for key, value in empty_map.items():
+                assert value == str(key)
+        for thread in threads:
+            thread.join()
+        assert len(empty_map) == 1000
+        assert all(empty_map[i] == str(i) for i in range(0, 2000, 2))
@@ -1,5 +1,6 @@
 from datastructures.hashmap import HashMap
 import pytest
+from tests.car import Car, Color, Make, Model
 
 class TestHashMap:
 
@@ -52,3 +53,154 @@ class TestHashMap:
         assert len(empty_hashmap) == 20
         for i in range(20):
             assert empty_hashmap[i] == str(i)
+
+    def test_stable_hash_strategy(self):
+        hashmap = HashMap[str, int](hash_strategy="stable")
+        for i in range(20):
+            hashmap[str(i)] = i
+        assert len(hashmap) == 20
+        assert hashmap["7"] == 7
+
+    def test_unknown_hash_strategy(self):
+        with pytest.raises(ValueError):
+            HashMap(hash_strategy="sha1")
+
+    def test_fast_hash_unhashable_keys(self, empty_hashmap: HashMap):
+        empty_hashmap[[1, 2]] = "list"
+        empty_hashmap[{"a": [1]}] = "dict"
+        empty_hashmap[(1, [2])] = "tuple"
+        empty_hashmap[{1, 2}] = "set"
+        assert empty_hashmap[[1, 2]] == "list"
+        assert empty_hashmap[{"a": [1]}] == "dict"
+        assert empty_hashmap[(1, [2])] == "tuple"
+        assert empty_hashmap[frozenset({1, 2})] == "set"
+
+    def test_fast_hash_nested_keys(self, empty_hashmap: HashMap):
+        empty_hashmap[(1, {2})] = "set in tuple"
+        empty_hashmap[(b"a", (bytearray(b"b"), [3]))] = "nested"
+        empty_hashmap[[{"a": {1}}]] = "dict in list"
+        assert empty_hashmap[(1, frozenset({2}))] == "set in tuple"
+        assert empty_hashmap[(bytearray(b"a"), (b"b", [3]))] == "nested"
+        assert empty_hashmap[[{"a": frozenset({1})}]] == "dict in list"
+
+    def test_fast_hash_car_keys(self, empty_hashmap: HashMap):
+        car = Car(vin="123", color=Color.RED, make=Make.TOYOTA, model=Model.CAMRY)
+        empty_hashmap[car] = "camry"
+        assert empty_hashmap[Car(vin="123", color=Color.RED, make=Make.TOYOTA, model=Model.CAMRY)] == "camry"
+
+    def test_incremental_resize(self):
+        hashmap = HashMap[int, str](incremental_resize=True, migration_batch=2)
+        for i in range(7):
+            hashmap[i] = str(i)
+        assert hashmap.stats().resize_count == 1
+        assert all(hashmap[i] == str(i) for i in range(7))
+        for i in range(7, 200):
+            hashmap[i] = str(i)
+            assert hashmap[i // 2] == str(i // 2)
+        assert len(hashmap) == 200
+        assert sorted(hashmap.keys()) == list(range(200))
+        for i in range(0, 200, 3):
+            del hashmap[i]
+        assert all((i in hashmap) == (i % 3 != 0) for i in range(200))
+
+    def test_incremental_resize_does_not_rehash(self):
+        calls = []
+        def counting_hash(key: int) -> int:
+            calls.append(key)
+            return key
+        hashmap = HashMap[int, int](custom_hash_function=counting_hash, incremental_resize=True)
+        for i in range(100):
+            hashmap[i] = i
+        assert len(calls) == 100
+
+    def test_hash_compared_before_equality(self):
+        hashmap = HashMap[int, int](custom_hash_function=lambda key: key // 4, number_of_buckets=1, load_factor=100)
+        for i in range(16):
+            hashmap[i] = i
+        before = hashmap.equality_checks
+        assert hashmap[15] == 15
+        assert hashmap.equality_checks - before == 3
+        assert hashmap.equality_checks_avoided >= 12
+
+    def test_eq_uses_stored_hashes(self, populated_hashmap: HashMap[int, str]):
+        calls = []
+        def counting_hash(key: int) -> int:
+            calls.append(key)
+            return key
+        first = HashMap[int, str](custom_hash_function=counting_hash)
+        second = HashMap[int, str](custom_hash_function=counting_hash)
+        for i in range(10):
+            first[i] = str(i)
+            second[9 - i] = str(9 - i)
+        calls.clear()
+        assert first == second
+        assert calls == []
+        second[3] = "three"
+        assert first != second
+        assert first == populated_hashmap
+
+    def test_from_items_presizes_once(self):
+        hashmap = HashMap.from_items(((i, str(i)) for i in range(1000)), expected_size=1000)
+        assert len(hashmap) == 1000
+        assert hashmap[999] == "999"
+        stats = hashmap.stats()
+        assert stats.bucket_count * 0.75 > 1000
+        assert stats.resize_count == 1
+        hashmap.set_many((i, str(i)) for i in range(10))
+        assert hashmap.stats().resize_count == 1
+
+    def test_from_items_with_options(self):
+        hashmap = HashMap.from_items({"a": 1, "b": 2}, storage="open_addressing")
+        assert hashmap == HashMap.from_items([("b", 2), ("a", 1)])
+
+    def test_update(self, populated_hashmap: HashMap[int, str]):
+        populated_hashmap.update({1: "one", 20: "twenty"})
+        populated_hashmap.update([(2, "two")])
+        assert populated_hashmap[1] == "one"
+        assert populated_hashmap[2] == "two"
+        assert populated_hashmap[20] == "twenty"
+        assert len(populated_hashmap) == 11
+
+    def test_get(self, populated_hashmap: HashMap[int, str]):
+        assert populated_hashmap.get(1) == "1"
+        assert populated_hashmap.get(99) is None
+        assert populated_hashmap.get(99, "?") == "?"
+        assert HashMap(storage="open_addressing").get(1, "?") == "?"
+
+    def test_get_set_delete_many(self, populated_hashmap: HashMap[int, str]):
+        assert populated_hashmap.get_many([1, 99, 3], default="?") == ["1", "?", "3"]
+        populated_hashmap.set_many([(i, str(i)) for i in range(5, 3000)])
+        assert len(populated_hashmap) == 3000
+        assert populated_hashmap.delete_many(range(0, 3000, 2)) == 1500
+        assert populated_hashmap.delete_many([0, 1]) == 1
+        assert len(populated_hashmap) == 1499
+        assert 2 not in populated_hashmap
+        assert populated_hashmap[2999] == "2999"
+
+    def test_stats(self, populated_hashmap: HashMap[int, str]):
+        stats = populated_hashmap.stats()
+        assert stats.entry_count == 10
+        assert stats.bucket_count == 14
+        assert stats.load_factor == 10 / 14
+        assert stats.resize_count == 1
+        assert stats.resize_seconds > 0
+        assert sum(stats.probe_length_histogram.values()) == 14
+        assert sum(length * buckets for length, buckets in stats.probe_length_histogram.items()) == 10
+        assert stats.max_probe_length == max(stats.probe_length_histogram)
+        assert stats.bytes_per_entry > 0
+        assert stats.get_samples == 0
+
+    def test_stats_sampling(self, populated_hashmap: HashMap[int, str]):
+        populated_hashmap.enable_sampling(every=1)
+        for i in range(10):
+            populated_hashmap[i] = populated_hashmap[i] + "!"
+        stats = populated_hashmap.stats()
+        assert stats.get_samples == 10
+        assert stats.set_samples == 10
+        populated_hashmap.enable_sampling(every=4)
+        for i in range(10):
+            populated_hashmap[i]
+        assert populated_hashmap.stats().get_samples == 2
+        assert stats.get_max_seconds >= stats.get_mean_seconds > 0
+        populated_hashmap.disable_sampling()
+        assert populated_hashmap.stats().get_samples == 0
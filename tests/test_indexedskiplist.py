@@ -0,0 +1,94 @@
+import random
+
+import pytest
+
+from datastructures.indexedskiplist import IndexedSkipList
+from datastructures.linkedlist import LinkedList
+
+class TestIndexedSkipList:
+
+    @pytest.fixture
+    def empty(self) -> IndexedSkipList[int]:
+        return IndexedSkipList[int](data_type=int, seed=1)
+
+    @pytest.fixture
+    def skip_list(self) -> IndexedSkipList[int]:
+        return IndexedSkipList[int].from_sequence(range(10), data_type=int)
+
+    def test_getitem(self, skip_list: IndexedSkipList[int]) -> None:
+        assert [skip_list[i] for i in range(10)] == list(range(10))
+        assert skip_list[-1] == 9
+        assert skip_list[2:5] == [2, 3, 4]
+        assert skip_list[::3] == [0, 3, 6, 9]
+        with pytest.raises(IndexError):
+            _ = skip_list[10]
+        with pytest.raises(TypeError):
+            _ = skip_list['a']
+
+    def test_insert_at_and_delete(self, skip_list: IndexedSkipList[int]) -> None:
+        skip_list.insert_at(0, -1)
+        skip_list.insert_at(5, 99)
+        skip_list.insert_at(len(skip_list), 100)
+        assert list(skip_list) == [-1, 0, 1, 2, 3, 99, 4, 5, 6, 7, 8, 9, 100]
+        del skip_list[5]
+        del skip_list[-1]
+        del skip_list[0]
+        assert list(skip_list) == list(range(10))
+        with pytest.raises(IndexError):
+            skip_list.insert_at(12, 1)
+
+    def test_setitem(self, skip_list: IndexedSkipList[int]) -> None:
+        skip_list[3] = 33
+        assert skip_list[3] == 33
+        with pytest.raises(TypeError):
+            skip_list[3] = 'x'
+
+    def test_matches_list_under_random_edits(self, empty: IndexedSkipList[int]) -> None:
+        rng = random.Random(7)
+        expected = []
+        for step in range(2000):
+            if expected and rng.random() < 0.4:
+                index = rng.randrange(len(expected))
+                del expected[index]
+                del empty[index]
+            else:
+                index = rng.randint(0, len(expected))
+                expected.insert(index, step)
+                empty.insert_at(index, step)
+        assert list(empty) == expected
+        assert list(reversed(empty)) == expected[::-1]
+        assert [empty[i] for i in range(0, len(expected), 37)] == expected[::37]
+        assert list(empty.iter_range(10, 50)) == expected[10:50]
+
+    def test_linked_list_api(self, skip_list: IndexedSkipList[int]) -> None:
+        skip_list.insert_before(3, 30)
+        skip_list.insert_after(3, 31)
+        skip_list.append(3)
+        skip_list.prepend(3)
+        assert list(skip_list) == [3, 0, 1, 2, 30, 3, 31, 4, 5, 6, 7, 8, 9, 3]
+        skip_list.remove(30)
+        skip_list.remove_all(3)
+        assert list(skip_list) == [0, 1, 2, 31, 4, 5, 6, 7, 8, 9]
+        assert skip_list.pop() == 9
+        assert skip_list.pop_front() == 0
+        assert (skip_list.front, skip_list.back) == (1, 8)
+        assert skip_list[3] == 4
+        with pytest.raises(ValueError):
+            skip_list.remove(100)
+
+    def test_empty_behaviour(self, empty: IndexedSkipList[int]) -> None:
+        assert empty.empty
+        with pytest.raises(IndexError):
+            empty.pop()
+        with pytest.raises(IndexError):
+            _ = empty.front
+        empty.append(1)
+        empty.clear()
+        assert len(empty) == 0
+        assert list(empty) == []
+
+    def test_eq_and_str(self, skip_list: IndexedSkipList[int]) -> None:
+        assert skip_list == LinkedList.from_sequence(list(range(10)))
+        assert skip_list != IndexedSkipList.from_sequence(range(9))
+        assert str(skip_list) == str(list(range(10)))
+        assert 5 in skip_list and 50 not in skip_list
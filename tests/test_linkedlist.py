@@ -112,6 +112,15 @@ class TestLinkedList:
         other.append(5)
         assert linked_list != other
 
+    def test_eq_with_views_and_sequences(self, linked_list: ILinkedList[int]) -> None:
+        backwards = LinkedList[int].from_sequence([4, 3, 2, 1, 0], data_type=int)
+        assert backwards == reversed(linked_list)
+        assert reversed(linked_list) == backwards
+        assert linked_list == [0, 1, 2, 3, 4]
+        assert linked_list == (0, 1, 2, 3, 4)
+        assert linked_list != [0, 1, 2, 3]
+        assert linked_list != "01234"
+
     def test_reversed(self, linked_list: ILinkedList[int]) -> None:
         reversed_list = list(reversed(linked_list))
         assert reversed_list == [4, 3, 2, 1, 0]
@@ -142,4 +151,174 @@ class TestLinkedList:
         with pytest.raises(ValueError):
             linked_list.insert_after(10, 99)  # Target not in list
         with pytest.raises(ValueError):
-            linked_list.remove(10)  # Item not in list
\ No newline at end of file
+            linked_list.remove(10)  # Item not in list
+
+    def test_append_returns_node(self, empty: ILinkedList[int]) -> None:
+        node = empty.append(1)
+        assert node.data == 1
+        assert empty.tail is node
+        assert empty.prepend(0) is empty.head
+
+    def test_remove_node(self, linked_list: ILinkedList[int]) -> None:
+        node = linked_list.head.next.next
+        assert linked_list.remove_node(node) == 2
+        assert list(linked_list) == [0, 1, 3, 4]
+        assert linked_list.remove_node(linked_list.tail) == 4
+        assert linked_list.tail.data == 3
+        assert len(linked_list) == 3
+
+    def test_insert_around_node(self, linked_list: ILinkedList[int]) -> None:
+        node = linked_list.head
+        linked_list.insert_before_node(node, -1)
+        linked_list.insert_after_node(linked_list.tail, 5)
+        linked_list.insert_after_node(node, 99)
+        assert list(linked_list) == [-1, 0, 99, 1, 2, 3, 4, 5]
+        assert linked_list.head.data == -1
+        assert linked_list.tail.data == 5
+        with pytest.raises(TypeError):
+            linked_list.insert_after_node(node, 'x')
+
+    def test_move_to_front_and_back(self, linked_list: ILinkedList[int]) -> None:
+        linked_list.move_to_front(linked_list.tail)
+        assert list(linked_list) == [4, 0, 1, 2, 3]
+        linked_list.move_to_back(linked_list.head)
+        assert list(linked_list) == [0, 1, 2, 3, 4]
+        assert len(linked_list) == 5
+
+    def test_prepend_node_moves_a_node_between_lists(self, linked_list: ILinkedList[int]) -> None:
+        other = LinkedList[int].from_sequence([10, 11], data_type=int)
+        node = linked_list.tail
+        linked_list.remove_node(node)
+        assert other.prepend_node(node) is node
+        assert list(other) == [4, 10, 11]
+        assert list(linked_list) == [0, 1, 2, 3]
+        other.remove_node(node)
+        with pytest.raises(TypeError):
+            LinkedList[str](data_type=str).prepend_node(node)
+
+    def test_pop_removes_tail_node_with_duplicates(self) -> None:
+        linked_list = LinkedList[int].from_sequence([7, 1, 7], data_type=int)
+        first = linked_list.head
+        assert linked_list.pop() == 7
+        assert linked_list.head is first
+        assert list(linked_list) == [7, 1]
+
+    def test_splice(self, linked_list: ILinkedList[int]) -> None:
+        other = LinkedList[int].from_sequence([10, 11], data_type=int)
+        handle = other.head
+        linked_list.splice(other, after=linked_list.head)
+        assert list(linked_list) == [0, 10, 11, 1, 2, 3, 4]
+        assert len(linked_list) == 7
+        assert other.empty
+        linked_list.remove_node(handle)
+        linked_list.splice(LinkedList[int].from_sequence([5], data_type=int))
+        assert list(linked_list) == [0, 11, 1, 2, 3, 4, 5]
+        assert linked_list.tail.data == 5
+
+    def test_splice_into_empty(self, empty: ILinkedList[int]) -> None:
+        empty.splice(LinkedList[int].from_sequence([1, 2], data_type=int))
+        assert list(empty) == [1, 2]
+        assert list(reversed(empty)) == [2, 1]
+        with pytest.raises(TypeError):
+            empty.splice(LinkedList.from_sequence(['a'], data_type=str))
+
+    def test_nodes_are_slotted(self, linked_list: ILinkedList[int]) -> None:
+        assert not hasattr(linked_list.head, '__dict__')
+
+    def test_recycles_popped_nodes(self) -> None:
+        linked_list = LinkedList[int](data_type=int, recycle_nodes=2)
+        node = linked_list.append(1)
+        linked_list.append(2)
+        assert linked_list.pop_front() == 1
+        assert node.data is None
+        assert linked_list.append(3) is node
+        assert list(linked_list) == [2, 3]
+
+    def test_recycle_limit(self) -> None:
+        linked_list = LinkedList[int].from_sequence([0, 1, 2, 3], data_type=int)
+        node = linked_list.head
+        linked_list.clear()
+        assert linked_list.append(4) is not node
+        linked_list = LinkedList[int](data_type=int, recycle_nodes=2)
+        nodes = [linked_list.append(i) for i in range(4)]
+        linked_list.clear()
+        assert linked_list.empty
+        reused = [linked_list.append(i) for i in range(3)]
+        assert sum(any(new is old for old in nodes) for new in reused) == 2
+        with pytest.raises(ValueError):
+            LinkedList(recycle_nodes=-1)
+
+    def test_remove_node_does_not_recycle(self) -> None:
+        linked_list = LinkedList[int](data_type=int, recycle_nodes=4)
+        node = linked_list.append(0)
+        linked_list.append(1)
+        assert linked_list.remove_node(node) == 0
+        assert node.data == 0
+        assert linked_list.append(2) is not node
+
+    def test_nested_iteration(self, linked_list: ILinkedList[int]) -> None:
+        pairs = [(a, b) for a in linked_list for b in linked_list]
+        assert len(pairs) == 25
+        assert pairs[-1] == (4, 4)
+
+    def test_remove_current_item_while_iterating(self, linked_list: ILinkedList[int]) -> None:
+        for item in linked_list:
+            if item % 2:
+                linked_list.remove(item)
+        assert list(linked_list) == [0, 2, 4]
+
+    def test_reversed_is_lazy(self, linked_list: ILinkedList[int]) -> None:
+        backwards = reversed(linked_list)
+        linked_list.append(5)
+        assert list(backwards) == [5, 4, 3, 2, 1, 0]
+        assert len(backwards) == 6
+        assert list(reversed(backwards)) == [0, 1, 2, 3, 4, 5]
+
+    def test_view(self, linked_list: ILinkedList[int]) -> None:
+        assert list(linked_list.view(1, 4)) == [1, 2, 3]
+        assert list(linked_list.view(1, 4, reverse=True)) == [3, 2, 1]
+        assert list(linked_list.view(-2)) == [3, 4]
+        assert list(linked_list.view(3, 1)) == []
+        assert list(linked_list.view(2, 100)) == [2, 3, 4]
+        assert len(linked_list.view(0, -1)) == 4
+        assert str(linked_list.view(0, 2)) == '[0, 1]'
+
+    def test_legacy_next(self, linked_list: ILinkedList[int]) -> None:
+        assert [next(linked_list) for _ in range(5)] == [0, 1, 2, 3, 4]
+        with pytest.raises(StopIteration):
+            next(linked_list)
+        assert next(linked_list) == 0
+
+    def test_extend(self, linked_list: ILinkedList[int]) -> None:
+        linked_list.extend(i for i in range(5, 8))
+        assert list(linked_list) == [0, 1, 2, 3, 4, 5, 6, 7]
+        assert list(reversed(linked_list)) == [7, 6, 5, 4, 3, 2, 1, 0]
+        assert len(linked_list) == 8
+        linked_list.extend([])
+        assert len(linked_list) == 8
+
+    def test_extend_checks_types_before_linking(self, linked_list: ILinkedList[int]) -> None:
+        with pytest.raises(TypeError):
+            linked_list.extend([5, 'six'])
+        assert list(linked_list) == [0, 1, 2, 3, 4]
+        with pytest.raises(TypeError):
+            LinkedList.from_sequence([1, 'two'], data_type=int)
+
+    def test_extend_empty(self, empty: ILinkedList[int]) -> None:
+        empty.extend([1, 2])
+        assert (empty.front, empty.back) == (1, 2)
+
+    @pytest.mark.parametrize('position', [0, 1, 2, 3, 4])
+    def test_split_at(self, linked_list: ILinkedList[int], position: int) -> None:
+        node = linked_list.head
+        for _ in range(position):
+            node = node.next
+        rest = linked_list.split_at(node)
+        assert list(linked_list) == list(range(position))
+        assert list(rest) == list(range(position, 5))
+        assert len(linked_list) == position
+        assert len(rest) == 5 - position
+        assert list(reversed(rest)) == list(range(4, position - 1, -1))
+        linked_list.splice(rest)
+        assert list(linked_list) == [0, 1, 2, 3, 4]
+        assert len(linked_list) == 5
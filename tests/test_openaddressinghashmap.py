@@ -0,0 +1,98 @@
+from datastructures.hashmap import HashMap
+from datastructures.openaddressinghashmap import OpenAddressingHashMap
+import pytest
+
+class TestOpenAddressingHashMap:
+
+    @pytest.fixture(params=["linear", "robin_hood"])
+    def empty_hashmap(self, request) -> HashMap[int, str]:
+        return HashMap[int, str](storage="open_addressing", probing=request.param)
+
+    @pytest.fixture
+    def populated_hashmap(self, empty_hashmap: HashMap[int, str]) -> HashMap[int, str]:
+        for i in range(10):
+            empty_hashmap[i] = str(i)
+        return empty_hashmap
+
+    def test_storage_option_selects_engine(self):
+        assert isinstance(HashMap(storage="open_addressing"), OpenAddressingHashMap)
+        assert not isinstance(HashMap(), OpenAddressingHashMap)
+        with pytest.raises(ValueError):
+            HashMap(storage="btree")
+        with pytest.raises(ValueError):
+            HashMap(storage="open_addressing", probing="quadratic")
+        with pytest.raises(ValueError, match="incremental_resize"):
+            HashMap(storage="open_addressing", incremental_resize=True)
+        with pytest.raises(ValueError, match="migration_batch"):
+            HashMap(storage="open_addressing", migration_batch=8)
+        with pytest.raises(ValueError, match="probing"):
+            HashMap(probing="robin_hood")
+
+    def test_set_and_get_item(self, empty_hashmap: HashMap[int, str]):
+        empty_hashmap[1] = "one"
+        assert empty_hashmap[1] == "one"
+        with pytest.raises(KeyError):
+            _ = empty_hashmap[99]
+
+    def test_update_existing_key(self, populated_hashmap: HashMap[int, str]):
+        populated_hashmap[5] = "updated"
+        assert populated_hashmap[5] == "updated"
+        assert len(populated_hashmap) == 10
+
+    def test_delete_item(self, populated_hashmap: HashMap[int, str]):
+        del populated_hashmap[5]
+        assert 5 not in populated_hashmap
+        assert len(populated_hashmap) == 9
+        with pytest.raises(KeyError):
+            del populated_hashmap[5]
+
+    def test_colliding_keys_survive_deletes(self, empty_hashmap: HashMap[int, str]):
+        colliding = HashMap[int, str](custom_hash_function=lambda key: 0, storage="open_addressing",
+                                      probing="robin_hood" if empty_hashmap._robin_hood else "linear")
+        for i in range(5):
+            colliding[i] = str(i)
+        del colliding[1]
+        del colliding[3]
+        assert [colliding[i] for i in (0, 2, 4)] == ["0", "2", "4"]
+        colliding[1] = "again"
+        assert colliding[1] == "again"
+        assert sorted(colliding) == [0, 1, 2, 4]
+
+    def test_resize_and_churn(self, empty_hashmap: HashMap[int, str]):
+        for i in range(1000):
+            empty_hashmap[i] = str(i)
+        for i in range(0, 1000, 2):
+            del empty_hashmap[i]
+        for i in range(1000, 1500):
+            empty_hashmap[i] = str(i)
+        assert len(empty_hashmap) == 1000
+        assert all(empty_hashmap[i] == str(i) for i in range(1, 1500, 2))
+        assert sorted(empty_hashmap.keys()) == list(range(1, 1000, 2)) + list(range(1000, 1500))
+
+    def test_equal_to_chaining_map(self, populated_hashmap: HashMap[int, str]):
+        chaining = HashMap[int, str]()
+        for i in range(10):
+            chaining[i] = str(i)
+        assert populated_hashmap == chaining
+        assert chaining == populated_hashmap
+
+    def test_equality_counters(self):
+        hashmap = HashMap[str, int](custom_hash_function=lambda key: 0 if key < "m" else 1, storage="open_addressing")
+        for word in ("apple", "banana", "cherry", "zebra"):
+            hashmap[word] = len(word)
+        before_checks = hashmap.equality_checks
+        before_avoided = hashmap.equality_checks_avoided
+        assert hashmap["".join(["zeb", "ra"])] == 5
+        assert hashmap.equality_checks - before_checks == 1
+        assert hashmap.equality_checks_avoided - before_avoided == 0
+
+    def test_stats(self, populated_hashmap: HashMap[int, str]):
+        populated_hashmap.enable_sampling(every=1)
+        assert populated_hashmap[3] == "3"
+        stats = populated_hashmap.stats()
+        assert stats.entry_count == 10
+        assert stats.bucket_count == 16
+        assert sum(stats.probe_length_histogram.values()) == 10
+        assert stats.max_probe_length >= 1
+        assert stats.resize_count == 1
+        assert stats.get_samples == 1
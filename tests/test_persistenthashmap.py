@@ -0,0 +1,97 @@
+import gc
+import os
+
+from datastructures.hashmap import HashMap
+from datastructures.persistenthashmap import PersistentHashMap
+import pytest
+
+class TestPersistentHashMap:
+
+    @pytest.fixture
+    def path(self, tmp_path) -> str:
+        return str(tmp_path / 'table')
+
+    @pytest.fixture
+    def persistent_map(self, path: str) -> PersistentHashMap[str, int]:
+        hashmap = PersistentHashMap[str, int](path, initial_capacity=16)
+        yield hashmap
+        if not hashmap._data.closed:
+            hashmap.close()
+
+    def test_set_get_delete(self, persistent_map: PersistentHashMap[str, int]):
+        persistent_map['one'] = 1
+        persistent_map['two'] = 2
+        persistent_map['one'] = 11
+        assert persistent_map['one'] == 11
+        assert 'two' in persistent_map
+        del persistent_map['two']
+        assert 'two' not in persistent_map
+        assert len(persistent_map) == 1
+        with pytest.raises(KeyError):
+            _ = persistent_map['two']
+        with pytest.raises(KeyError):
+            del persistent_map['two']
+
+    def test_grows_past_initial_capacity(self, persistent_map: PersistentHashMap[str, int]):
+        for i in range(500):
+            persistent_map[str(i)] = i
+        assert len(persistent_map) == 500
+        assert all(persistent_map[str(i)] == i for i in range(500))
+        assert sorted(persistent_map.values()) == list(range(500))
+
+    def test_reopen_after_close(self, path: str):
+        with PersistentHashMap[str, list](path) as hashmap:
+            hashmap['a'] = [1, 2]
+            hashmap['b'] = [3]
+            del hashmap['b']
+        with PersistentHashMap[str, list](path) as reopened:
+            assert dict(reopened.items()) == {'a': [1, 2]}
+
+    def test_hashes_match_hashmap_default(self):
+        for key in ['key', 42, (1, 'a')]:
+            assert PersistentHashMap._hash(key) == HashMap._default_hash_function(key) & ((1 << 64) - 1)
+
+    def test_unflushed_writes_recovered_by_replay(self, path: str):
+        hashmap = PersistentHashMap[str, int](path)
+        hashmap['kept'] = 1
+        hashmap.flush()
+        hashmap['late'] = 2
+        del hashmap['kept']
+        # Simulate a crash: the log reaches the OS but the index is never flushed clean.
+        hashmap._data.flush()
+        del hashmap
+        gc.collect()
+        with open(path + '.dat', 'ab') as data_file:
+            data_file.write(b'\x05\x00\x00')
+        with PersistentHashMap[str, int](path) as recovered:
+            assert dict(recovered.items()) == {'late': 2}
+        assert not open(path + '.dat', 'rb').read().endswith(b'\x05\x00\x00')
+
+    def test_compact_drops_stale_records(self, path: str, persistent_map: PersistentHashMap[str, int]):
+        for round_ in range(5):
+            for i in range(100):
+                persistent_map[str(i)] = i * round_
+        for i in range(50):
+            del persistent_map[str(i)]
+        size_before = os.path.getsize(path + '.dat')
+        persistent_map.compact()
+        assert os.path.getsize(path + '.dat') < size_before / 5
+        assert dict(persistent_map.items()) == {str(i): i * 4 for i in range(50, 100)}
+        persistent_map.close()
+        with PersistentHashMap[str, int](path) as reopened:
+            assert len(reopened) == 50
+            assert reopened['99'] == 396
+
+    def test_equal_to_hashmap(self, persistent_map: PersistentHashMap[str, int]):
+        hashmap = HashMap[str, int]()
+        for i in range(20):
+            persistent_map[str(i)] = i
+            hashmap[str(i)] = i
+        assert persistent_map == hashmap
+        assert hashmap == persistent_map
+
+    def test_rejects_foreign_data_file(self, path: str):
+        with open(path + '.dat', 'wb') as data_file:
+            data_file.write(b'not a table')
+        with pytest.raises(ValueError):
+            PersistentHashMap(path)
@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+from datastructures.array import Array
+from datastructures.sortedarray import SortedArray
+
+from tests.car import Car, Color, Make, Model
+
+class TestSortedArray:
+    car1 = Car('123', Color.RED, Make.TOYOTA, Model.CAMRY)
+    car2 = Car('456', Color.BLUE, Make.TOYOTA, Model.CIVIC)
+    car3 = Car('789', Color.BLACK, Make.FORD, Model.FUSION)
+
+    @pytest.fixture
+    def numbers(self) -> SortedArray[int]:
+        return SortedArray([5, 1, 4, 1, 3], int)
+
+    @pytest.fixture
+    def cars(self) -> SortedArray[Car]:
+        return SortedArray([self.car3, self.car1, self.car2], Car, copy='none', key=lambda car: car.vin)
+
+    def test_constructing_should_sort_the_items(self, numbers: SortedArray[int]):
+        assert list(numbers) == [1, 1, 3, 4, 5]
+        assert isinstance(numbers, Array)
+
+    def test_append_and_append_front_should_insert_in_order(self, numbers: SortedArray[int]):
+        numbers.append(2)
+        numbers.append_front(6)
+        numbers.append(0)
+        assert list(numbers) == [0, 1, 1, 2, 3, 4, 5, 6]
+
+    def test_contains_should_find_items_by_binary_search(self, numbers: SortedArray[int]):
+        assert 3 in numbers
+        assert 2 not in numbers
+        assert 6 not in numbers
+        assert 'three' not in numbers
+
+    def test_index_should_return_the_first_position_of_the_item(self, numbers: SortedArray[int]):
+        assert numbers.index(1) == 0
+        assert numbers.index(1, 1) == 1
+        assert numbers.index(5) == 4
+        with pytest.raises(ValueError):
+            numbers.index(2)
+        with pytest.raises(ValueError):
+            numbers.index(1, 2)
+
+    def test_count_should_count_equal_items(self, numbers: SortedArray[int]):
+        assert numbers.count(1) == 2
+        assert numbers.count(2) == 0
+
+    def test_setitem_should_raise_type_error(self, numbers: SortedArray[int]):
+        with pytest.raises(TypeError):
+            numbers[0] = 10
+
+    def test_slice_should_be_a_copy(self, numbers: SortedArray[int]):
+        window = numbers[0:2]
+        window[0] = 10
+        assert list(numbers) == sorted(numbers)
+        assert numbers[0] != 10
+
+    def test_key_should_order_and_search_by_key(self, cars: SortedArray[Car]):
+        assert [car.vin for car in cars] == ['123', '456', '789']
+        assert self.car2 in cars
+        assert cars.index(self.car3) == 2
+        other = Car('456', Color.RED, Make.FORD, Model.FUSION)
+        cars.append(other)
+        assert cars.index(other) == 2
+        assert cars.count(other) == 1
+
+    def test_sort_with_a_new_key_should_reorder_and_keep_it(self, cars: SortedArray[Car]):
+        cars.sort(key=lambda car: car.color.value)
+        colors = [car.color.value for car in cars]
+        assert colors == sorted(colors)
+        cars.append(Car('000', Color.BLUE, Make.TOYOTA, Model.CIVIC))
+        colors = [car.color.value for car in cars]
+        assert colors == sorted(colors)
+
+    def test_operations_returning_new_arrays_should_return_plain_arrays(self, numbers: SortedArray[int]):
+        assert type(numbers * -1) is Array
+        assert type(numbers.filter(lambda items: items > 1)) is Array
+
+    def test_a_numpy_backed_sorted_array_should_search_large_data(self):
+        evens = SortedArray(np.arange(0, 20000, 2)[::-1], int)
+        assert 9998 in evens
+        assert 9999 not in evens
+        assert evens.index(10000) == 5000
+
+    def test_insert_sorted_should_use_the_arrays_key(self):
+        pairs = SortedArray([(1, 'a'), (3, 'c')], key=lambda pair: -pair[0])
+        assert pairs.insert_sorted((2, 'b')) == 1
+        assert list(pairs) == [(3, 'c'), (2, 'b'), (1, 'a')]
+        with pytest.raises(ValueError):
+            pairs.insert_sorted((0, 'z'), key=lambda pair: pair[0])
+
+    def test_sort_should_reject_reverse(self, numbers: SortedArray[int]):
+        with pytest.raises(ValueError):
+            numbers.sort(reverse=True)
+        numbers.sort(key=lambda number: -number)
+        assert list(numbers) == [5, 4, 3, 1, 1]
+
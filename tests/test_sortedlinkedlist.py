@@ -0,0 +1,91 @@
+import random
+
+import pytest
+
+from datastructures.linkedlist import LinkedList
+from datastructures.sortedlinkedlist import SortedLinkedList
+
+class TestLinkedListSort:
+
+    @pytest.mark.parametrize('count', [0, 1, 2, 3, 7, 64, 101])
+    def test_sort_matches_sorted(self, count: int) -> None:
+        rng = random.Random(count)
+        items = [rng.randrange(20) for _ in range(count)]
+        linked_list = LinkedList.from_sequence(items)
+        linked_list.sort()
+        assert list(linked_list) == sorted(items)
+        assert list(reversed(linked_list)) == sorted(items)[::-1]
+        assert len(linked_list) == count
+
+    def test_sort_orders_shuffled_items_with_duplicates(self) -> None:
+        items = [5, 3, 9, 3, 0, 7, 5, 1, 9, 2, 8, 0, 6, 4, 5]
+        linked_list = LinkedList.from_sequence(items)
+        linked_list.sort()
+        assert list(linked_list) == [0, 0, 1, 2, 3, 3, 4, 5, 5, 5, 6, 7, 8, 9, 9]
+        assert list(reversed(linked_list)) == [9, 9, 8, 7, 6, 5, 5, 5, 4, 3, 3, 2, 1, 0, 0]
+        linked_list.sort(reverse=True)
+        assert list(linked_list) == sorted(items, reverse=True)
+
+    def test_sort_is_stable_with_key_and_reverse(self) -> None:
+        items = [(i % 4, i) for i in range(40)]
+        linked_list = LinkedList.from_sequence(items)
+        linked_list.sort(key=lambda pair: pair[0], reverse=True)
+        assert list(linked_list) == sorted(items, key=lambda pair: pair[0], reverse=True)
+
+    def test_sort_keeps_node_handles(self) -> None:
+        linked_list = LinkedList[int]()
+        handles = {item: linked_list.append(item) for item in (3, 1, 2)}
+        linked_list.sort()
+        assert linked_list.head is handles[1]
+        assert linked_list.tail is handles[3]
+        linked_list.remove_node(handles[2])
+        assert list(linked_list) == [1, 3]
+
+class TestSortedLinkedList:
+
+    @pytest.fixture
+    def sorted_list(self) -> SortedLinkedList[int]:
+        return SortedLinkedList[int].from_sequence([5, 1, 9, 3], data_type=int)
+
+    def test_from_sequence_sorts(self, sorted_list: SortedLinkedList[int]) -> None:
+        assert list(sorted_list) == [1, 3, 5, 9]
+
+    def test_insert_sorted(self, sorted_list: SortedLinkedList[int]) -> None:
+        sorted_list.insert_sorted(4)
+        sorted_list.append(0)
+        sorted_list.prepend(10)
+        assert list(sorted_list) == [0, 1, 3, 4, 5, 9, 10]
+        assert sorted_list.tail.data == 10
+        with pytest.raises(TypeError):
+            sorted_list.insert_sorted('x')
+
+    def test_insert_sorted_is_stable(self) -> None:
+        sorted_list = SortedLinkedList(key=lambda pair: pair[0])
+        for pair in [(1, 'a'), (0, 'b'), (1, 'c'), (0, 'd')]:
+            sorted_list.insert_sorted(pair)
+        assert list(sorted_list) == [(0, 'b'), (0, 'd'), (1, 'a'), (1, 'c')]
+
+    def test_merge_consumes_others(self, sorted_list: SortedLinkedList[int]) -> None:
+        first = SortedLinkedList.from_sequence([2, 9, 11], data_type=int)
+        second = LinkedList.from_sequence([0, 6], data_type=int)
+        sorted_list.merge(first, second)
+        assert list(sorted_list) == [0, 1, 2, 3, 5, 6, 9, 9, 11]
+        assert list(reversed(sorted_list)) == [11, 9, 9, 6, 5, 3, 2, 1, 0]
+        assert len(sorted_list) == 9
+        assert first.empty and second.empty
+
+    def test_merge_descending_is_stable(self) -> None:
+        mine = SortedLinkedList(key=lambda pair: pair[0], reverse=True)
+        mine.extend([(2, 'mine'), (1, 'mine')])
+        theirs = SortedLinkedList(key=lambda pair: pair[0], reverse=True)
+        theirs.extend([(2, 'theirs'), (0, 'theirs')])
+        mine.merge(theirs)
+        assert list(mine) == [(2, 'mine'), (2, 'theirs'), (1, 'mine'), (0, 'theirs')]
+
+    def test_positional_inserts_are_rejected(self, sorted_list: SortedLinkedList[int]) -> None:
+        with pytest.raises(TypeError):
+            sorted_list.insert_after(1, 2)
+        with pytest.raises(TypeError):
+            sorted_list.move_to_front(sorted_list.tail)
+        with pytest.raises(TypeError):
+            sorted_list.prepend_node(sorted_list.Node(data=0))
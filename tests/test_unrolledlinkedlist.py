@@ -0,0 +1,161 @@
+import random
+
+import pytest
+
+from datastructures.ilinkedlist import ILinkedList
+from datastructures.linkedlist import LinkedList
+from datastructures.unrolledlinkedlist import UnrolledLinkedList
+
+def chunk_sizes(unrolled_list: UnrolledLinkedList) -> list[int]:
+    sizes = []
+    current = unrolled_list.head
+    while current:
+        sizes.append(len(current.items))
+        current = current.next
+    return sizes
+
+class TestUnrolledLinkedList:
+
+    @pytest.fixture
+    def empty(self) -> UnrolledLinkedList[int]:
+        return UnrolledLinkedList[int](data_type=int, chunk_capacity=4)
+
+    @pytest.fixture
+    def linked_list(self) -> UnrolledLinkedList[int]:
+        return UnrolledLinkedList[int].from_sequence(range(10), data_type=int, chunk_capacity=4)
+
+    def test_from_sequence_chunks(self, linked_list: UnrolledLinkedList[int]) -> None:
+        assert chunk_sizes(linked_list) == [4, 4, 2]
+        assert list(linked_list) == list(range(10))
+        assert len(linked_list) == 10
+
+    def test_append_prepend(self, empty: UnrolledLinkedList[int]) -> None:
+        for i in range(6):
+            empty.append(i)
+            empty.prepend(-i - 1)
+        assert list(empty) == list(range(-6, 6))
+        assert empty.front == -6
+        assert empty.back == 5
+        assert all(size <= 4 for size in chunk_sizes(empty))
+
+    def test_prepend_keeps_chunks_half_full(self, empty: UnrolledLinkedList[int]) -> None:
+        for i in range(9):
+            empty.prepend(i)
+        assert list(empty) == list(range(8, -1, -1))
+        assert all(2 <= size <= 4 for size in chunk_sizes(empty)[:-1])
+
+    def test_random_operations_keep_chunks_half_full(self) -> None:
+        rng = random.Random(13)
+        unrolled_list = UnrolledLinkedList[int](data_type=int, chunk_capacity=6)
+        expected: list[int] = []
+        for step in range(2000):
+            # Inserts outweigh removals so the list grows to many chunks, and most items are 0, so
+            # remove_all(0) empties whole runs of chunks at once.
+            operation = rng.choices(range(8), weights=(3, 3, 3, 3, 1, 1, 1, 1))[0]
+            item = 0 if rng.randrange(4) else step
+            if operation == 0:
+                unrolled_list.append(item)
+                expected.append(item)
+            elif operation == 1:
+                unrolled_list.prepend(item)
+                expected.insert(0, item)
+            elif expected and operation == 2:
+                target = rng.choice(expected)
+                unrolled_list.insert_before(target, item)
+                expected.insert(expected.index(target), item)
+            elif expected and operation == 3:
+                target = rng.choice(expected)
+                unrolled_list.insert_after(target, item)
+                expected.insert(expected.index(target) + 1, item)
+            elif expected and operation == 4:
+                target = rng.choice(expected)
+                unrolled_list.remove(target)
+                expected.remove(target)
+            elif expected and operation == 5:
+                assert unrolled_list.pop() == expected.pop()
+            elif expected and operation == 6:
+                assert unrolled_list.pop_front() == expected.pop(0)
+            elif expected:
+                target = rng.choice(expected)
+                unrolled_list.remove_all(target)
+                expected = [existing for existing in expected if existing != target]
+            sizes = chunk_sizes(unrolled_list)
+            assert all(3 <= size <= 6 for size in sizes[:-1])
+            assert sum(sizes) == len(unrolled_list) == len(expected)
+        assert list(unrolled_list) == expected
+
+    def test_insert_splits_full_chunk(self, linked_list: UnrolledLinkedList[int]) -> None:
+        linked_list.insert_after(1, 99)
+        linked_list.insert_before(0, -1)
+        assert list(linked_list) == [-1, 0, 1, 99, 2, 3, 4, 5, 6, 7, 8, 9]
+        assert all(size <= 4 for size in chunk_sizes(linked_list))
+        with pytest.raises(ValueError):
+            linked_list.insert_after(100, 1)
+
+    def test_remove_merges_chunks(self, linked_list: UnrolledLinkedList[int]) -> None:
+        for item in (1, 2, 3, 5):
+            linked_list.remove(item)
+        assert list(linked_list) == [0, 4, 6, 7, 8, 9]
+        assert all(size >= 2 for size in chunk_sizes(linked_list)[:-1])
+        with pytest.raises(ValueError):
+            linked_list.remove(100)
+
+    def test_remove_all_keeps_chunks_half_full(self) -> None:
+        unrolled_list = UnrolledLinkedList.from_sequence([0, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2], chunk_capacity=8)
+        unrolled_list.remove_all(1)
+        assert list(unrolled_list) == [0, 0, 2, 2, 2, 2, 2, 2]
+        assert chunk_sizes(unrolled_list) == [8]
+
+    def test_remove_all(self, linked_list: UnrolledLinkedList[int]) -> None:
+        for i in range(10):
+            linked_list.append(i % 2)
+        linked_list.remove_all(1)
+        assert 1 not in linked_list
+        assert list(linked_list) == [0, 2, 3, 4, 5, 6, 7, 8, 9] + [0] * 5
+        assert len(linked_list) == 14
+        assert all(size >= 2 for size in chunk_sizes(linked_list)[:-1])
+
+    def test_pop_both_ends(self, linked_list: UnrolledLinkedList[int]) -> None:
+        assert [linked_list.pop() for _ in range(3)] == [9, 8, 7]
+        assert [linked_list.pop_front() for _ in range(3)] == [0, 1, 2]
+        assert list(linked_list) == [3, 4, 5, 6]
+        while not linked_list.empty:
+            linked_list.pop()
+        assert linked_list.head is None and linked_list.tail is None
+        with pytest.raises(IndexError):
+            linked_list.pop_front()
+
+    def test_reversed_and_next(self, linked_list: UnrolledLinkedList[int]) -> None:
+        assert list(reversed(linked_list)) == list(range(9, -1, -1))
+        assert [next(linked_list) for _ in range(10)] == list(range(10))
+        with pytest.raises(StopIteration):
+            next(linked_list)
+
+    def test_eq_with_linked_list(self, linked_list: UnrolledLinkedList[int]) -> None:
+        assert linked_list == LinkedList[int].from_sequence(list(range(10)), data_type=int)
+        assert linked_list == UnrolledLinkedList.from_sequence(range(10), data_type=int)
+        assert linked_list != UnrolledLinkedList.from_sequence(range(9), data_type=int)
+
+    def test_eq_is_symmetric(self, linked_list: UnrolledLinkedList[int]) -> None:
+        plain = LinkedList[int].from_sequence(list(range(10)), data_type=int)
+        assert plain == linked_list
+        assert linked_list == reversed(reversed(plain))
+        assert reversed(reversed(plain)) == linked_list
+        assert linked_list == list(range(10))
+        assert linked_list != tuple(range(9))
+
+    def test_type_checks(self, linked_list: ILinkedList[int]) -> None:
+        with pytest.raises(TypeError):
+            linked_list.append('string')
+        with pytest.raises(TypeError):
+            linked_list.insert_before(1, 'string')
+        with pytest.raises(TypeError):
+            UnrolledLinkedList.from_sequence([1, 'a'], data_type=int)
+        with pytest.raises(ValueError):
+            UnrolledLinkedList(chunk_capacity=1)
+
+    def test_str_and_clear(self, linked_list: UnrolledLinkedList[int]) -> None:
+        assert str(linked_list) == str(list(range(10)))
+        linked_list.clear()
+        assert linked_list.empty
+        assert str(linked_list) == '[]'
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from datastructures.array import Array
+from datastructures.deque import Deque
+from datastructures.linkedlist import LinkedList
+from datastructures.liststack import ListStack
+from datastructures.validation import ValidationMode, get_default_validation, make_validator, set_default_validation
+
+class TestValidation:
+
+    @pytest.fixture(autouse=True)
+    def restore_default(self):
+        default = get_default_validation()
+        yield
+        set_default_validation(default)
+
+    def test_strict_checks_every_item(self):
+        validate = make_validator(int, ValidationMode.STRICT)
+        validate(1)
+        with pytest.raises(TypeError):
+            validate('one')
+
+    def test_off_and_object_need_no_validator(self):
+        assert make_validator(int, 'off') is None
+        assert make_validator(object, 'strict') is None
+
+    def test_debug_follows_assertions(self):
+        assert (make_validator(int, 'debug') is None) == (not __debug__)
+
+    def test_sampled_checks_first_and_every_nth(self):
+        validate = make_validator(int, 'sampled', sample_every=3)
+        with pytest.raises(TypeError):
+            validate('first')
+        validate('skipped')
+        validate('skipped')
+        with pytest.raises(TypeError):
+            validate('third')
+        with pytest.raises(ValueError):
+            make_validator(int, 'sampled', sample_every=0)
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            make_validator(int, 'sometimes')
+
+    def test_global_default_applies_at_construction(self):
+        set_default_validation('off')
+        unchecked = LinkedList(int)
+        checked = LinkedList(int, validation='strict')
+        set_default_validation(ValidationMode.STRICT)
+        unchecked.append('string')
+        with pytest.raises(TypeError):
+            checked.append('string')
+        with pytest.raises(TypeError):
+            LinkedList(int).append('string')
+
+    def test_wrappers_pass_mode_through(self):
+        Deque(int, validation='off').enqueue('string')
+        ListStack(int, validation='off').push('string')
+        with pytest.raises(TypeError):
+            Deque(int).enqueue('string')
+        with pytest.raises(TypeError):
+            ListStack(int).push('string')
+
+    def test_array_accepts_matching_numpy_scalars(self):
+        array = Array([1, 2], data_type=int)
+        array.append(np.int64(3))
+        array[0] = np.int32(0)
+        Array([1.0], data_type=float).append(2)
+        Array([1], data_type=np.int16).append(5)
+        with pytest.raises(TypeError):
+            array.append('four')
+        with pytest.raises(TypeError):
+            Array([1, 'two'], data_type=int)